@@ -0,0 +1,26 @@
+# python -m benchmarks.integer_engine (app 디렉터리에서 실행)
+import time
+
+from src.components.integer_engine import integer_amount_columns
+from src.components.schedule_engine import QUOTE_METHODS, cached_amount_columns
+
+
+def benchmark(repeat: int = 200) -> dict:
+    # 상환 방식별 초당 계산 회차 수 (float 엔진 vs 정수 엔진, 캐시 미사용)
+    results = {}
+    for num_payments, cycle_days in [(26, 14), (52, 7), (1200, 7)]:
+        for method in QUOTE_METHODS:
+            timings = {}
+            for name, builder in [('float', cached_amount_columns.__wrapped__), ('integer', integer_amount_columns)]:
+                started = time.perf_counter()
+                for i in range(repeat):
+                    builder(method, 1_000_000 + i * 100, num_payments, cycle_days, 0.28)
+                elapsed = time.perf_counter() - started
+                timings[name] = round(repeat * num_payments / elapsed)
+            results[(method, num_payments, cycle_days)] = timings
+    return results
+
+
+if __name__ == '__main__':
+    for (method, num_payments, cycle_days), timings in benchmark().items():
+        print(f"{method:16s} n={num_payments:<5d} cycle={cycle_days:<3d} rows/s float={timings['float']:,} integer={timings['integer']:,}")
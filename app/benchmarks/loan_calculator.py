@@ -0,0 +1,225 @@
+# python -m benchmarks.loan_calculator (app 디렉터리에서 실행)
+# 기준값 파일이 없으면 --update-baseline 으로 먼저 만들어야 함
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+import numpy as np
+
+from src.components import loan_calculator_backup
+from src.components.loan_calculator import LoanCalculator, batch_schedule
+from src.components.schedule_engine import cached_amount_columns
+
+# 현장에서 사용하는 상품 조건
+METHODS = ['equal', 'equal_principal', 'bullet']
+TERMS = [4, 13, 26, 52, 1200]
+CYCLES = [7, 14, 28, 30]
+BATCH_SIZES = [1_000, 10_000, 100_000]
+# 대량 계산은 실제 포트폴리오처럼 1200회차를 제외한 상품을 섞어서 측정
+BATCH_TERMS = [4, 13, 26, 52]
+
+START_DATE = date(2024, 1, 1)
+ANNUAL_INTEREST_RATE = 0.28
+BASE_PRINCIPAL = 1_000_000
+
+# 실행 위치와 관계없이 이 모듈 옆의 기준값 파일 사용
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'loan_calculator_baseline.json')
+DEFAULT_THRESHOLD = 0.25
+# 기준값 대비 비교 항목: 처리량은 낮아지면, 지연 시간과 메모리는 높아지면 회귀
+HIGHER_IS_BETTER = ['rows_per_sec']
+LOWER_IS_BETTER = ['p95_ms', 'p99_ms', 'peak_memory_bytes']
+
+LEGACY_METHODS = {
+    'equal': 'equal_payment',
+    'equal_principal': 'equal_principal_payment',
+    'bullet': 'bullet_payment',
+}
+
+
+def _percentiles(latencies: list) -> dict:
+    values = np.asarray(latencies) * 1000
+    return {
+        'p50_ms': round(float(np.percentile(values, 50)), 4),
+        'p95_ms': round(float(np.percentile(values, 95)), 4),
+        'p99_ms': round(float(np.percentile(values, 99)), 4),
+    }
+
+
+def _peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _repeat_for(num_payments: int) -> int:
+    # 회차 수가 많을수록 반복 횟수를 줄여 측정 시간을 비슷하게 유지
+    return max(20, 4000 // num_payments)
+
+
+def bench_single(method: str, num_payments: int, cycle_days: int) -> dict:
+    repeat = _repeat_for(num_payments)
+    latencies = []
+    cached_amount_columns.cache_clear()
+    for i in range(repeat):
+        # 매번 다른 원금을 사용하여 스케줄 캐시를 거치지 않은 엔진 성능을 측정
+        calculator = LoanCalculator(START_DATE, BASE_PRINCIPAL + i * 100, num_payments, cycle_days, ANNUAL_INTEREST_RATE)
+        started = time.perf_counter()
+        calculator.schedule(method)
+        latencies.append(time.perf_counter() - started)
+
+    peak = _peak_memory(
+        lambda: LoanCalculator(START_DATE, BASE_PRINCIPAL - 100, num_payments, cycle_days, ANNUAL_INTEREST_RATE).schedule(method)
+    )
+    return {
+        'rows_per_sec': round(repeat * num_payments / sum(latencies)),
+        **_percentiles(latencies),
+        'peak_memory_bytes': peak,
+    }
+
+
+def _batch_inputs(size: int) -> tuple:
+    index = np.arange(size)
+    principal = BASE_PRINCIPAL + (index % 1000) * 10_000
+    num_payments = np.asarray(BATCH_TERMS)[index % len(BATCH_TERMS)]
+    cycle_days = np.asarray(CYCLES)[index % len(CYCLES)]
+    method = np.asarray(METHODS)[index % len(METHODS)]
+    return principal, num_payments, cycle_days, ANNUAL_INTEREST_RATE, START_DATE, method
+
+
+def bench_batch(size: int, repeat: int = 3) -> dict:
+    inputs = _batch_inputs(size)
+    rows = int(inputs[1].sum())
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        batch_schedule(*inputs)
+        latencies.append(time.perf_counter() - started)
+
+    return {
+        'loans_per_sec': round(size / min(latencies)),
+        'rows_per_sec': round(rows / min(latencies)),
+        **_percentiles(latencies),
+        'peak_memory_bytes': _peak_memory(lambda: batch_schedule(*inputs)),
+    }
+
+
+def compare_legacy(method: str, num_payments: int, cycle_days: int, repeat: int = 5) -> dict:
+    # loan_calculator_backup 의 이전 엔진과 속도 및 반올림 결과 비교
+    legacy_method = LEGACY_METHODS[method]
+    legacy_elapsed = 0.0
+    current_elapsed = 0.0
+    for i in range(repeat):
+        principal = BASE_PRINCIPAL + i * 100
+        # bench_single 에서 같은 원금으로 채워진 스케줄 캐시를 비워 캐시되지 않은 엔진끼리 비교
+        cached_amount_columns.cache_clear()
+
+        started = time.perf_counter()
+        legacy = getattr(loan_calculator_backup.LoanCalculator(START_DATE, principal, num_payments, cycle_days, ANNUAL_INTEREST_RATE), legacy_method)()
+        legacy_elapsed += time.perf_counter() - started
+
+        started = time.perf_counter()
+        current = LoanCalculator(START_DATE, principal, num_payments, cycle_days, ANNUAL_INTEREST_RATE).schedule(method)
+        current_elapsed += time.perf_counter() - started
+
+    differences = {}
+    for column in ['Principal', 'Interest', 'Total', 'Remaining Balance']:
+        delta = np.abs(current[column] - legacy[column].to_numpy(dtype=np.float64))
+        differences[column] = {
+            'mismatched_rows': int(np.count_nonzero(delta)),
+            'max_difference': round(float(delta.max()), 2),
+        }
+
+    return {
+        'speedup': round(legacy_elapsed / current_elapsed, 2),
+        'differences': differences,
+    }
+
+
+def run(max_batch: int = BATCH_SIZES[-1]) -> dict:
+    results = {'single': {}, 'batch': {}, 'legacy': {}}
+
+    for method in METHODS:
+        for num_payments in TERMS:
+            for cycle_days in CYCLES:
+                key = f'{method}/{num_payments}/{cycle_days}'
+                results['single'][key] = bench_single(method, num_payments, cycle_days)
+
+    for size in BATCH_SIZES:
+        if size <= max_batch:
+            results['batch'][str(size)] = bench_batch(size)
+
+    for method in METHODS:
+        for num_payments in TERMS:
+            results['legacy'][f'{method}/{num_payments}/14'] = compare_legacy(method, num_payments, 14)
+
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list:
+    # 처리량이 기준값보다 threshold 비율 이상 떨어졌거나
+    # p95/p99 지연 시간, 최대 메모리가 threshold 비율 이상 늘어난 항목
+    regressions = []
+    for group in ['single', 'batch']:
+        for key, current in results.get(group, {}).items():
+            previous = baseline.get(group, {}).get(key)
+            if not previous:
+                continue
+            for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+                if metric not in previous or metric not in current:
+                    continue
+                if metric in HIGHER_IS_BETTER:
+                    regressed = current[metric] < previous[metric] * (1 - threshold)
+                else:
+                    regressed = current[metric] > previous[metric] * (1 + threshold)
+                if regressed:
+                    regressions.append(f"{group} {key}: {metric} {current[metric]:,} (baseline {previous[metric]:,})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='LoanCalculator benchmark')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--max-batch', type=int, default=BATCH_SIZES[-1])
+    args = parser.parse_args(argv)
+
+    results = run(args.max_batch)
+
+    for key, result in results['single'].items():
+        print(f"single {key:24s} {result['rows_per_sec']:>12,} rows/s  p50={result['p50_ms']}ms  p99={result['p99_ms']}ms")
+    for key, result in results['batch'].items():
+        print(f"batch  {key:24s} {result['loans_per_sec']:>12,} loans/s  peak={result['peak_memory_bytes']:,} bytes")
+    for key, result in results['legacy'].items():
+        mismatched = sum(column['mismatched_rows'] for column in result['differences'].values())
+        print(f"legacy {key:24s} speedup x{result['speedup']}  mismatched cells={mismatched}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        # 비교할 기준값이 없으면 통과로 처리하지 않음
+        print(f"Baseline not found: {args.baseline} (run with --update-baseline to create it)", file=sys.stderr)
+        return 2
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
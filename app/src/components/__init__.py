@@ -1,3 +1,12 @@
-from src.components.fire import initialize_firebase
+_firebase = None
 
-DB, storageBucket = initialize_firebase()
+
+def __getattr__(name):
+    # DB, storageBucket 은 처음 사용할 때 초기화 (계산 엔진만 사용할 때는 Firebase 를 불러오지 않음)
+    global _firebase
+    if name in ('DB', 'storageBucket'):
+        if _firebase is None:
+            from src.components.fire import initialize_firebase
+            _firebase = initialize_firebase()
+        return _firebase[0] if name == 'DB' else _firebase[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,126 @@
+import math
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+# algorithm/loan.ipynb 의 상환 주기: 연간 회차 수와 회차 간격(주)
+CYCLE_COUNTS = {'month': 12, '4week': 13, '2week': 26, 'week': 52}
+CYCLE_WEEKS = {'4week': 4, '2week': 2, 'week': 1}
+
+
+def _add_months(months: np.ndarray, start_day: int, days_in_month: np.ndarray) -> np.ndarray:
+    return months.astype('datetime64[D]') + (np.minimum(start_day, days_in_month) - 1)
+
+
+def _days_in_month(months: np.ndarray) -> np.ndarray:
+    return ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+
+
+def expire_date(start_date, expiration_months: int) -> np.datetime64:
+    # start_date + relativedelta(months=expiration_months) 와 동일 (월말이면 해당 월 마지막 날)
+    start = np.datetime64(start_date, 'D')
+    start_day = int((start - start.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64)) + 1
+    month = np.asarray([start.astype('datetime64[M]') + expiration_months])
+    return _add_months(month, start_day, _days_in_month(month))[0]
+
+
+def total_periods(start_date, expiration_months: int, cycle: str) -> int:
+    # 월 단위는 개월 수, 주 단위는 대출 기간(일) / 회차 간격을 올림
+    if cycle == 'month':
+        return int(expiration_months)
+    total_days = int((expire_date(start_date, expiration_months) - np.datetime64(start_date, 'D')).astype(np.int64))
+    return math.ceil(total_days / (CYCLE_WEEKS[cycle] * 7))
+
+
+def cycle_payment_dates(start_date, num_payments: int, cycle: str) -> np.ndarray:
+    # 상환일 (datetime64[D])
+    # 월 단위는 relativedelta(months=1) 을 매 회차 누적해서 더하므로 한 번 월말로 당겨진 날짜는 이후에도 유지됨
+    # (1/31 -> 2/29 -> 3/29 ...) 따라서 일자는 지난 달들의 말일 중 최솟값으로 제한
+    start = np.datetime64(start_date, 'D')
+    periods = np.arange(1, num_payments + 1, dtype=np.int64)
+    if cycle == 'month':
+        start_day = int((start - start.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64)) + 1
+        months = start.astype('datetime64[M]') + periods
+        sticky_days = np.minimum.accumulate(_days_in_month(months)) if num_payments else np.zeros(0, dtype=np.int64)
+        return _add_months(months, start_day, sticky_days)
+    return start + periods * (CYCLE_WEEKS[cycle] * 7)
+
+
+def _equal_payment(principal: int, num_payments: int, annual_interest_rate: float, cycle_count: int) -> dict:
+    rate = annual_interest_rate / cycle_count
+    growth = (1 + rate) ** num_payments
+    amount_per_period = round((principal * rate * growth) / (growth - 1))
+
+    # 이자가 직전 잔액에 의존하므로 이자 수열만 순차 계산 (노트북과 같은 연산 순서)
+    interest = np.empty(num_payments, dtype=np.int64)
+    balance = principal
+    for i in range(num_payments):
+        interest_payment = round(balance * annual_interest_rate / cycle_count)
+        interest[i] = interest_payment
+        balance -= amount_per_period - interest_payment
+
+    principal_col = amount_per_period - interest
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': np.full(num_payments, amount_per_period, dtype=np.int64),
+        'Remaining Balance': principal - np.cumsum(principal_col),
+    }
+
+
+def _equal_principal_payment(principal: int, num_payments: int, annual_interest_rate: float, cycle_count: int) -> dict:
+    rate = annual_interest_rate / cycle_count
+    principal_payment = round(principal / num_payments)
+    balance_before = principal - np.arange(num_payments, dtype=np.int64) * principal_payment
+    interest = np.round(balance_before * rate).astype(np.int64)
+    return {
+        'Principal': np.full(num_payments, principal_payment, dtype=np.int64),
+        'Interest': interest,
+        'Total': principal_payment + interest,
+        'Remaining Balance': balance_before - principal_payment,
+    }
+
+
+def _bullet_payment(principal: int, num_payments: int, annual_interest_rate: float, cycle_count: int) -> dict:
+    # 노트북과 같이 원금은 합계에서만 상환 (회차별 Principal 은 0)
+    interest_payment = round(principal * (annual_interest_rate / cycle_count))
+    return {
+        'Principal': np.zeros(num_payments, dtype=np.int64),
+        'Interest': np.full(num_payments, interest_payment, dtype=np.int64),
+        'Total': np.full(num_payments, interest_payment, dtype=np.int64),
+        'Remaining Balance': np.full(num_payments, principal, dtype=np.int64),
+    }
+
+
+_CYCLE_BUILDERS = {
+    'equal': _equal_payment,
+    'equal_principal': _equal_principal_payment,
+    'bullet': _bullet_payment,
+}
+
+
+@lru_cache(maxsize=256)
+def cached_cycle_amount_columns(method: str, principal: int, num_payments: int, annual_interest_rate: float, cycle: str):
+    columns = _CYCLE_BUILDERS[method](principal, num_payments, annual_interest_rate, CYCLE_COUNTS[cycle])
+    columns['Period'] = np.arange(1, num_payments + 1, dtype=np.int64)
+    for values in columns.values():
+        values.setflags(write=False)
+    return MappingProxyType(columns)
+
+
+def cycle_schedule_columns(method: str, start_date, principal: int, expiration_months: int,
+                           annual_interest_rate: float, cycle: str) -> dict:
+    # 'month' / '4week' / '2week' / 'week' 주기 상환 스케줄 (노트북 calculate_* 함수와 같은 결과)
+    if cycle not in CYCLE_COUNTS:
+        raise ValueError(f"Unknown repayment cycle: {cycle}")
+    num_payments = total_periods(start_date, expiration_months, cycle)
+    cached = cached_cycle_amount_columns(method, principal, num_payments, float(annual_interest_rate), cycle)
+    return {
+        'Period': cached['Period'],
+        'Payment Date': cycle_payment_dates(start_date, num_payments, cycle),
+        'Principal': cached['Principal'],
+        'Interest': cached['Interest'],
+        'Total': cached['Total'],
+        'Remaining Balance': cached['Remaining Balance'],
+    }
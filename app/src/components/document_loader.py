@@ -0,0 +1,48 @@
+GET_ALL_CHUNK_SIZE = 100
+
+
+class DocumentLoader:
+    # 반복문 안에서 문서를 하나씩 읽는 대신 필요한 문서 ID 를 모아 두었다가
+    # 중복을 제거하고 get_all 로 한 번에 읽음 (같은 ID 는 한 번만 읽음)
+    def __init__(self, db, collection: str, chunk_size: int = GET_ALL_CHUNK_SIZE):
+        self.db = db
+        self.collection = collection
+        self.chunk_size = chunk_size
+        self.pending = set()
+        self.loaded = {}
+        self.round_trips = 0
+
+    def request(self, doc_id):
+        if doc_id and doc_id not in self.loaded:
+            self.pending.add(doc_id)
+
+    def request_many(self, doc_ids):
+        for doc_id in doc_ids:
+            self.request(doc_id)
+
+    def load(self):
+        # 모아 둔 ID 를 chunk_size 개씩 get_all 로 읽음 (없는 문서는 None)
+        doc_ids = sorted(self.pending)
+        self.pending.clear()
+        collection = self.db.collection(self.collection)
+        for i in range(0, len(doc_ids), self.chunk_size):
+            refs = [collection.document(doc_id) for doc_id in doc_ids[i:i + self.chunk_size]]
+            for snapshot in self.db.get_all(refs):
+                self.loaded[snapshot.id] = snapshot.to_dict() if snapshot.exists else None
+            self.round_trips += 1
+
+    def get(self, doc_id) -> dict:
+        # 문서 dict (없으면 None), 아직 읽지 않은 ID 가 있으면 함께 읽음
+        if not doc_id:
+            return None
+        if doc_id not in self.loaded:
+            self.request(doc_id)
+            self.load()
+        return self.loaded.get(doc_id)
+
+    def load_many(self, doc_ids) -> dict:
+        # {문서 ID: 문서 dict 또는 None}
+        doc_ids = list(doc_ids)
+        self.request_many(doc_ids)
+        self.load()
+        return {doc_id: self.loaded.get(doc_id) for doc_id in doc_ids if doc_id}
@@ -0,0 +1,118 @@
+import sys
+from datetime import datetime
+
+from google.cloud.firestore_v1.base_query import FieldFilter
+
+# 회차별 상환 예정 색인 (문서 하나가 대출 하나의 회차 하나, 문서 ID 는 '{loan_id}_{회차}')
+# 상환일 범위 조회가 대출 전체가 아닌 기간 내 회차 수에만 비례하도록 Loan 스케줄을 복제해 둠
+DUE_COLLECTION = 'Due'
+# False 이면 기존처럼 Loan 전체를 읽어 상환일을 걸러냄
+# True 여도 backfill_due_index 가 끝나 표시 문서가 생기기 전까지는 Loan 전체를 읽음
+USE_DUE_INDEX = True
+BATCH_WRITE_LIMIT = 500
+# 전체 색인이 만들어졌음을 나타내는 표시 문서 (payment_date 가 없으므로 상환일 범위 조회에는 포함되지 않음)
+BACKFILL_MARKER_ID = '_backfill'
+
+
+def due_id(loan_id: str, period) -> str:
+    return f"{loan_id}_{int(period)}"
+
+
+def due_entry(loan_id: str, loan_data: dict, period: int, row: dict) -> dict:
+    return {
+        'loan_id': loan_id,
+        'uid': loan_data.get('uid', ''),
+        'loan_number': loan_data.get('loan_number', ''),
+        'period': int(period),
+        'payment_date': row.get('Payment Date', ''),
+        'principal': row.get('Principal', 0),
+        'interest': row.get('Interest', 0),
+        'total': row.get('Total', 0),
+        'status': row.get('status', 0),
+    }
+
+
+def due_entries(loan_id: str, loan_data: dict, loan_schedule: list) -> dict:
+    # {문서 ID: 색인 문서}
+    entries = {}
+    for i, row in enumerate(loan_schedule):
+        period = row.get('Period', i + 1)
+        entries[due_id(loan_id, period)] = due_entry(loan_id, loan_data, period, row)
+    return entries
+
+
+def schedule_row(entry: dict) -> dict:
+    # 색인 문서를 loan_schedule 항목 형식으로 변환
+    return {
+        'Period': entry['period'],
+        'Payment Date': entry['payment_date'],
+        'Principal': entry['principal'],
+        'Interest': entry['interest'],
+        'Total': entry['total'],
+        'status': entry['status'],
+    }
+
+
+def _commit(db, writes: list):
+    # (문서 ID, 색인 문서 또는 None(삭제)) 목록을 WriteBatch 로 나누어 기록
+    collection = db.collection(DUE_COLLECTION)
+    for i in range(0, len(writes), BATCH_WRITE_LIMIT):
+        batch = db.batch()
+        for doc_id, entry in writes[i:i + BATCH_WRITE_LIMIT]:
+            if entry is None:
+                batch.delete(collection.document(doc_id))
+            else:
+                batch.set(collection.document(doc_id), entry)
+        batch.commit()
+
+
+def write_due_index(db, loan_id: str, loan_data: dict, loan_schedule: list, previous_length: int = 0):
+    # 대출 등록/재등록 시 모든 회차의 색인을 다시 기록하고 줄어든 회차의 색인은 삭제
+    writes = list(due_entries(loan_id, loan_data, loan_schedule).items())
+    writes += [(due_id(loan_id, period), None) for period in range(len(loan_schedule) + 1, previous_length + 1)]
+    _commit(db, writes)
+
+
+def due_index_ready(db) -> bool:
+    # 색인 조회를 사용할 수 있는지 (USE_DUE_INDEX 가 켜져 있고 backfill 이 끝난 뒤 색인 기록이 실패한 적이 없음)
+    if not USE_DUE_INDEX:
+        return False
+    return db.collection(DUE_COLLECTION).document(BACKFILL_MARKER_ID).get().exists
+
+
+def mark_due_index_stale(db):
+    # 색인 기록이 실패하면 표시 문서를 지워 다음 backfill 까지 Loan 전체를 읽도록 함
+    db.collection(DUE_COLLECTION).document(BACKFILL_MARKER_ID).delete()
+
+
+def query_due(db, start_date: str, end_date: str) -> list:
+    # start_date <= 상환일 <= end_date 인 회차 ('yyyy-MM-dd' 문자열 비교, 상환일 순)
+    query = db.collection(DUE_COLLECTION).where(
+        filter=FieldFilter('payment_date', '>=', start_date)
+    ).where(
+        filter=FieldFilter('payment_date', '<=', end_date)
+    ).order_by('payment_date')
+    return [doc.to_dict() for doc in query.stream()]
+
+
+def backfill_due_index(db) -> int:
+    # 기존 Loan 전체의 색인 생성 후 표시 문서 기록 (이후 batch 화면이 색인 조회를 사용)
+    from src.components.schedule_storage import load_loan
+
+    written = 0
+    for doc in db.collection('Loan').stream():
+        loan_data = load_loan(doc.to_dict())
+        loan_schedule = loan_data.get('loan_schedule', [])
+        write_due_index(db, doc.id, loan_data, loan_schedule)
+        written += len(loan_schedule)
+    db.collection(DUE_COLLECTION).document(BACKFILL_MARKER_ID).set({
+        'installments': written,
+        'backfilled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    })
+    return written
+
+
+if __name__ == '__main__':
+    from src.components import DB
+
+    print(f"{backfill_due_index(DB)} installments indexed", file=sys.stderr)
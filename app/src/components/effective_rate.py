@@ -0,0 +1,87 @@
+import numpy as np
+
+from src.components.schedule_engine import batch_schedule_columns
+from src.components.schedule_storage import load_loan
+
+NEWTON_MAX_ITERATIONS = 100
+NEWTON_TOLERANCE = 1e-12
+_START_DATE = np.datetime64('2000-01-01', 'D')
+
+
+def solve_effective_rates(principal, amounts, day_offsets, loan_index) -> np.ndarray:
+    # 대출별 실효 연이율 y: sum(amount / (1 + y) ** (day_offset / 365)) = principal
+    # 모든 대출을 한 번에 뉴턴법으로 계산 (행 단위 배열 + loan_index 로 대출 구분)
+    # v = ln(1 + y) 로 바꾸면 현재가치가 v 에 대해 감소하는 볼록 함수이므로 v = 0 에서 시작하면 단조 수렴
+    principal = np.asarray(principal, dtype=np.float64)
+    amounts = np.asarray(amounts, dtype=np.float64)
+    years = np.asarray(day_offsets, dtype=np.float64) / 365
+    loan_index = np.asarray(loan_index, dtype=np.int64)
+    size = len(principal)
+
+    v = np.zeros(size, dtype=np.float64)
+    for _ in range(NEWTON_MAX_ITERATIONS):
+        discounted = amounts * np.exp(-v[loan_index] * years)
+        present_value = np.bincount(loan_index, weights=discounted, minlength=size)
+        slope = -np.bincount(loan_index, weights=discounted * years, minlength=size)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(slope != 0, (present_value - principal) / slope, 0)
+        v -= step
+        if not size or np.abs(step).max() < NEWTON_TOLERANCE:
+            break
+    return np.expm1(v)
+
+
+def nominal_annual_rates(effective_annual_rate, cycle_days) -> np.ndarray:
+    # 실효 연이율을 상환 주기 기준 명목 연이율(회차 이율 x 365 / 상환 주기)로 환산
+    cycle_days = np.asarray(cycle_days, dtype=np.float64)
+    return np.expm1(np.log1p(effective_annual_rate) * cycle_days / 365) * 365 / cycle_days
+
+
+def effective_rates(principal, num_payments, cycle_days, annual_interest_rate, method) -> dict:
+    # 상품 조건으로 계산한 스케줄(100 단위 올림 포함)의 실제 현금흐름 기준 실효 이율
+    principal = np.asarray(principal, dtype=np.float64)
+    cycle_days = np.broadcast_to(np.asarray(cycle_days, dtype=np.int64), len(principal))
+    columns = batch_schedule_columns(principal, num_payments, cycle_days, annual_interest_rate, _START_DATE, method)
+    day_offsets = (columns['Payment Date'] - _START_DATE).astype(np.int64)
+
+    effective = solve_effective_rates(principal, columns['Total'], day_offsets, columns['Loan Index'])
+    return {
+        'effective_annual_rate': effective,
+        'nominal_annual_rate': nominal_annual_rates(effective, cycle_days),
+    }
+
+
+def loan_effective_rates(loans: list) -> dict:
+    # 저장된 Loan 문서의 상환 스케줄(계약일 -> 각 상환일) 기준 실효 이율
+    # loans 는 (문서 ID, 문서 dict) 목록
+    loan_ids, principals, cycles = [], [], []
+    amounts, payment_dates, contract_dates, loan_index = [], [], [], []
+
+    for loan_id, loan_data in loans:
+        schedule = loan_data.get('loan_schedule') or []
+        if not schedule or not loan_data.get('contract_date'):
+            continue
+        index = len(loan_ids)
+        loan_ids.append(loan_id)
+        principals.append(float(loan_data.get('principal') or 0))
+        cycles.append(int(loan_data.get('repayment_cycle') or 1))
+        for row in schedule:
+            amounts.append(int(row.get('Total', 0)))
+            payment_dates.append(row.get('Payment Date'))
+            contract_dates.append(loan_data['contract_date'])
+            loan_index.append(index)
+
+    day_offsets = (
+        np.asarray(payment_dates, dtype='datetime64[D]') - np.asarray(contract_dates, dtype='datetime64[D]')
+    ).astype(np.int64)
+    effective = solve_effective_rates(principals, amounts, day_offsets, loan_index)
+    nominal = nominal_annual_rates(effective, cycles)
+    return {
+        loan_id: {'effective_annual_rate': float(effective[i]), 'nominal_annual_rate': float(nominal[i])}
+        for i, loan_id in enumerate(loan_ids)
+    }
+
+
+def book_effective_rates(db) -> dict:
+    # 전체 Loan 문서의 실효 이율 (공시 / 감독 보고용)
+    return loan_effective_rates([(doc.id, load_loan(doc.to_dict())) for doc in db.collection('Loan').stream()])
@@ -0,0 +1,15 @@
+from src.components.schedule_storage import SCHEDULE_FIELDS
+
+# 화면별로 읽는 필드 (나머지 collaterals, counselings, guarantors 등은 받지 않음)
+BATCH_REPAYMENT_FIELDS = ('uid', 'loan_number') + SCHEDULE_FIELDS
+PERIODIC_BALANCE_LOAN_FIELDS = ('contract_date',) + SCHEDULE_FIELDS
+PERIODIC_BALANCE_OVERDUE_FIELDS = ('loan_schedule', 'received_schedule')
+
+
+def select_fields(query, fields):
+    # Firestore 필드 마스크(select) 를 적용한 쿼리 (CollectionReference 또는 Query)
+    return query.select(list(fields))
+
+
+def stream_fields(query, fields):
+    return select_fields(query, fields).stream()
@@ -0,0 +1,85 @@
+import numpy as np
+
+from src.components.schedule_engine import batch_schedule_columns
+from src.components.schedule_table import ScheduleTable
+
+PAID = 1
+SCHEDULE_COLUMNS = ['Period', 'Payment Date', 'Principal', 'Interest', 'Total', 'Remaining Balance', 'status']
+
+
+def _member_terms(members: list) -> dict:
+    # 그룹 대출 구성원(Loan 문서)의 상환 조건을 열(column) 배열로 모음
+    return {
+        'principal': np.asarray([float(loan_data['principal']) for _, loan_data in members], dtype=np.float64),
+        'num_payments': np.asarray([int(loan_data['number_of_repayment']) for _, loan_data in members], dtype=np.int64),
+        'cycle_days': np.asarray([int(loan_data['repayment_cycle']) for _, loan_data in members], dtype=np.int64),
+        'annual_interest_rate': np.asarray([float(loan_data['interest_rate']) / 100 for _, loan_data in members], dtype=np.float64),
+        'start_date': np.asarray([loan_data['contract_date'] for _, loan_data in members], dtype='datetime64[D]'),
+        'method': [loan_data['repayment_method'] for _, loan_data in members],
+    }
+
+
+def member_schedules(members: list) -> ScheduleTable:
+    # 구성원 전체의 스케줄 ('Loan Index' 는 members 의 순서)
+    # 저장된 loan_schedule 이 있으면 그 회차(재계산/상환 완료 금액, 상태값 포함)를 그대로 사용하고
+    # 스케줄이 저장되지 않은 구성원만 상환 조건으로 한 번에 계산
+    tables = [ScheduleTable.from_records(loan_data.get('loan_schedule') or []) for _, loan_data in members]
+    missing = [i for i, table in enumerate(tables) if len(table) == 0]
+    if missing:
+        terms = _member_terms([members[i] for i in missing])
+        columns = batch_schedule_columns(
+            terms['principal'], terms['num_payments'], terms['cycle_days'],
+            terms['annual_interest_rate'], terms['start_date'], terms['method'],
+        )
+        columns['status'] = np.zeros(len(columns['Period']), dtype=np.int64)
+        computed = ScheduleTable(columns)
+        for j, i in enumerate(missing):
+            tables[i] = computed.select(computed['Loan Index'] == j)
+
+    lengths = [len(table) for table in tables]
+    columns = {'Loan Index': np.repeat(np.arange(len(members), dtype=np.int64), lengths)}
+    for name in SCHEDULE_COLUMNS:
+        columns[name] = np.concatenate([table[name] for table in tables] or [np.zeros(0, dtype=np.int64)])
+    return ScheduleTable(columns)
+
+
+def group_due_list(schedules: ScheduleTable) -> ScheduleTable:
+    # 상환일별 그룹 합계 (모임에서 한 번에 수금할 금액)
+    # 'Unpaid Total' 은 상환 완료(1) 회차를 제외한 금액
+    dates, date_index = np.unique(schedules['Payment Date'], return_inverse=True)
+    date_index = date_index.ravel()
+    size = len(dates)
+
+    def date_sum(values):
+        return np.bincount(date_index, weights=values, minlength=size).astype(np.int64)
+
+    unpaid = schedules['status'] != PAID
+    return ScheduleTable({
+        'Payment Date': dates,
+        'Members': np.bincount(date_index, minlength=size),
+        'Principal': date_sum(schedules['Principal']),
+        'Interest': date_sum(schedules['Interest']),
+        'Total': date_sum(schedules['Total']),
+        'Unpaid Total': date_sum(np.where(unpaid, schedules['Total'], 0)),
+    })
+
+
+def group_schedule(members: list) -> dict:
+    # 그룹 대출(cp_number) 구성원별 스케줄과 상환일별 그룹 수금표
+    schedules = member_schedules(members)
+    return {
+        'loan_ids': [loan_id for loan_id, _ in members],
+        'members': schedules,
+        'due_list': group_due_list(schedules),
+    }
+
+
+def load_group_schedule(db, cp_number: str) -> dict:
+    from src.components.schedule_storage import load_loan
+
+    members = [
+        (doc.id, load_loan(doc.to_dict()))
+        for doc in db.collection('Loan').where('cp_number', '==', cp_number).stream()
+    ]
+    members.sort(key=lambda member: member[0])
+    return group_schedule(members)
@@ -0,0 +1,51 @@
+from google.cloud.firestore_v1 import transactional
+
+from src.components.due_index import DUE_COLLECTION, due_entries, due_id
+from src.components.schedule_storage import SCHEDULE_FIELDS, load_loan, status_update
+
+SCHEDULED = 0
+PAID = 1
+OVERDUE = 2
+
+# 상태값 변경에 필요한 Loan 필드 (스케줄 + 상환 예정 색인에 기록하는 필드)
+STATUS_FIELDS = ['uid', 'loan_number'] + list(SCHEDULE_FIELDS)
+
+
+def set_installment_status(db, loan_id: str, periods, status: int) -> dict:
+    # 회차(periods) 의 상태값을 트랜잭션 안에서 변경하고 상환 예정 색인도 함께 기록
+    # 다른 사용자가 같은 대출의 다른 회차를 동시에 변경해도 서로 덮어쓰지 않음 (충돌 시 다시 읽고 재시도)
+    # 반환값은 변경 후의 Loan 필드 (STATUS_FIELDS, loan_schedule 포함, periods 가 비어 있으면 빈 dict)
+    periods = sorted(set(int(period) for period in periods))
+    if not periods:
+        # 바꿀 회차가 없으면 트랜잭션 없이 빈 dict (빈 update 는 Firestore 에서 오류)
+        return {}
+    loan_ref = db.collection('Loan').document(loan_id)
+
+    @transactional
+    def post(transaction):
+        snapshot = loan_ref.get(field_paths=STATUS_FIELDS, transaction=transaction)
+        if not snapshot.exists:
+            raise ValueError(f"Loan {loan_id} not found")
+        loan_data = load_loan(snapshot.to_dict())
+        loan_schedule = loan_data.get('loan_schedule', [])
+        if any(period < 1 or period > len(loan_schedule) for period in periods):
+            raise ValueError(f"Invalid installment for loan {loan_id}: {periods}")
+
+        transaction.update(loan_ref, status_update(loan_data, periods, status))
+        for period in periods:
+            loan_schedule[period - 1]['status'] = status
+            if 'schedule_status' in loan_data:
+                if status == SCHEDULED:
+                    loan_data['schedule_status'].pop(str(period), None)
+                else:
+                    loan_data['schedule_status'][str(period)] = status
+
+        entries = due_entries(loan_id, loan_data, loan_schedule)
+        due_collection = db.collection(DUE_COLLECTION)
+        for period in periods:
+            row = loan_schedule[period - 1]
+            doc_id = due_id(loan_id, row.get('Period', period))
+            transaction.set(due_collection.document(doc_id), entries[doc_id])
+        return loan_data
+
+    return post(db.transaction())
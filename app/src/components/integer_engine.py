@@ -0,0 +1,185 @@
+import math
+
+import numpy as np
+
+from src.components.payment_calendar import PaymentCalendar
+from src.components.schedule_engine import payment_dates
+
+# 연 이자율을 백만분율 정수로 표현 (0.28 -> 280000)
+RATE_SCALE = 1_000_000
+DAYS_PER_YEAR = 365
+MONTHS_PER_YEAR = 12
+
+# 금액 한 칸 (모든 금액은 100 단위 올림)
+FLOAT_TOLERANCE = 100
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def scale_rate(annual_interest_rate: float) -> int:
+    return int(round(annual_interest_rate * RATE_SCALE))
+
+
+def to_kyat(principal) -> int:
+    kyat = int(principal)
+    if kyat != principal:
+        raise ValueError(f"Principal must be a whole kyat amount: {principal}")
+    return kyat
+
+
+def ceil_div(numerator, denominator):
+    # 정수 나눗셈 올림 (int, np.int64 배열 모두 사용 가능)
+    return -(-numerator // denominator)
+
+
+def ceil_100(values):
+    return ceil_div(values, 100) * 100
+
+
+def period_rate_fraction(method: str, cycle_days: int, rate_scaled: int) -> tuple:
+    # 회차 이자율을 기약분수 (분자, 분모) 로 표현
+    if method == 'bullet':
+        numerator, denominator = rate_scaled, RATE_SCALE * MONTHS_PER_YEAR
+    else:
+        numerator, denominator = rate_scaled * cycle_days, RATE_SCALE * DAYS_PER_YEAR
+    divisor = math.gcd(numerator, denominator)
+    return numerator // divisor, denominator // divisor
+
+
+def equal_payment_amount(principal: int, num_payments: int, numerator: int, denominator: int) -> int:
+    # M = P * r(1 + r)^n / ((1 + r)^n - 1) 을 분수 그대로 계산 후 100 단위 올림
+    if numerator == 0:
+        return ceil_100(ceil_div(principal, num_payments))
+    growth = (denominator + numerator) ** num_payments
+    base = denominator ** num_payments
+    return ceil_div(principal * numerator * growth, denominator * (growth - base) * 100) * 100
+
+
+def rounding_drift(num_payments: int, period_rate: float) -> float:
+    # 원리금 균등 상환에서 100 단위 올림으로 생기는 잔액 오차의 상한
+    # 회차마다 상환액 올림(100) + 이자 올림(100) 만큼 어긋나고, 어긋난 잔액은 이자를 통해 (1 + r) 배씩 커짐
+    # D_k <= (1 + r) D_(k-1) + 200  =>  D_n <= 200 ((1 + r)^n - 1) / r
+    if period_rate == 0:
+        return 2 * FLOAT_TOLERANCE * num_payments
+    try:
+        return 2 * FLOAT_TOLERANCE * math.expm1(num_payments * math.log1p(period_rate)) / period_rate
+    except OverflowError:
+        return math.inf
+
+
+def float_tolerance(method: str, num_payments: int, cycle_days: int, annual_interest_rate: float) -> float:
+    # float 엔진(schedule_engine) 과의 열별 최대 차이 (kyat)
+    # - 원금 균등 / 만기일시: 회차 금액을 닫힌 식으로 계산하므로 한 칸(100) 이내
+    # - 원리금 균등: 이자가 직전 잔액에 의존하므로 한 번 어긋난 100 이 이후 회차에서 커짐 (rounding_drift)
+    #   (예: 51,110,300 / 1200 회 / 14 일 / 24% 는 15,600 차이)
+    if method != 'equal':
+        return FLOAT_TOLERANCE
+    numerator, denominator = period_rate_fraction(method, cycle_days, scale_rate(annual_interest_rate))
+    return rounding_drift(num_payments, numerator / denominator) + FLOAT_TOLERANCE
+
+
+def equal_payment_columns(principal: int, num_payments: int, cycle_days: int, rate_scaled: int) -> dict:
+    numerator, denominator = period_rate_fraction('equal', cycle_days, rate_scaled)
+    amount_per_period = equal_payment_amount(principal, num_payments, numerator, denominator)
+
+    # 올림 오차가 (1 + r)^n 배로 커져 잔액/이자가 int64 범위를 넘을 수 있는 조건은 계산하지 않음
+    # (예: 97,455,000 / 1200 회 / 30 일 / 46%)
+    if principal + rounding_drift(num_payments, numerator / denominator) >= INT64_MAX or \
+            amount_per_period * num_payments >= INT64_MAX:
+        raise ValueError(
+            f"Equal payment schedule out of range: rounding drift over {num_payments} payments "
+            f"at {rate_scaled / RATE_SCALE:.2%} every {cycle_days} days exceeds int64."
+        )
+
+    # 이자는 직전 잔액에 의존하므로 이자 수열만 순차 계산 (정수 연산)
+    interest = np.empty(num_payments, dtype=np.int64)
+    balance = principal
+    interest_denominator = denominator * 100
+    for i in range(num_payments):
+        interest_payment = -(-balance * numerator // interest_denominator) * 100
+        interest[i] = interest_payment
+        balance -= amount_per_period - interest_payment
+
+    principal_col = amount_per_period - interest
+    paid = principal_col + interest
+    total_calculated = amount_per_period * num_payments
+
+    # 마지막 회차에서 남은 총 상환액과의 차이를 원금에 반영
+    remaining_before_last = total_calculated - int(paid[:-1].sum())
+    principal_col[-1] += ceil_100(remaining_before_last - int(paid[-1]))
+    paid[-1] = principal_col[-1] + interest[-1]
+
+    total = np.full(num_payments, amount_per_period, dtype=np.int64)
+    total[-1] = paid[-1]
+
+    remaining_balance = ceil_100(total_calculated - np.cumsum(paid))
+    remaining_balance[-1] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': total,
+        'Remaining Balance': remaining_balance,
+    }
+
+
+def equal_principal_payment_columns(principal: int, num_payments: int, cycle_days: int, rate_scaled: int) -> dict:
+    numerator, denominator = period_rate_fraction('equal_principal', cycle_days, rate_scaled)
+    principal_payment = ceil_100(ceil_div(principal, num_payments))
+
+    # 원금 1억 kyat 기준으로도 int64 범위 안에서 계산됨
+    balance = principal - np.arange(num_payments, dtype=np.int64) * principal_payment
+    interest = ceil_div(balance * numerator, denominator * 100) * 100
+
+    principal_col = np.full(num_payments, principal_payment, dtype=np.int64)
+    principal_col[-1] = ceil_100(balance[-1])
+
+    remaining_balance = ceil_100(balance - principal_payment)
+    remaining_balance[-1] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': principal_col + interest,
+        'Remaining Balance': remaining_balance,
+    }
+
+
+def bullet_payment_columns(principal: int, num_payments: int, cycle_days: int, rate_scaled: int) -> dict:
+    numerator, denominator = period_rate_fraction('bullet', cycle_days, rate_scaled)
+    interest_payment = ceil_div(principal * numerator, denominator * 100) * 100
+    principal_due = ceil_100(principal)
+
+    interest = np.full(num_payments, interest_payment, dtype=np.int64)
+    principal_col = np.zeros(num_payments, dtype=np.int64)
+    remaining_balance = np.full(num_payments, principal_due, dtype=np.int64)
+    if num_payments:
+        principal_col[-1] = principal_due
+        remaining_balance[-1] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': principal_col + interest,
+        'Remaining Balance': remaining_balance,
+    }
+
+
+_BUILDERS = {
+    'equal': equal_payment_columns,
+    'equal_principal': equal_principal_payment_columns,
+    'bullet': bullet_payment_columns,
+}
+
+
+def integer_amount_columns(method: str, principal, num_payments: int, cycle_days: int, annual_interest_rate: float) -> dict:
+    return _BUILDERS[method](to_kyat(principal), num_payments, cycle_days, scale_rate(annual_interest_rate))
+
+
+def integer_schedule_columns(method: str, start_date, principal, num_payments: int, cycle_days: int, annual_interest_rate: float,
+                             calendar: PaymentCalendar = None) -> dict:
+    columns = integer_amount_columns(method, principal, num_payments, cycle_days, annual_interest_rate)
+    return {
+        'Period': np.arange(1, num_payments + 1, dtype=np.int64),
+        'Payment Date': payment_dates(start_date, num_payments, cycle_days, calendar),
+        **columns,
+    }
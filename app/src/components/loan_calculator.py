@@ -1,146 +1,127 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
-import pandas as pd
 import math
 
+import numpy as np
+
+from src.components.schedule_engine import schedule_columns, batch_schedule_columns, normalize_method, payment_dates, quote_columns, summarize_columns
+from src.components.payment_calendar import PaymentCalendar
+from src.components.integer_engine import integer_schedule_columns
+from src.components.cycle_engine import cycle_schedule_columns
+from src.components.schedule_rows import ROW_ITERATORS
+from src.components.schedule_table import ScheduleTable
+from src.components.payoff import balance_after, payoff_quotes
+from src.components import overdue_accrual
+
 class LoanCalculator:
     
-    def __init__(self, start_date: datetime, principal: int, num_payments: int, cycle_days: int, annual_interest_rate: float = 0.28):
+    def __init__(self, start_date: datetime, principal: int, num_payments: int, cycle_days: int, annual_interest_rate: float = 0.28,
+                 calendar: PaymentCalendar = None):
         self.start_date = start_date
         self.principal = principal
         self.num_payments = num_payments
         self.annual_interest_rate = annual_interest_rate
         self.cycle_days = cycle_days
+        # 상환일을 휴일/주말에서 영업일로 옮길 달력 (None 이면 조정하지 않음)
+        self.calendar = calendar
         self.total_days = self.cycle_days * num_payments
         self.expire_date = start_date + relativedelta(days=self.total_days)
 
     def round_up_100(self, value):
         return math.ceil(value / 100) * 100
 
-    def equal_payment(self) -> pd.DataFrame:
-        period_interest_rate = self.annual_interest_rate / 365 * self.cycle_days
-        # 매 상환 금액을 계산 후 100 단위로 올림
-        amount_per_period = self.round_up_100(
-            self.principal * period_interest_rate * (1 + period_interest_rate) ** self.num_payments /
-            ((1 + period_interest_rate) ** self.num_payments - 1)
+    def round_to_100(self, value: float) -> int:
+        return int(math.ceil(value / 100) * 100)
+
+    def schedule(self, method: str) -> ScheduleTable:
+        # 'Equal', 'Equal Principal', 'Bullet' 등 화면 표기 그대로 사용 가능
+        return self._schedule(normalize_method(method))
+
+    def _schedule(self, method: str) -> ScheduleTable:
+        # 회차별 반복 대신 NumPy 배열 단위로 전체 스케줄 계산
+        columns = schedule_columns(
+            method, self.start_date, self.principal, self.num_payments, self.cycle_days, self.annual_interest_rate,
+            self.calendar
         )
+        return ScheduleTable(columns)
 
-        total_calculated = amount_per_period * self.num_payments  # 전체 상환 금액
-        schedule = []
-        current_date = self.start_date
-        principal = self.principal
-
-        for period in range(1, self.num_payments + 1):
-            # 이자 계산 후 100 단위로 올림
-            interest_payment = self.round_up_100(principal * period_interest_rate)
-            # 원금 계산 후 100 단위로 올림
-            principal_payment = self.round_up_100(amount_per_period - interest_payment)
-
-            # 마지막 회차에서 잔액 조정
-            if period == self.num_payments:
-                # 남은 총 상환액과 마지막 회차에서의 총 상환액이 차이가 나면 그 차이를 조정
-                remaining_difference = self.round_up_100(total_calculated - (principal_payment + interest_payment))
-                if remaining_difference != 0:
-                    principal_payment += remaining_difference  # 남은 차이만큼 마지막 원금 상환액에 반영
-                amount_per_period = principal_payment + interest_payment  # 최종 상환 금액
-
-            # 총 상환 금액에서 원금과 이자를 차감하여 남은 총 금액 계산
-            total_calculated -= (principal_payment + interest_payment)
-
-            # 상환 날짜 업데이트
-            current_date += relativedelta(days=self.cycle_days)
-
-            # 상환 스케줄 기록
-            schedule.append({
-                'Period': period,
-                'Payment Date': current_date.strftime('%Y-%m-%d'),
-                'Principal': self.round_up_100(principal_payment),
-                'Interest': interest_payment,
-                'Total': self.round_up_100(amount_per_period),  # 100 단위로 올림
-                'Remaining Balance': 0 if period == self.num_payments else self.round_up_100(total_calculated),  # 마지막 잔액은 0
-            })
-
-            # 원금에서 상환된 부분 차감
-            principal -= principal_payment
-
-        return pd.DataFrame(schedule)
+    def equal_payment(self) -> ScheduleTable:
+        return self._schedule('equal')
 
-    def round_to_100(self, value: float) -> int:
-        return int(math.ceil(value / 100) * 100)
+    def equal_principal_payment(self) -> ScheduleTable:
+        return self._schedule('equal_principal')
 
-    def equal_principal_payment(self) -> pd.DataFrame:
-        # 원금 상환액을 100 단위로 반올림
-        principal_payment = self.round_to_100(self.principal / self.num_payments)
-        period_interest_rate = self.annual_interest_rate / 365 * self.cycle_days
-
-        schedule = []
-        current_date = self.start_date
-        principal = self.principal
-
-        for period in range(1, self.num_payments + 1):
-            # 이자 계산 후 100 단위로 반올림
-            interest_payment = self.round_to_100(principal * period_interest_rate)
-            amount_per_period = principal_payment + interest_payment
-
-            if period == self.num_payments:
-                # 마지막 회차에서 남은 모든 원금을 상환
-                principal_payment = self.round_to_100(principal)
-                amount_per_period = principal_payment + interest_payment
-
-            # 원금에서 상환된 부분 차감
-            principal -= principal_payment
-
-            # 상환 날짜 업데이트
-            current_date += relativedelta(days=self.cycle_days)
-
-            # 스케줄 기록
-            schedule.append({
-                'Period': period,
-                'Payment Date': current_date.strftime('%Y-%m-%d'),
-                'Principal': principal_payment,
-                'Interest': interest_payment,
-                'Total': self.round_to_100(amount_per_period),
-                'Remaining Balance': 0 if period == self.num_payments else self.round_to_100(principal),
-            })
-
-        return pd.DataFrame(schedule)
-
-    def bullet_payment(self) -> pd.DataFrame:
-        period_interest_rate = self.annual_interest_rate / 12
-
-        schedule = []
-        current_date = self.start_date
-        principal = self.principal
-
-        for period in range(1, self.num_payments + 1):
-            # 이자 지급액을 100 단위로 반올림
-            interest_payment = self.round_to_100(principal * period_interest_rate)
-
-            current_date += relativedelta(days=self.cycle_days)
-
-            if period == self.num_payments:
-                # 마지막 회차에서 총 상환 금액과 원금 상환
-                principal_payment = self.round_to_100(principal)
-                total_payment = principal_payment + interest_payment
-                principal = 0
-            else:
-                total_payment = interest_payment
-                principal_payment = 0
-
-            # 총 상환액과 잔액을 반올림하여 기록
-            schedule.append({
-                'Period': period,
-                'Payment Date': current_date.strftime('%Y-%m-%d'),
-                'Principal': principal_payment,
-                'Interest': interest_payment,
-                'Total': self.round_to_100(total_payment),
-                'Remaining Balance': 0 if period == self.num_payments else self.round_to_100(principal),
-            })
-
-        return pd.DataFrame(schedule)
+    def bullet_payment(self) -> ScheduleTable:
+        return self._schedule('bullet')
+
+    def compare_methods(self) -> dict:
+        # 원리금 균등 / 원금 균등 / 만기일시 스케줄과 요약을 한 번에 계산
+        # {'equal': {'schedule': ScheduleTable, 'total_interest': ..., ...}, ...}
+        quotes = quote_columns(
+            self.start_date, self.principal, self.num_payments, self.cycle_days, self.annual_interest_rate, self.calendar
+        )
+        return {
+            method: {'schedule': ScheduleTable(columns), **summarize_columns(columns)}
+            for method, columns in quotes.items()
+        }
+
+    def iter_schedule(self, method: str = 'equal'):
+        # DataFrame 을 만들지 않고 필요한 회차까지만 한 행씩 계산
+        iterator = ROW_ITERATORS[normalize_method(method)]
+        rows = iterator(
+            self.start_date.toordinal(), self.principal, self.num_payments, self.cycle_days, self.annual_interest_rate
+        )
+        if self.calendar is None:
+            return rows
+        return self._adjust_due_dates(rows)
+
+    def _adjust_due_dates(self, rows):
+        # 행별 상환일을 달력으로 조정한 상환일로 교체 (금액은 그대로)
+        dates = payment_dates(self.start_date, self.num_payments, self.cycle_days, self.calendar).astype(object)
+        for row in rows:
+            row.due_date = dates[row.period - 1].toordinal()
+            yield row
+
+    def exact_schedule(self, method: str) -> ScheduleTable:
+        # 정수(kyat) 연산 엔진으로 계산한 스케줄 (float 오차 없이 항상 동일한 결과)
+        columns = integer_schedule_columns(
+            normalize_method(method), self.start_date, self.principal, self.num_payments, self.cycle_days, self.annual_interest_rate,
+            self.calendar
+        )
+        return ScheduleTable(columns)
+
+    def balance_at(self, period: int, method: str = 'equal') -> int:
+        # period 회차 상환 후 남은 원금 (원리금 균등은 스케줄의 Remaining Balance(남은 총 상환액) 와 다름)
+        return int(balance_after(
+            self.principal, self.num_payments, self.cycle_days, self.annual_interest_rate, method, period
+        ))
+
+    def payoff_quote(self, as_of_date, method: str = 'equal') -> dict:
+        # as_of_date 기준 남은 원금, 경과 이자, 중도 상환 금액
+        quote = payoff_quotes(
+            self.principal, self.num_payments, self.cycle_days, self.annual_interest_rate,
+            np.datetime64(self.start_date, 'D'), method, np.datetime64(as_of_date, 'D'), self.calendar
+        )
+        return {name: int(value) for name, value in quote.items()}
 
     def overdue_interest(self, amount: int, overdue_days: int, overdue_interest_rate: float) -> int:
-        overdue_interest = amount * (overdue_interest_rate / 365 * overdue_days)
+        # overdue_accrual.overdue_interest 와 같은 계산 (overdue_interest_rate 는 0.28 과 같은 비율, 원 단위 반올림)
+        payment_date = np.datetime64(self.start_date, 'D')
+        return int(overdue_accrual.overdue_interest(
+            amount, payment_date, overdue_interest_rate * 100, payment_date + int(overdue_days)
+        ))
+
+
+def batch_schedule(principal, num_payments, cycle_days, annual_interest_rate, start_date, method,
+                   calendar: PaymentCalendar = None) -> ScheduleTable:
+    # 여러 대출의 상환 스케줄을 한 번에 계산 ('Loan Index' 열로 대출 구분)
+    columns = batch_schedule_columns(principal, num_payments, cycle_days, annual_interest_rate, start_date, method, calendar)
+    return ScheduleTable(columns)
+
 
-        return overdue_interest
+def cycle_schedule(start_date, principal: int, expiration_months: int, annual_interest_rate: float, cycle: str,
+                   method: str = 'equal') -> ScheduleTable:
+    # 'month' / '4week' / '2week' / 'week' 주기 상품 스케줄 (algorithm/loan.ipynb 와 같은 계산 방식)
+    columns = cycle_schedule_columns(normalize_method(method), start_date, principal, expiration_months, annual_interest_rate, cycle)
+    return ScheduleTable(columns)
@@ -0,0 +1,70 @@
+import numpy as np
+
+from src.components.schedule_storage import load_loan
+
+OVERDUE = 2
+
+
+def overdue_interest(amount, payment_date, overdue_interest_rate, as_of_date) -> np.ndarray:
+    # 연체 이자 = 연체 금액 x (연 이자율(%) / 100 / 365 x 연체 일수), 원 단위 반올림
+    # 모든 인자는 배열 또는 스칼라 (payment_date, as_of_date 는 datetime64[D] 로 변환)
+    amount = np.asarray(amount, dtype=np.float64)
+    overdue_interest_rate = np.asarray(overdue_interest_rate, dtype=np.float64)
+    overdue_days = (
+        np.asarray(as_of_date, dtype='datetime64[D]') - np.asarray(payment_date, dtype='datetime64[D]')
+    ).astype(np.int64)
+    overdue_days = np.where(overdue_days > 0, overdue_days, 0)
+    return np.round(amount * (overdue_interest_rate / 100 / 365 * overdue_days)).astype(np.int64)
+
+
+def collect_overdue_installments(loans: list = (), overdues: list = ()) -> dict:
+    # Loan 문서의 연체(status 2) 회차와 Overdue 문서의 미수 회차를 하나의 열(column) 배열로 모음
+    # loans, overdues 는 (문서 ID, 문서 dict) 목록
+    loan_ids, amounts, payment_dates, rates = [], [], [], []
+
+    for loan_id, loan_data in loans:
+        rate = float(loan_data.get('interest_rate') or 0)
+        for schedule in loan_data.get('loan_schedule', []):
+            if schedule.get('status') == OVERDUE and schedule.get('Payment Date'):
+                loan_ids.append(loan_id)
+                amounts.append(int(schedule.get('Principal', 0)) + int(schedule.get('Interest', 0)))
+                payment_dates.append(schedule['Payment Date'])
+                rates.append(rate)
+
+    for loan_id, overdue_data in overdues:
+        rate = float(overdue_data.get('interest_rate') or 0)
+        for schedule in overdue_data.get('loan_schedule', []):
+            if schedule.get('repayment_date'):
+                loan_ids.append(loan_id)
+                amounts.append(int(schedule.get('principal') or 0) + int(schedule.get('interest') or 0))
+                payment_dates.append(schedule['repayment_date'])
+                rates.append(rate)
+
+    return {
+        'loan_id': np.asarray(loan_ids, dtype=object),
+        'amount': np.asarray(amounts, dtype=np.int64),
+        'payment_date': np.asarray(payment_dates, dtype='datetime64[D]'),
+        'interest_rate': np.asarray(rates, dtype=np.float64),
+    }
+
+
+def accrue_overdue_interest(installments: dict, as_of_date) -> dict:
+    # 연체 회차별, 대출별, 전체 연체 이자를 한 번에 계산
+    per_installment = overdue_interest(
+        installments['amount'], installments['payment_date'], installments['interest_rate'], as_of_date
+    )
+    loan_ids, loan_index = np.unique(installments['loan_id'].astype(str), return_inverse=True)
+    per_loan = np.bincount(loan_index.ravel(), weights=per_installment, minlength=len(loan_ids)).astype(np.int64)
+
+    return {
+        'per_installment': per_installment,
+        'per_loan': dict(zip(loan_ids.tolist(), per_loan.tolist())),
+        'total': int(per_installment.sum()),
+    }
+
+
+def accrue_book_overdue_interest(db, as_of_date) -> dict:
+    # Loan, Overdue 전체를 읽어 as_of_date 기준 연체 이자 계산 (일별 연체 / 월말 이자 계상용)
+    loans = [(doc.id, load_loan(doc.to_dict())) for doc in db.collection('Loan').stream()]
+    overdues = [(doc.id, doc.to_dict()) for doc in db.collection('Overdue').stream()]
+    return accrue_overdue_interest(collect_overdue_installments(loans, overdues), as_of_date)
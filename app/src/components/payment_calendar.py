@@ -0,0 +1,73 @@
+from functools import lru_cache
+
+import numpy as np
+
+CALENDAR_CACHE_SIZE = 1024
+# 월~금 영업일, 토/일 휴무
+DEFAULT_WEEKMASK = '1111100'
+# 조회 테이블은 연 단위로 만들어 두고 범위를 벗어나면 확장
+TABLE_MARGIN_DAYS = 366
+
+
+class PaymentCalendar:
+    # 상환일이 휴일/주말이면 영업일로 옮기는 달력
+    # roll: 'following'(다음 영업일), 'preceding'(이전 영업일), 'modifiedfollowing', 'modifiedpreceding'
+    def __init__(self, holidays=(), weekmask: str = DEFAULT_WEEKMASK, roll: str = 'following'):
+        self.busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=np.asarray(holidays, dtype='datetime64[D]'))
+        self.roll = roll
+        self._origin = None
+        self._table = None
+
+    def _ensure_range(self, first: np.datetime64, last: np.datetime64):
+        # 날짜 -> 조정된 상환일 조회 테이블을 필요한 범위까지 한 번만 계산
+        if self._table is not None and self._origin <= first and last < self._origin + len(self._table):
+            return
+        if self._table is not None:
+            first = min(first, self._origin)
+            last = max(last, self._origin + len(self._table) - 1)
+        first = first - TABLE_MARGIN_DAYS
+        last = last + TABLE_MARGIN_DAYS
+
+        days = np.arange(first, last + 1, dtype='datetime64[D]')
+        table = np.busday_offset(days, 0, roll=self.roll, busdaycal=self.busdaycal)
+        table.setflags(write=False)
+        self._origin = first
+        self._table = table
+
+    def adjust(self, dates) -> np.ndarray:
+        # 상환일 배열을 조회 테이블에서 한 번에 변환 (NaT 는 그대로 유지)
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        valid = ~np.isnat(dates)
+        if not valid.any():
+            return dates.copy()
+
+        self._ensure_range(dates[valid].min(), dates[valid].max())
+        adjusted = dates.copy()
+        adjusted[valid] = self._table[(dates[valid] - self._origin).astype(np.int64)]
+        return adjusted
+
+    def is_business_day(self, dates) -> np.ndarray:
+        return np.is_busday(np.asarray(dates, dtype='datetime64[D]'), busdaycal=self.busdaycal)
+
+
+@lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _cached_due_dates(start_date: np.datetime64, num_payments: int, cycle_days: int, calendar: PaymentCalendar) -> np.ndarray:
+    dates = start_date + np.arange(1, num_payments + 1, dtype=np.int64) * cycle_days
+    if calendar is not None:
+        dates = calendar.adjust(dates)
+    dates.setflags(write=False)
+    return dates
+
+
+def due_dates(start_date, num_payments: int, cycle_days: int, calendar: PaymentCalendar = None) -> np.ndarray:
+    # 계약일로부터 cycle_days 간격의 상환일 (datetime64[D], 읽기 전용)
+    # 계약일과 상환 주기가 같은 대출은 같은 배열을 공유
+    return _cached_due_dates(np.datetime64(start_date, 'D'), int(num_payments), int(cycle_days), calendar)
+
+
+def batch_due_dates(start_date, period, cycle_days, calendar: PaymentCalendar = None) -> np.ndarray:
+    # 여러 대출의 회차별 상환일 (start_date, period, cycle_days 는 같은 길이의 배열)
+    dates = np.asarray(start_date, dtype='datetime64[D]') + np.asarray(period, dtype=np.int64) * np.asarray(cycle_days, dtype=np.int64)
+    if calendar is not None:
+        dates = calendar.adjust(dates)
+    return dates
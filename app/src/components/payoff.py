@@ -0,0 +1,132 @@
+from functools import lru_cache
+
+import numpy as np
+
+from src.components.payment_calendar import PaymentCalendar, batch_due_dates
+from src.components.schedule_engine import SCHEDULE_CACHE_SIZE, cached_amount_columns, ceil_100, normalize_method
+
+
+def _period_rate(method, annual_interest_rate, cycle_days):
+    # 만기일시상환은 월 이자율, 나머지는 상환 주기(일) 기준 이자율
+    return np.where(method == 'bullet', annual_interest_rate / 12, annual_interest_rate / 365 * cycle_days)
+
+
+def _as_arrays(principal, num_payments, cycle_days, annual_interest_rate, method):
+    principal = np.asarray(principal, dtype=np.float64)
+    num_payments = np.asarray(num_payments, dtype=np.int64)
+    cycle_days = np.asarray(cycle_days, dtype=np.int64)
+    annual_interest_rate = np.asarray(annual_interest_rate, dtype=np.float64)
+    method = np.vectorize(normalize_method, otypes=[str])(np.asarray(method))
+    return principal, num_payments, cycle_days, annual_interest_rate, method
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _equal_payment_principal_paid(principal, num_payments: int, cycle_days: int, annual_interest_rate: float) -> np.ndarray:
+    # 원리금 균등 상환의 회차별 누적 상환 원금 (상품 조건별로 한 번만 계산)
+    columns = cached_amount_columns('equal', principal, num_payments, cycle_days, annual_interest_rate)
+    paid = np.concatenate(([0], np.cumsum(columns['Principal'])))
+    paid.setflags(write=False)
+    return paid
+
+
+def balance_after(principal, num_payments, cycle_days, annual_interest_rate, method, periods) -> np.ndarray:
+    # periods 회차까지 상환한 후 남은 원금 (principal - 누적 상환 원금, 100 단위 올림)
+    # - 원금 균등: principal - k * 원금 상환액 (닫힌 식, 스케줄의 Remaining Balance 와 동일)
+    #   원금 상환액을 100 단위로 올리므로 소액 대출은 스케줄과 같이 만기 전에 음수가 될 수 있음
+    # - 만기일시: 만기 전까지 원금 그대로 (스케줄의 Remaining Balance 와 동일)
+    # - 원리금 균등: 회차별 이자 올림 때문에 잔액이 경로에 따라 달라져 정확한 닫힌 식이 없으므로
+    #   상품 조건별 누적 상환 원금을 한 번 계산해 두고 조회
+    #   스케줄의 Remaining Balance 는 남은 총 상환액(원금 + 이자) 이므로 이 값과 다름
+    principal, num_payments, cycle_days, annual_interest_rate, method = _as_arrays(
+        principal, num_payments, cycle_days, annual_interest_rate, method
+    )
+    principal, num_payments, cycle_days, annual_interest_rate, method, periods = np.broadcast_arrays(
+        principal, num_payments, cycle_days, annual_interest_rate, method, np.asarray(periods, dtype=np.int64)
+    )
+    periods = np.clip(periods, 0, num_payments)
+
+    balance = np.where(
+        method == 'equal_principal',
+        principal - periods * ceil_100(principal / num_payments),
+        principal,
+    ).astype(np.float64)
+
+    equal_loans = np.flatnonzero((method == 'equal') & (periods > 0) & (periods < num_payments))
+    if len(equal_loans):
+        products = np.column_stack([
+            principal.ravel()[equal_loans], num_payments.ravel()[equal_loans],
+            cycle_days.ravel()[equal_loans], annual_interest_rate.ravel()[equal_loans],
+        ])
+        unique_products, product_index = np.unique(products, axis=0, return_inverse=True)
+        product_index = product_index.ravel()
+        order = np.argsort(product_index, kind='stable')
+        bounds = np.searchsorted(product_index[order], np.arange(len(unique_products) + 1))
+
+        paid = np.empty(len(equal_loans), dtype=np.float64)
+        for i, (product_principal, product_n, product_cycle, product_rate) in enumerate(unique_products):
+            loans = order[bounds[i]:bounds[i + 1]]
+            principal_paid = _equal_payment_principal_paid(
+                float(product_principal), int(product_n), int(product_cycle), float(product_rate)
+            )
+            paid[loans] = principal_paid[periods.ravel()[equal_loans[loans]]]
+        balance.ravel()[equal_loans] -= paid
+
+    balance = np.where(periods >= num_payments, 0, balance)
+    return ceil_100(balance)
+
+
+def _calendar_periods_paid(start_date, num_payments, cycle_days, as_of_date, calendar: PaymentCalendar):
+    # 휴일/주말 조정된 상환일 기준으로 as_of_date 까지 지난 회차 수와 마지막 상환일 이후 경과 일수
+    start_date, num_payments, cycle_days, as_of_date = np.broadcast_arrays(
+        np.asarray(start_date, dtype='datetime64[D]'), num_payments, cycle_days, np.asarray(as_of_date, dtype='datetime64[D]')
+    )
+    shape = start_date.shape
+    start_date, num_payments, cycle_days, as_of_date = (
+        values.ravel() for values in (start_date, num_payments, cycle_days, as_of_date)
+    )
+
+    # 대출별 전체 회차의 상환일을 이어붙여 한 번에 조정
+    starts = np.cumsum(num_payments) - num_payments
+    loan_index = np.repeat(np.arange(len(num_payments)), num_payments)
+    period = np.arange(len(loan_index)) - starts[loan_index] + 1
+    dates = batch_due_dates(start_date[loan_index], period, cycle_days[loan_index], calendar)
+
+    periods_paid = np.bincount(loan_index, weights=dates <= as_of_date[loan_index], minlength=len(num_payments)).astype(np.int64)
+    last_due = np.where(periods_paid > 0, dates[np.maximum(starts + periods_paid - 1, 0)], start_date)
+    days_since_due = np.maximum((as_of_date - last_due).astype(np.int64), 0)
+    days_since_due = np.where(periods_paid >= num_payments, 0, days_since_due)
+    return periods_paid.reshape(shape), days_since_due.reshape(shape)
+
+
+def payoff_quotes(principal, num_payments, cycle_days, annual_interest_rate, start_date, method, as_of_date,
+                  calendar: PaymentCalendar = None) -> dict:
+    # as_of_date 기준 중도 상환 금액 (마지막 상환일까지 정상 상환했다고 가정)
+    # 경과 이자 = 남은 원금 x 회차 이자율 x (마지막 상환일 이후 경과 일수 / 상환 주기)
+    # calendar 가 있으면 휴일/주말 조정된 상환일로 지난 회차와 경과 일수를 셈
+    principal, num_payments, cycle_days, annual_interest_rate, method = _as_arrays(
+        principal, num_payments, cycle_days, annual_interest_rate, method
+    )
+    if calendar is None:
+        elapsed_days = (
+            np.asarray(as_of_date, dtype='datetime64[D]') - np.asarray(start_date, dtype='datetime64[D]')
+        ).astype(np.int64)
+        elapsed_days = np.maximum(elapsed_days, 0)
+
+        periods_paid = np.minimum(elapsed_days // cycle_days, num_payments)
+        days_since_due = np.where(periods_paid >= num_payments, 0, elapsed_days - periods_paid * cycle_days)
+    else:
+        periods_paid, days_since_due = _calendar_periods_paid(start_date, num_payments, cycle_days, as_of_date, calendar)
+
+    # 원금 상환액 올림으로 잔액이 음수가 된 소액 원금 균등 대출은 남은 원금 0 으로 처리
+    remaining_principal = np.maximum(
+        balance_after(principal, num_payments, cycle_days, annual_interest_rate, method, periods_paid), 0
+    )
+    rate = _period_rate(method, annual_interest_rate, cycle_days)
+    accrued_interest = ceil_100(remaining_principal * rate * days_since_due / cycle_days)
+
+    return {
+        'periods_paid': periods_paid,
+        'remaining_principal': remaining_principal,
+        'accrued_interest': accrued_interest,
+        'settlement_amount': remaining_principal + accrued_interest,
+    }
@@ -0,0 +1,140 @@
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from src.components.loan_calculator import LoanCalculator
+
+DEFAULT_CHUNK_SIZE = 500
+COMPARED_FIELDS = ['Payment Date', 'Principal', 'Interest', 'Total', 'Remaining Balance']
+
+
+def partition(items: list, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def loan_calculator(loan_data: dict) -> LoanCalculator:
+    # Loan 문서의 상환 조건으로 LoanCalculator 생성
+    return LoanCalculator(
+        start_date=date.fromisoformat(loan_data['contract_date']),
+        principal=int(float(loan_data['principal'])),
+        num_payments=int(loan_data['number_of_repayment']),
+        cycle_days=int(loan_data['repayment_cycle']),
+        annual_interest_rate=float(loan_data['interest_rate']) / 100,
+    )
+
+
+def audit_loan(loan_id: str, loan_data: dict) -> dict:
+    # 저장된 스케줄과 현재 엔진으로 다시 계산한 스케줄 비교
+    try:
+        expected = loan_calculator(loan_data).schedule(loan_data['repayment_method']).to_records()
+    except (KeyError, ValueError, ZeroDivisionError) as e:
+        return {'loan_id': loan_id, 'error': str(e)}
+
+    stored = loan_data.get('loan_schedule', [])
+    mismatched = [
+        i + 1 for i in range(max(len(stored), len(expected)))
+        if i >= len(stored) or i >= len(expected)
+        or any(stored[i].get(name) != expected[i][name] for name in COMPARED_FIELDS)
+    ]
+    return {'loan_id': loan_id, 'matches': not mismatched, 'mismatched_periods': mismatched}
+
+
+def audit_chunk(loans: list) -> list:
+    # 작업 프로세스에서 실행 (loans 는 (문서 ID, 문서 dict) 목록, Qt / Firestore 를 사용하지 않음)
+    return [audit_loan(loan_id, loan_data) for loan_id, loan_data in loans]
+
+
+def run_jobs(items: list, task, chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = None,
+             start_chunk: int = 0, progress=None):
+    # items 를 chunk_size 단위로 나누어 여러 프로세스에서 task 실행
+    # 결과는 (청크 번호, task 결과) 를 청크 순서대로 yield (start_chunk 이전 청크는 건너뜀)
+    chunks = partition(items, chunk_size)
+    total = len(chunks)
+    workers = max_workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 메모리 사용량을 제한하기 위해 작업자 수의 2배까지만 미리 제출
+        pending = deque()
+        next_chunk = start_chunk
+        while pending or next_chunk < total:
+            while next_chunk < total and len(pending) < workers * 2:
+                pending.append((next_chunk, executor.submit(task, chunks[next_chunk])))
+                next_chunk += 1
+
+            index, future = pending.popleft()
+            results = future.result()
+            if progress is not None:
+                progress(index + 1, total)
+            yield index, results
+
+
+def _read_checkpoint(checkpoint_path: str) -> dict:
+    if not os.path.exists(checkpoint_path):
+        return {'next_chunk': 0, 'offset': 0}
+    with open(checkpoint_path) as f:
+        return json.load(f)
+
+
+def run_to_file(items: list, task, output_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                max_workers: int = None, progress=None) -> int:
+    # 결과를 JSON Lines 파일로 저장하며 청크마다 체크포인트 기록
+    # 중단 후 같은 output_path 로 다시 실행하면 마지막으로 완료된 청크 다음부터 이어서 실행
+    # (items 의 순서와 chunk_size 는 처음 실행할 때와 같아야 함)
+    checkpoint_path = output_path + '.checkpoint'
+    checkpoint = _read_checkpoint(checkpoint_path)
+
+    written = 0
+    with open(output_path, 'a+b') as output:
+        # 체크포인트 이후에 기록된 불완전한 결과는 버림
+        output.truncate(checkpoint['offset'])
+        output.seek(checkpoint['offset'])
+
+        for index, results in run_jobs(items, task, chunk_size, max_workers, checkpoint['next_chunk'], progress):
+            for result in results:
+                output.write((json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8'))
+            output.flush()
+            os.fsync(output.fileno())
+            written += len(results)
+
+            checkpoint = {'next_chunk': index + 1, 'offset': output.tell()}
+            with open(checkpoint_path + '.tmp', 'w') as f:
+                json.dump(checkpoint, f)
+            os.replace(checkpoint_path + '.tmp', checkpoint_path)
+
+    return written
+
+
+def load_loans(db) -> list:
+    # Loan 전체를 (문서 ID, 문서 dict) 목록으로 읽음 (문서 ID 순으로 정렬하여 재실행 시 순서 유지)
+    from src.components.schedule_storage import load_loan
+
+    loans = [(doc.id, load_loan(doc.to_dict())) for doc in db.collection('Loan').stream()]
+    loans.sort(key=lambda loan: loan[0])
+    return loans
+
+
+def _print_progress(done: int, total: int):
+    print(f"\r{done}/{total} chunks", end='' if done < total else '\n', file=sys.stderr, flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Audit every loan schedule against the calculator engine')
+    parser.add_argument('--output', default='loan_audit.jsonl')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    from src.components import DB
+
+    loans = load_loans(DB)
+    written = run_to_file(loans, audit_chunk, args.output, args.chunk_size, args.workers, _print_progress)
+    print(f"{written} loans audited -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+import csv
+
+import numpy as np
+
+from src.components.schedule_engine import QUOTE_METHODS, batch_schedule_columns, normalize_method
+
+METHOD_LABELS = {'equal': 'Equal', 'equal_principal': 'Equal Principal', 'bullet': 'Bullet'}
+RATE_CARD_COLUMNS = [
+    'Method', 'Principal', 'Number of Payments', 'Cycle Days', 'Interest Rate (%)',
+    'First Installment', 'Last Installment', 'Max Installment', 'Total Interest', 'Total Payment',
+]
+# 금액 계산에는 상환일이 필요 없으므로 임의의 계약일 사용
+_START_DATE = np.datetime64('2000-01-01', 'D')
+
+
+def rate_card(principals, num_payments, cycle_days, annual_interest_rates, methods=QUOTE_METHODS) -> dict:
+    # 상환 방식 x 원금 x 회차 수 x 상환 주기 x 이자율 의 모든 조합을 한 번에 계산
+    # 조합마다 LoanCalculator 를 만들지 않고 배치 엔진으로 전체 스케줄을 계산한 뒤 대출별로 집계
+    methods = np.asarray([normalize_method(method) for method in methods])
+    grid = np.meshgrid(
+        np.arange(len(methods)),
+        np.asarray(principals, dtype=np.float64),
+        np.asarray(num_payments, dtype=np.int64),
+        np.asarray(cycle_days, dtype=np.int64),
+        np.asarray(annual_interest_rates, dtype=np.float64),
+        indexing='ij',
+    )
+    method_index, principal, num_payments, cycle_days, annual_interest_rate = [axis.ravel() for axis in grid]
+    method = methods[method_index]
+
+    card = {
+        'method': method,
+        'principal': principal.astype(np.int64),
+        'num_payments': num_payments,
+        'cycle_days': cycle_days,
+        'annual_interest_rate': annual_interest_rate,
+    }
+    if not len(principal):
+        for name in ['first_installment', 'last_installment', 'max_installment', 'total_interest', 'total_payment']:
+            card[name] = np.zeros(0, dtype=np.int64)
+        return card
+
+    columns = batch_schedule_columns(principal, num_payments, cycle_days, annual_interest_rate, _START_DATE, method)
+    starts = np.cumsum(num_payments) - num_payments
+    total = columns['Total']
+
+    card.update({
+        'first_installment': total[starts],
+        'last_installment': total[starts + num_payments - 1],
+        'max_installment': np.maximum.reduceat(total, starts),
+        'total_interest': np.add.reduceat(columns['Interest'], starts),
+        'total_payment': np.add.reduceat(total, starts),
+    })
+    return card
+
+
+def rate_card_rows(card: dict) -> list:
+    # 내보내기용 행 목록 (RATE_CARD_COLUMNS 순서)
+    return [
+        [METHOD_LABELS.get(method, method), principal, num_payments, cycle_days, round(rate * 100, 4),
+         first, last, largest, interest, total]
+        for method, principal, num_payments, cycle_days, rate, first, last, largest, interest, total in zip(
+            card['method'].tolist(), card['principal'].tolist(), card['num_payments'].tolist(),
+            card['cycle_days'].tolist(), card['annual_interest_rate'].tolist(),
+            card['first_installment'].tolist(), card['last_installment'].tolist(),
+            card['max_installment'].tolist(), card['total_interest'].tolist(), card['total_payment'].tolist(),
+        )
+    ]
+
+
+def export_rate_card_csv(card: dict, file_path: str):
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(RATE_CARD_COLUMNS)
+        writer.writerows(rate_card_rows(card))
+
+
+def export_rate_card_excel(card: dict, file_path: str, sheet_name: str = 'Rate Card'):
+    from openpyxl import Workbook
+
+    if not file_path.endswith(".xlsx"):
+        file_path += ".xlsx"
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = sheet_name
+    sheet.append(RATE_CARD_COLUMNS)
+    for row in rate_card_rows(card):
+        sheet.append(row)
+    workbook.save(file_path)
+    return file_path
@@ -0,0 +1,88 @@
+from src.components.schedule_engine import cached_amount_columns, normalize_method
+from src.components.schedule_storage import SCHEDULE_FIELDS, load_loan, schedule_rows_update
+
+PAID = 1
+# 재계산과 저장에 필요한 Loan 필드 (상환 조건 + 스케줄 + 상환 예정 색인에 기록하는 필드)
+REAMORTIZE_FIELDS = ['uid', 'loan_number', 'repayment_method', 'repayment_cycle', 'interest_rate'] + list(SCHEDULE_FIELDS)
+
+
+def reamortize_tail(loan_schedule: list, period: int, balance, method: str, cycle_days: int, annual_interest_rate: float) -> list:
+    # period 회차부터 마지막 회차까지만 새 잔액(balance) 기준으로 다시 계산
+    # - period 이전 회차(상환 완료분)는 건드리지 않음
+    # - 남은 회차의 상환일과 상태값은 그대로 유지하고 금액만 변경
+    # 반환값은 새로 계산한 회차 목록이며 loan_schedule[period - 1:] 에 그대로 대입하면 됨
+    num_payments = len(loan_schedule)
+    if not 1 <= period <= num_payments:
+        raise ValueError(f"Period must be between 1 and {num_payments}: {period}")
+
+    tail = loan_schedule[period - 1:]
+    if any(row.get('status') == PAID for row in tail):
+        raise ValueError("Cannot re-amortize periods that are already paid.")
+
+    columns = cached_amount_columns(
+        normalize_method(method), balance, len(tail), int(cycle_days), float(annual_interest_rate)
+    )
+    principals = columns['Principal'].tolist()
+    interests = columns['Interest'].tolist()
+    totals = columns['Total'].tolist()
+    balances = columns['Remaining Balance'].tolist()
+
+    new_tail = []
+    for i, row in enumerate(tail):
+        new_row = dict(row)
+        new_row.update({
+            'Period': period + i,
+            'Principal': principals[i],
+            'Interest': interests[i],
+            'Total': totals[i],
+            'Remaining Balance': balances[i],
+        })
+        new_tail.append(new_row)
+    return new_tail
+
+
+def reamortize_loan(loan_data: dict, period: int, balance) -> list:
+    # Loan 문서의 상환 조건을 그대로 사용하여 남은 회차 재계산
+    return reamortize_tail(
+        loan_data['loan_schedule'],
+        period,
+        balance,
+        loan_data['repayment_method'],
+        int(loan_data['repayment_cycle']),
+        float(loan_data['interest_rate']) / 100,
+    )
+
+
+def reamortization_update(loan_data: dict, period: int, balance):
+    # 남은 회차를 재계산한 스케줄과 이를 저장할 update 내용
+    # 생성 조건 저장 방식은 바뀐 회차의 schedule_overrides 필드만 기록 (period 이전 회차는 기록하지 않음)
+    loan_schedule = loan_data['loan_schedule'][:period - 1] + reamortize_loan(loan_data, period, balance)
+    return loan_schedule, schedule_rows_update(loan_data, loan_schedule)
+
+
+def save_reamortization(db, loan_id: str, period: int, balance) -> dict:
+    # 남은 회차를 트랜잭션 안에서 재계산하여 저장하고 상환 예정 색인의 해당 회차도 함께 기록
+    # 반환값은 변경 후의 Loan 필드 (REAMORTIZE_FIELDS, loan_schedule 포함)
+    from google.cloud.firestore_v1 import transactional
+
+    from src.components.due_index import DUE_COLLECTION, due_entries
+
+    loan_ref = db.collection('Loan').document(loan_id)
+
+    @transactional
+    def save(transaction):
+        snapshot = loan_ref.get(field_paths=REAMORTIZE_FIELDS, transaction=transaction)
+        if not snapshot.exists:
+            raise ValueError(f"Loan {loan_id} not found")
+        loan_data = load_loan(snapshot.to_dict())
+        loan_schedule, update = reamortization_update(loan_data, period, balance)
+        if update:
+            transaction.update(loan_ref, update)
+
+        due_collection = db.collection(DUE_COLLECTION)
+        for doc_id, entry in list(due_entries(loan_id, loan_data, loan_schedule).items())[period - 1:]:
+            transaction.set(due_collection.document(doc_id), entry)
+        loan_data['loan_schedule'] = loan_schedule
+        return loan_data
+
+    return save(db.transaction())
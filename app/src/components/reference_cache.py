@@ -0,0 +1,125 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from src.components.document_loader import DocumentLoader
+
+# 화면마다 반복해서 읽는 참조 문서 (대출 상세, 상환, 연체 화면 등)
+REFERENCE_COLLECTIONS = ('Officer', 'User', 'Guarantor', 'Customer')
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 2048
+
+
+class ReferenceCache:
+    # 참조 문서 읽기 캐시 (프로세스 전체 공유)
+    # - ttl 초가 지난 항목은 다시 읽음 (다른 PC 에서 수정한 내용도 ttl 이내에 반영)
+    # - max_entries 를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    # - 이 프로그램에서 저장/삭제할 때는 invalidate 로 바로 제거
+    def __init__(self, db=None, ttl: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock=time.monotonic):
+        self._db = db
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.entries = OrderedDict()  # {(컬렉션, 문서 ID): (만료 시각, 문서 dict 또는 None)}
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            from src.components import DB
+            self._db = DB
+        return self._db
+
+    def _lookup(self, key):
+        # 유효한 항목이면 (True, 문서), 없거나 만료되었으면 (False, None)
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, data = entry
+        if expires_at <= self.clock():
+            del self.entries[key]
+            return False, None
+        self.entries.move_to_end(key)
+        return True, data
+
+    def _store(self, key, data):
+        self.entries[key] = (self.clock() + self.ttl, data)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, collection: str, doc_id) -> dict:
+        # 문서 dict 의 복사본 (없는 문서는 None)
+        return self.get_many(collection, [doc_id]).get(doc_id)
+
+    def get_many(self, collection: str, doc_ids) -> dict:
+        # {문서 ID: 문서 dict 복사본 또는 None}, 캐시에 없는 문서만 모아서 한 번에 읽음
+        doc_ids = [doc_id for doc_id in doc_ids if doc_id]
+        found = {}
+        missing = set()
+        with self.lock:
+            for doc_id in doc_ids:
+                if doc_id in found or doc_id in missing:
+                    continue
+                hit, data = self._lookup((collection, doc_id))
+                if hit:
+                    self.hits += 1
+                    found[doc_id] = data
+                else:
+                    self.misses += 1
+                    missing.add(doc_id)
+
+        if missing:
+            loaded = DocumentLoader(self.db, collection).load_many(sorted(missing))
+            with self.lock:
+                for doc_id, data in loaded.items():
+                    self._store((collection, doc_id), data)
+            found.update(loaded)
+
+        # 호출한 쪽에서 수정해도 캐시에 영향이 없도록 복사본 반환 (주소, 전화번호 등 중첩된 맵/리스트까지 복사)
+        return {doc_id: copy.deepcopy(found[doc_id]) for doc_id in doc_ids}
+
+    def invalidate(self, collection: str, doc_id=None):
+        # 문서 하나 (doc_id 가 None 이면 컬렉션 전체) 를 캐시에서 제거
+        with self.lock:
+            if doc_id is not None:
+                self.entries.pop((collection, doc_id), None)
+                return
+            for key in [key for key in self.entries if key[0] == collection]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'size': len(self.entries),
+            }
+
+
+REFERENCE_CACHE = ReferenceCache()
+
+
+def get_reference(collection: str, doc_id) -> dict:
+    return REFERENCE_CACHE.get(collection, doc_id)
+
+
+def get_references(collection: str, doc_ids) -> dict:
+    return REFERENCE_CACHE.get_many(collection, doc_ids)
+
+
+def invalidate_reference(collection: str, doc_id=None):
+    REFERENCE_CACHE.invalidate(collection, doc_id)
@@ -0,0 +1,353 @@
+import math
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from src.components.payment_calendar import PaymentCalendar, batch_due_dates, due_dates
+
+
+def ceil_100(values: np.ndarray) -> np.ndarray:
+    # LoanCalculator.round_up_100 / round_to_100 과 동일한 100 단위 올림 (배열 버전)
+    return (np.ceil(values / 100) * 100).astype(np.int64)
+
+
+def period_rate(annual_interest_rate: float, cycle_days: int) -> float:
+    # 원리금 균등 / 원금 균등 상환의 회차 이자율
+    return annual_interest_rate / 365 * cycle_days
+
+
+def payment_dates(start_date, num_payments: int, cycle_days: int, calendar: PaymentCalendar = None) -> np.ndarray:
+    # 계약일로부터 cycle_days 간격의 상환일 (datetime64[D], calendar 가 있으면 휴일/주말 조정)
+    return due_dates(start_date, num_payments, cycle_days, calendar)
+
+
+def format_dates(dates: np.ndarray) -> list:
+    # 'YYYY-MM-DD' 문자열 리스트
+    return np.datetime_as_string(dates, unit='D').tolist()
+
+
+def equal_payment_amount(principal, num_payments: int, rate: float) -> int:
+    # 매 상환 금액을 계산 후 100 단위로 올림 (무이자이면 원금을 균등 분할)
+    if rate == 0:
+        return math.ceil(principal / num_payments / 100) * 100
+    return math.ceil(
+        principal * rate * (1 + rate) ** num_payments /
+        ((1 + rate) ** num_payments - 1) / 100
+    ) * 100
+
+
+def equal_payment_columns(principal, num_payments: int, cycle_days: int, annual_interest_rate: float) -> dict:
+    rate = period_rate(annual_interest_rate, cycle_days)
+    amount_per_period = equal_payment_amount(principal, num_payments, rate)
+
+    # 이자는 직전 잔액에 의존하므로 이자 수열만 순차 계산
+    interest = np.empty(num_payments, dtype=np.int64)
+    balance = principal
+    for i in range(num_payments):
+        interest_payment = math.ceil(balance * rate / 100) * 100
+        interest[i] = interest_payment
+        balance -= math.ceil((amount_per_period - interest_payment) / 100) * 100
+
+    principal_col = ceil_100(amount_per_period - interest)
+    paid = principal_col + interest
+    total_calculated = amount_per_period * num_payments  # 전체 상환 금액
+
+    # 마지막 회차에서 남은 총 상환액과의 차이를 원금에 반영
+    remaining_before_last = total_calculated - int(paid[:-1].sum())
+    remaining_difference = math.ceil((remaining_before_last - int(paid[-1])) / 100) * 100
+    principal_col[-1] += remaining_difference
+    paid[-1] = principal_col[-1] + interest[-1]
+
+    total = np.full(num_payments, amount_per_period, dtype=np.int64)
+    total[-1] = paid[-1]
+
+    remaining_balance = ceil_100(total_calculated - np.cumsum(paid))
+    remaining_balance[-1] = 0  # 마지막 잔액은 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': ceil_100(total),
+        'Remaining Balance': remaining_balance,
+    }
+
+
+def equal_principal_payment_columns(principal, num_payments: int, cycle_days: int, annual_interest_rate: float) -> dict:
+    rate = period_rate(annual_interest_rate, cycle_days)
+    # 원금 상환액을 100 단위로 올림
+    principal_payment = int(math.ceil(principal / num_payments / 100) * 100)
+
+    # 각 회차 상환 전 잔액: principal - (k - 1) * principal_payment
+    paid_before = np.arange(num_payments, dtype=np.int64) * principal_payment
+    balance = principal - paid_before
+
+    interest = ceil_100(balance * rate)
+    principal_col = np.full(num_payments, principal_payment, dtype=np.int64)
+    # 마지막 회차에서 남은 모든 원금을 상환
+    principal_col[-1] = ceil_100(np.asarray(balance[-1]))
+
+    remaining_balance = ceil_100(balance - principal_payment)
+    remaining_balance[-1] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': ceil_100(principal_col + interest),
+        'Remaining Balance': remaining_balance,
+    }
+
+
+def bullet_payment_columns(principal, num_payments: int, cycle_days: int, annual_interest_rate: float) -> dict:
+    # 만기일시상환은 상환 주기와 무관하게 월 이자율 사용
+    rate = annual_interest_rate / 12
+    interest_payment = int(math.ceil(principal * rate / 100) * 100)
+
+    principal_due = int(math.ceil(principal / 100) * 100)
+
+    interest = np.full(num_payments, interest_payment, dtype=np.int64)
+    principal_col = np.zeros(num_payments, dtype=np.int64)
+    remaining_balance = np.full(num_payments, principal_due, dtype=np.int64)
+    if num_payments:
+        # 마지막 회차에서 원금 일시 상환
+        principal_col[-1] = principal_due
+        remaining_balance[-1] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': ceil_100(principal_col + interest),
+        'Remaining Balance': remaining_balance,
+    }
+
+
+_BUILDERS = {
+    'equal': equal_payment_columns,
+    'equal_principal': equal_principal_payment_columns,
+    'bullet': bullet_payment_columns,
+}
+
+# 계약일을 제외한 조건이 같은 스케줄은 금액이 동일하므로 계약일과 무관하게 보관
+SCHEDULE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def cached_amount_columns(method: str, principal, num_payments: int, cycle_days: int, annual_interest_rate: float):
+    columns = _BUILDERS[method](principal, num_payments, cycle_days, annual_interest_rate)
+    columns['Period'] = np.arange(1, num_payments + 1, dtype=np.int64)
+
+    # 캐시된 배열이 호출한 쪽에서 변경되지 않도록 읽기 전용으로 설정
+    for values in columns.values():
+        values.setflags(write=False)
+    return MappingProxyType(columns)
+
+
+def schedule_columns(method: str, start_date, principal, num_payments: int, cycle_days: int, annual_interest_rate: float,
+                     calendar: PaymentCalendar = None) -> dict:
+    cached = cached_amount_columns(method, principal, num_payments, cycle_days, annual_interest_rate)
+    # 캐시된 금액 열에 계약일 기준 상환일만 붙여서 반환
+    # 이자는 회차 단위로 계산하므로 상환일이 휴일 때문에 밀려도 금액은 바뀌지 않음
+    return {
+        'Period': cached['Period'],
+        'Payment Date': payment_dates(start_date, num_payments, cycle_days, calendar),
+        'Principal': cached['Principal'],
+        'Interest': cached['Interest'],
+        'Total': cached['Total'],
+        'Remaining Balance': cached['Remaining Balance'],
+    }
+
+
+QUOTE_METHODS = ('equal', 'equal_principal', 'bullet')
+
+
+def summarize_columns(columns) -> dict:
+    # 상환 방식 비교용 요약 (총 이자, 총 상환액, 첫/마지막/최대 상환액)
+    total = columns['Total']
+    return {
+        'total_interest': int(columns['Interest'].sum()),
+        'total_payment': int(total.sum()),
+        'first_installment': int(total[0]),
+        'last_installment': int(total[-1]),
+        'max_installment': int(total.max()),
+    }
+
+
+def quote_columns(start_date, principal, num_payments: int, cycle_days: int, annual_interest_rate: float,
+                  calendar: PaymentCalendar = None) -> dict:
+    # 세 가지 상환 방식을 한 번에 계산 (회차, 상환일 배열은 세 스케줄이 같은 배열을 공유)
+    dates = payment_dates(start_date, num_payments, cycle_days, calendar)
+    quotes = {}
+    for method in QUOTE_METHODS:
+        cached = cached_amount_columns(method, principal, num_payments, cycle_days, annual_interest_rate)
+        quotes[method] = {
+            'Period': cached['Period'],
+            'Payment Date': dates,
+            'Principal': cached['Principal'],
+            'Interest': cached['Interest'],
+            'Total': cached['Total'],
+            'Remaining Balance': cached['Remaining Balance'],
+        }
+    return quotes
+
+
+def normalize_method(method: str) -> str:
+    # 'Equal Principal' 과 같은 화면 표기도 허용
+    return method.strip().lower().replace(' ', '_')
+
+
+def _group_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    # 대출별 누적합 (values 는 대출 순서대로 이어붙인 회차 배열)
+    cumsum = np.cumsum(values)
+    offsets = np.concatenate(([0], cumsum[starts[1:] - 1]))
+    lengths = np.diff(np.append(starts, len(values)))
+    return cumsum - np.repeat(offsets, lengths)
+
+
+def _batch_equal_payment(principal, num_payments, rate, loan_index, period, starts, last) -> dict:
+    # 무이자(rate == 0) 대출은 원금을 균등 분할 (equal_payment_amount 와 동일)
+    growth = (1 + rate) ** num_payments
+    interest_free = rate == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity = principal * rate * growth / (growth - 1)
+    amount = np.ceil(np.where(interest_free, principal / num_payments, annuity) / 100) * 100
+
+    # 회차 k 에서 아직 상환 중인 대출만 함께 계산 (상환 횟수 내림차순 정렬 후 앞부분만 사용)
+    order = np.argsort(-num_payments, kind='stable')
+    sorted_n = num_payments[order]
+    sorted_starts = starts[order]
+    sorted_rate = rate[order]
+    sorted_amount = amount[order]
+    balance = principal[order].astype(np.float64)
+
+    interest = np.zeros(len(loan_index), dtype=np.int64)
+    active = len(order)
+    for k in range(int(sorted_n[0])):
+        while sorted_n[active - 1] <= k:
+            active -= 1
+        interest_payment = np.ceil(balance[:active] * sorted_rate[:active] / 100) * 100
+        interest[sorted_starts[:active] + k] = interest_payment
+        balance[:active] -= np.ceil((sorted_amount[:active] - interest_payment) / 100) * 100
+
+    amount_row = amount[loan_index].astype(np.int64)
+    principal_col = ceil_100(amount_row - interest)
+    paid = principal_col + interest
+    total_calculated = amount.astype(np.int64) * num_payments
+
+    # 마지막 회차에서 남은 총 상환액과의 차이를 원금에 반영
+    paid_before_last = _group_cumsum(paid, starts)[last] - paid[last]
+    remaining_difference = ceil_100(total_calculated - paid_before_last - paid[last])
+    principal_col[last] += remaining_difference
+    paid[last] = principal_col[last] + interest[last]
+
+    total = amount_row.copy()
+    total[last] = paid[last]
+
+    remaining_balance = ceil_100(total_calculated[loan_index] - _group_cumsum(paid, starts))
+    remaining_balance[last] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': ceil_100(total),
+        'Remaining Balance': remaining_balance,
+    }
+
+
+def _batch_equal_principal_payment(principal, num_payments, rate, loan_index, period, starts, last) -> dict:
+    principal_payment = ceil_100(principal / num_payments)[loan_index]
+    balance = principal[loan_index] - (period - 1) * principal_payment
+
+    interest = ceil_100(balance * rate[loan_index])
+    principal_col = principal_payment.copy()
+    principal_col[last] = ceil_100(balance[last])
+
+    remaining_balance = ceil_100(balance - principal_payment)
+    remaining_balance[last] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': ceil_100(principal_col + interest),
+        'Remaining Balance': remaining_balance,
+    }
+
+
+def _batch_bullet_payment(principal, num_payments, rate, loan_index, period, starts, last) -> dict:
+    interest = ceil_100(principal * rate)[loan_index]
+    principal_due = ceil_100(principal)[loan_index]
+
+    principal_col = np.zeros(len(loan_index), dtype=np.int64)
+    principal_col[last] = principal_due[last]
+    remaining_balance = principal_due.copy()
+    remaining_balance[last] = 0
+
+    return {
+        'Principal': principal_col,
+        'Interest': interest,
+        'Total': ceil_100(principal_col + interest),
+        'Remaining Balance': remaining_balance,
+    }
+
+
+_BATCH_BUILDERS = {
+    'equal': _batch_equal_payment,
+    'equal_principal': _batch_equal_principal_payment,
+    'bullet': _batch_bullet_payment,
+}
+
+
+def batch_schedule_columns(principal, num_payments, cycle_days, annual_interest_rate, start_date, method,
+                           calendar: PaymentCalendar = None) -> dict:
+    # 여러 대출의 스케줄을 한 번에 계산하여 대출 순서대로 이어붙인 열(column) 배열로 반환
+    principal = np.asarray(principal, dtype=np.float64)
+    size = len(principal)
+    num_payments = np.broadcast_to(np.asarray(num_payments, dtype=np.int64), size)
+    cycle_days = np.broadcast_to(np.asarray(cycle_days, dtype=np.int64), size)
+    annual_interest_rate = np.broadcast_to(np.asarray(annual_interest_rate, dtype=np.float64), size)
+    start_date = np.broadcast_to(np.asarray(start_date, dtype='datetime64[D]'), size)
+    method = np.broadcast_to(np.asarray([normalize_method(m) for m in np.atleast_1d(method)]), size)
+
+    if size and num_payments.min() < 1:
+        raise ValueError("num_payments must be at least 1 for every loan")
+
+    unknown = set(np.unique(method)) - set(_BATCH_BUILDERS)
+    if unknown:
+        raise ValueError(f"Unknown repayment method: {', '.join(sorted(unknown))}")
+
+    starts = np.cumsum(num_payments) - num_payments
+    loan_index = np.repeat(np.arange(size, dtype=np.int64), num_payments)
+    period = np.arange(len(loan_index), dtype=np.int64) - np.repeat(starts, num_payments) + 1
+
+    columns = {
+        'Loan Index': loan_index,
+        'Period': period,
+        'Payment Date': batch_due_dates(start_date[loan_index], period, cycle_days[loan_index], calendar),
+        'Principal': np.zeros(len(loan_index), dtype=np.int64),
+        'Interest': np.zeros(len(loan_index), dtype=np.int64),
+        'Total': np.zeros(len(loan_index), dtype=np.int64),
+        'Remaining Balance': np.zeros(len(loan_index), dtype=np.int64),
+    }
+
+    for name, builder in _BATCH_BUILDERS.items():
+        loans = np.flatnonzero(method == name)
+        if not len(loans):
+            continue
+
+        # 같은 상환 방식의 대출만 모아서 계산
+        sub_n = num_payments[loans]
+        sub_starts = np.cumsum(sub_n) - sub_n
+        sub_index = np.repeat(np.arange(len(loans), dtype=np.int64), sub_n)
+        sub_period = np.arange(len(sub_index), dtype=np.int64) - np.repeat(sub_starts, sub_n) + 1
+        sub_last = sub_starts + sub_n - 1
+        if name == 'bullet':
+            rate = annual_interest_rate[loans] / 12
+        else:
+            rate = annual_interest_rate[loans] / 365 * cycle_days[loans]
+
+        result = builder(principal[loans], sub_n, rate, sub_index, sub_period, sub_starts, sub_last)
+
+        rows = np.repeat(starts[loans], sub_n) + sub_period - 1
+        for column, values in result.items():
+            columns[column][rows] = values
+
+    return columns
@@ -0,0 +1,116 @@
+import math
+from datetime import date
+
+
+def _ceil_100(value) -> int:
+    return int(math.ceil(value / 100) * 100)
+
+
+class ScheduleRow:
+    # DataFrame 없이 사용하는 상환 스케줄 한 행 (due_date 는 date.toordinal() 값)
+    __slots__ = ('period', 'due_date', 'principal', 'interest', 'total', 'balance')
+
+    def __init__(self, period: int, due_date: int, principal: int, interest: int, total: int, balance: int):
+        self.period = period
+        self.due_date = due_date
+        self.principal = principal
+        self.interest = interest
+        self.total = total
+        self.balance = balance
+
+    @property
+    def payment_date(self) -> str:
+        return date.fromordinal(self.due_date).isoformat()
+
+    def to_record(self) -> dict:
+        # loan_schedule 에 저장되는 기존 형식
+        return {
+            'Period': self.period,
+            'Payment Date': self.payment_date,
+            'Principal': self.principal,
+            'Interest': self.interest,
+            'Total': self.total,
+            'Remaining Balance': self.balance,
+        }
+
+    def __repr__(self):
+        return (f"ScheduleRow(period={self.period}, payment_date={self.payment_date}, principal={self.principal}, "
+                f"interest={self.interest}, total={self.total}, balance={self.balance})")
+
+
+def iter_equal_payment(start_ordinal: int, principal, num_payments: int, cycle_days: int, annual_interest_rate: float):
+    period_interest_rate = annual_interest_rate / 365 * cycle_days
+    if period_interest_rate == 0:
+        # 무이자이면 원금을 균등 분할 (schedule_engine.equal_payment_amount 와 동일)
+        amount_per_period = _ceil_100(principal / num_payments)
+    else:
+        amount_per_period = _ceil_100(
+            principal * period_interest_rate * (1 + period_interest_rate) ** num_payments /
+            ((1 + period_interest_rate) ** num_payments - 1)
+        )
+    total_calculated = amount_per_period * num_payments
+
+    for period in range(1, num_payments + 1):
+        interest_payment = _ceil_100(principal * period_interest_rate)
+        principal_payment = _ceil_100(amount_per_period - interest_payment)
+        total_payment = amount_per_period
+
+        if period == num_payments:
+            # 마지막 회차에서 남은 총 상환액과의 차이를 원금에 반영
+            principal_payment += _ceil_100(total_calculated - (principal_payment + interest_payment))
+            total_payment = principal_payment + interest_payment
+
+        total_calculated -= principal_payment + interest_payment
+        principal -= principal_payment
+
+        yield ScheduleRow(
+            period,
+            start_ordinal + period * cycle_days,
+            principal_payment,
+            interest_payment,
+            total_payment,
+            0 if period == num_payments else _ceil_100(total_calculated),
+        )
+
+
+def iter_equal_principal_payment(start_ordinal: int, principal, num_payments: int, cycle_days: int, annual_interest_rate: float):
+    period_interest_rate = annual_interest_rate / 365 * cycle_days
+    principal_payment = _ceil_100(principal / num_payments)
+
+    for period in range(1, num_payments + 1):
+        interest_payment = _ceil_100(principal * period_interest_rate)
+
+        if period == num_payments:
+            # 마지막 회차에서 남은 모든 원금을 상환
+            principal_payment = _ceil_100(principal)
+
+        principal -= principal_payment
+
+        yield ScheduleRow(
+            period,
+            start_ordinal + period * cycle_days,
+            principal_payment,
+            interest_payment,
+            principal_payment + interest_payment,
+            0 if period == num_payments else _ceil_100(principal),
+        )
+
+
+def iter_bullet_payment(start_ordinal: int, principal, num_payments: int, cycle_days: int, annual_interest_rate: float):
+    # 만기일시상환은 상환 주기와 무관하게 월 이자율 사용
+    interest_payment = _ceil_100(principal * (annual_interest_rate / 12))
+    principal_due = _ceil_100(principal)
+
+    for period in range(1, num_payments + 1):
+        due_date = start_ordinal + period * cycle_days
+        if period == num_payments:
+            yield ScheduleRow(period, due_date, principal_due, interest_payment, principal_due + interest_payment, 0)
+        else:
+            yield ScheduleRow(period, due_date, 0, interest_payment, interest_payment, principal_due)
+
+
+ROW_ITERATORS = {
+    'equal': iter_equal_payment,
+    'equal_principal': iter_equal_principal_payment,
+    'bullet': iter_bullet_payment,
+}
@@ -0,0 +1,244 @@
+import hashlib
+import json
+
+import numpy as np
+
+from src.components.schedule_engine import normalize_method, schedule_columns
+from src.components.schedule_table import ScheduleTable
+
+# 스케줄 생성 엔진 버전 (금액 계산 방식이 바뀌면 올리고 REGENERATORS 에 이전 버전을 남겨 둠)
+ENGINE_VERSION = 1
+# 새로 등록하는 대출의 스케줄을 생성 조건만 저장 (False 이면 기존처럼 loan_schedule 전체 저장)
+COMPACT_SCHEDULE_STORAGE = True
+
+SCHEDULED = 0
+PAID = 1
+# Loan 문서에서 loan_schedule 을 만드는 데 필요한 필드 (전체 저장 방식과 생성 조건 저장 방식 모두 포함)
+SCHEDULE_FIELDS = (
+    'loan_schedule', 'schedule_params', 'engine_version',
+    'schedule_length', 'schedule_status', 'schedule_overrides',
+)
+
+
+def schedule_params(start_date, principal, num_payments: int, cycle_days: int, annual_interest_rate: float, method: str) -> dict:
+    # 스케줄을 다시 만들 수 있는 생성 조건 (Firestore 저장 형식)
+    return {
+        'start_date': str(np.datetime64(start_date, 'D')),
+        'principal': principal,
+        'num_payments': int(num_payments),
+        'cycle_days': int(cycle_days),
+        'annual_interest_rate': float(annual_interest_rate),
+        'method': normalize_method(method),
+    }
+
+
+def schedule_fingerprint(params: dict, engine_version: int = ENGINE_VERSION) -> str:
+    # 생성 조건 + 엔진 버전의 해시 (같으면 재생성한 스케줄도 같음)
+    payload = json.dumps({'params': params, 'engine_version': engine_version}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _regenerate_v1(params: dict) -> list:
+    columns = schedule_columns(
+        params['method'], params['start_date'], params['principal'],
+        params['num_payments'], params['cycle_days'], params['annual_interest_rate'],
+    )
+    return ScheduleTable(columns).to_firestore(status=SCHEDULED)
+
+
+REGENERATORS = {
+    1: _regenerate_v1,
+}
+
+
+def regenerate_schedule(params: dict, engine_version: int = ENGINE_VERSION) -> list:
+    # 저장 당시의 엔진 버전으로 스케줄 재생성 (항상 같은 결과)
+    if engine_version not in REGENERATORS:
+        raise ValueError(f"Unsupported schedule engine version: {engine_version}")
+    return REGENERATORS[engine_version](params)
+
+
+def compact_schedule_fields(params: dict, loan_schedule: list, engine_version: int = ENGINE_VERSION) -> dict:
+    # loan_schedule 전체 대신 저장할 필드
+    # - schedule_status: 상태값이 0(Scheduled) 이 아닌 회차만 {회차: 상태}
+    # - schedule_overrides: 재생성한 값과 다른 항목만 {회차: {필드: 값}} (재계산, 추가 회차 등)
+    base = regenerate_schedule(params, engine_version)
+    status = {}
+    overrides = {}
+    for i, row in enumerate(loan_schedule):
+        key = str(i + 1)
+        if row.get('status', SCHEDULED) != SCHEDULED:
+            status[key] = row['status']
+        expected = base[i] if i < len(base) else {}
+        changed = {name: value for name, value in row.items() if name != 'status' and expected.get(name) != value}
+        if changed:
+            overrides[key] = changed
+
+    return {
+        'schedule_params': params,
+        'engine_version': engine_version,
+        'schedule_fingerprint': schedule_fingerprint(params, engine_version),
+        'schedule_length': len(loan_schedule),
+        'schedule_status': status,
+        'schedule_overrides': overrides,
+    }
+
+
+def expand_schedule(loan_data: dict) -> list:
+    # 생성 조건으로 스케줄을 다시 만들고 상태값과 변경 항목을 반영
+    base = regenerate_schedule(loan_data['schedule_params'], loan_data.get('engine_version', ENGINE_VERSION))
+    length = loan_data.get('schedule_length', len(base))
+    loan_schedule = base[:length] + [{} for _ in range(length - len(base))]
+
+    for key, changed in loan_data.get('schedule_overrides', {}).items():
+        loan_schedule[int(key) - 1].update(changed)
+    for row in loan_schedule:
+        row['status'] = SCHEDULED
+    for key, status in loan_data.get('schedule_status', {}).items():
+        loan_schedule[int(key) - 1]['status'] = status
+    return loan_schedule
+
+
+def load_loan(loan_data: dict) -> dict:
+    # Firestore 에서 읽은 Loan 문서에 loan_schedule 을 채워서 반환 (전체 저장된 기존 문서는 그대로)
+    if loan_data is not None and 'loan_schedule' not in loan_data and 'schedule_params' in loan_data:
+        loan_data['loan_schedule'] = expand_schedule(loan_data)
+    return loan_data
+
+
+def new_schedule_fields(params: dict, loan_schedule: list) -> dict:
+    # 새 대출의 스케줄 저장 필드 (COMPACT_SCHEDULE_STORAGE 설정에 따름)
+    if COMPACT_SCHEDULE_STORAGE:
+        return compact_schedule_fields(params, loan_schedule)
+    return {'loan_schedule': loan_schedule, 'schedule_fingerprint': schedule_fingerprint(params)}
+
+
+def merge_schedule(stored_schedule: list, new_schedule: list) -> list:
+    # 재등록 시 새 스케줄에 기존 상태값을 회차별로 반영
+    # - 상환 완료(1) 회차는 실제 받은 금액이므로 저장된 값을 그대로 유지
+    # - 나머지 회차는 새 금액을 사용하고 상태값(연체 등)만 유지
+    # 새 스케줄이 상환 완료 회차보다 짧으면 받은 상환 기록이 사라지므로 ValueError
+    stored_by_period = {row.get('Period', i + 1): row for i, row in enumerate(stored_schedule)}
+    new_periods = {row.get('Period', i + 1) for i, row in enumerate(new_schedule)}
+    dropped = sorted(
+        period for period, row in stored_by_period.items() if row.get('status') == PAID and period not in new_periods
+    )
+    if dropped:
+        raise ValueError(
+            f"The new schedule has {len(new_schedule)} installments but installment {dropped[-1]} is already paid."
+        )
+    merged = []
+    for i, row in enumerate(new_schedule):
+        stored = stored_by_period.get(row.get('Period', i + 1))
+        if stored is None:
+            merged.append(dict(row))
+        elif stored.get('status') == PAID:
+            merged.append(dict(stored))
+        else:
+            merged.append({**row, 'status': stored.get('status', SCHEDULED)})
+    return merged
+
+
+def changed_periods(stored_schedule: list, new_schedule: list) -> list:
+    # 값이 달라졌거나 추가/삭제된 회차 번호
+    length = max(len(stored_schedule), len(new_schedule))
+    return [
+        i + 1 for i in range(length)
+        if i >= len(stored_schedule) or i >= len(new_schedule) or stored_schedule[i] != new_schedule[i]
+    ]
+
+
+def _field_path(*names) -> str:
+    # 숫자 키('3' 등)는 Firestore 필드 경로에서 `` 로 감싸야 함
+    return '.'.join(name if name.isidentifier() else '`' + name.replace('\\', '\\\\').replace('`', '\\`') + '`' for name in names)
+
+
+def _delete_field():
+    from google.cloud.firestore_v1 import DELETE_FIELD
+    return DELETE_FIELD
+
+
+def reregistration_update(stored_loan_data: dict, params: dict, new_schedule: list) -> dict:
+    # 이미 저장된 대출을 다시 등록할 때의 update 내용
+    # 기존 상태값을 유지한 채 바뀐 회차만 기록하고, 변경이 없으면 빈 dict
+    # 생성 조건이 같으면(fingerprint 동일) 재계산/추가된 회차까지 포함하여 저장된 스케줄을 그대로 둠
+    fingerprint = schedule_fingerprint(params)
+    if stored_loan_data.get('schedule_fingerprint') == fingerprint:
+        return {}
+
+    stored_schedule = load_loan(stored_loan_data).get('loan_schedule', [])
+    merged = merge_schedule(stored_schedule, new_schedule)
+    if not changed_periods(stored_schedule, merged) and not COMPACT_SCHEDULE_STORAGE:
+        return {'schedule_fingerprint': fingerprint}
+
+    if 'schedule_params' not in stored_loan_data:
+        if not COMPACT_SCHEDULE_STORAGE:
+            return {'loan_schedule': merged, 'schedule_fingerprint': fingerprint}
+        # 전체 저장된 기존 문서는 생성 조건 저장 방식으로 변환
+        return {**compact_schedule_fields(params, merged), 'loan_schedule': _delete_field()}
+
+    fields = compact_schedule_fields(params, merged)
+    update = {
+        name: fields[name]
+        for name in ['schedule_params', 'engine_version', 'schedule_fingerprint', 'schedule_length']
+        if stored_loan_data.get(name) != fields[name]
+    }
+    update.update(_period_map_updates(stored_loan_data, fields))
+    return update
+
+
+def _period_map_updates(stored_loan_data: dict, fields: dict) -> dict:
+    # 회차별 맵(schedule_status, schedule_overrides) 은 바뀐 회차만 필드 경로로 기록
+    update = {}
+    for name in ['schedule_status', 'schedule_overrides']:
+        stored_map = stored_loan_data.get(name, {})
+        for key, value in fields[name].items():
+            if stored_map.get(key) != value:
+                update[_field_path(name, key)] = value
+        for key in stored_map:
+            if key not in fields[name]:
+                update[_field_path(name, key)] = _delete_field()
+    return update
+
+
+def schedule_rows_update(loan_data: dict, loan_schedule: list) -> dict:
+    # 저장된 Loan 문서(loan_data) 의 스케줄을 loan_schedule 로 바꾸는 update 내용 (생성 조건은 그대로)
+    # 생성 조건 저장 방식은 바뀐 회차의 필드 경로만 기록하고, 전체 저장된 기존 문서는 loan_schedule 전체를 기록
+    if 'schedule_params' not in loan_data:
+        return {'loan_schedule': loan_schedule}
+    fields = compact_schedule_fields(
+        loan_data['schedule_params'], loan_schedule, loan_data.get('engine_version', ENGINE_VERSION)
+    )
+    update = {}
+    if loan_data.get('schedule_length') != fields['schedule_length']:
+        update['schedule_length'] = fields['schedule_length']
+    update.update(_period_map_updates(loan_data, fields))
+    return update
+
+
+def reregistered_schedule(stored_loan_data: dict, params: dict, new_schedule: list) -> list:
+    # reregistration_update 를 적용한 뒤 저장되어 있는 스케줄
+    stored_schedule = load_loan(dict(stored_loan_data)).get('loan_schedule', [])
+    if stored_loan_data.get('schedule_fingerprint') == schedule_fingerprint(params):
+        return stored_schedule
+    return merge_schedule(stored_schedule, new_schedule)
+
+
+def installment_periods(loan_schedule: list, payment_date: str) -> list:
+    # 상환일이 payment_date 인 회차 번호 (loan_schedule 의 순서, 1 부터)
+    return [i + 1 for i, row in enumerate(loan_schedule) if row.get('Payment Date') == payment_date]
+
+
+def status_update(loan_data: dict, periods, status: int) -> dict:
+    # 회차 상태값을 바꾸는 update 내용
+    # 생성 조건 저장 방식은 schedule_status 의 해당 회차 필드만 기록 (다른 회차와 겹치지 않음)
+    # 전체 저장된 기존 문서는 배열 원소를 지정할 수 없으므로 loan_schedule 전체를 기록
+    if 'schedule_params' not in loan_data:
+        loan_schedule = [dict(row) for row in loan_data.get('loan_schedule', [])]
+        for period in periods:
+            loan_schedule[period - 1]['status'] = status
+        return {'loan_schedule': loan_schedule}
+    return {
+        _field_path('schedule_status', str(period)): status if status != SCHEDULED else _delete_field()
+        for period in periods
+    }
@@ -0,0 +1,78 @@
+import numpy as np
+
+from src.components.schedule_engine import format_dates
+
+AMOUNT_COLUMNS = ['Principal', 'Interest', 'Total', 'Remaining Balance']
+
+
+class ScheduleTable:
+    # pandas 없이 NumPy 열(column) 배열로 보관하는 상환 스케줄
+    # 'Payment Date' 는 datetime64[D], 나머지 열은 int64 배열
+    def __init__(self, columns: dict):
+        self.columns = {}
+        for name, values in columns.items():
+            if name == 'Payment Date':
+                self.columns[name] = np.asarray(values, dtype='datetime64[D]')
+            else:
+                self.columns[name] = np.asarray(values, dtype=np.int64)
+
+    @classmethod
+    def from_records(cls, records: list) -> 'ScheduleTable':
+        # Firestore 의 loan_schedule (dict 리스트) 로부터 생성
+        columns = {'Period': [], 'Payment Date': [], 'status': []}
+        columns.update({name: [] for name in AMOUNT_COLUMNS})
+        for period, record in enumerate(records, start=1):
+            columns['Period'].append(record.get('Period', period))
+            columns['Payment Date'].append(record.get('Payment Date') or 'NaT')
+            columns['status'].append(record.get('status', 0))
+            for name in AMOUNT_COLUMNS:
+                columns[name].append(int(float(record.get(name, 0) or 0)))
+        return cls(columns)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    @property
+    def column_names(self) -> list:
+        return list(self.columns)
+
+    def payment_dates(self, date_format: str = None) -> list:
+        # 'YYYY-MM-DD' 문자열 리스트 (date_format 지정 시 strftime 형식)
+        # 날짜가 없는 회차는 빈 문자열
+        if date_format is None:
+            return [value if value != 'NaT' else '' for value in format_dates(self.columns['Payment Date'])]
+        return [value.strftime(date_format) if value else '' for value in self.columns['Payment Date'].tolist()]
+
+    def select(self, mask: np.ndarray) -> 'ScheduleTable':
+        return ScheduleTable({name: values[mask] for name, values in self.columns.items()})
+
+    def total(self, name: str) -> int:
+        return int(self.columns[name].sum())
+
+    def to_records(self) -> list:
+        names = self.column_names
+        values = [self.payment_dates() if name == 'Payment Date' else self.columns[name].tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def to_firestore(self, status: int = 0) -> list:
+        # loan_schedule 저장 형식 (각 회차에 상태값 추가)
+        records = self.to_records()
+        for record in records:
+            record.setdefault('status', status)
+        return records
+
+    def to_dataframe(self):
+        # pandas 는 필요할 때만 로드
+        import pandas as pd
+
+        data = {name: self.payment_dates() if name == 'Payment Date' else values for name, values in self.columns.items()}
+        return pd.DataFrame(data)
+
+    def __repr__(self):
+        return f"ScheduleTable(rows={len(self)}, columns={self.column_names})"
@@ -7,6 +7,7 @@ from PyQt5.QtGui import QIcon, QStandardItemModel, QStandardItem
 from google.cloud.firestore_v1.base_query import FieldFilter
 
 from src.components import DB
+from src.components.reference_cache import get_references
 
 class SelectLoanWindow(QDialog):
     loan_selected = pyqtSignal(dict)  # Signal to emit selected loan data
@@ -14,6 +15,8 @@ class SelectLoanWindow(QDialog):
     def __init__(self, collection_type='Loan'):
         super(SelectLoanWindow, self).__init__()
 
+        self.customers = {}
+
         # Set window properties
         self.setWindowTitle("Select Loan")
         self.setGeometry(300, 300, 600, 700)
@@ -144,7 +147,8 @@ class SelectLoanWindow(QDialog):
                 # Prepare the data for displaying in the table
                 loan_data = pd.DataFrame(filtered_loans)
 
-                # Add customer information
+                # Add customer information (검색된 대출의 고객을 모아서 한 번에 읽음)
+                self.customers = get_references('Customer', loan_data['uid'].tolist())
                 loan_data['customer_name'], loan_data['nrc_no'] = zip(
                     *loan_data['uid'].apply(self.get_customer_data)
                 )
@@ -162,9 +166,8 @@ class SelectLoanWindow(QDialog):
 
     def get_customer_data(self, customer_uid):
         try:
-            customer_doc = DB.collection('Customer').document(customer_uid).get()
-            if customer_doc.exists:
-                customer_data = customer_doc.to_dict()
+            customer_data = self.customers.get(customer_uid)
+            if customer_data is not None:
                 return customer_data.get('name', 'Unknown'), customer_data.get('nrc_no', 'Unknown')
             else:
                 return 'Unknown', 'Unknown'
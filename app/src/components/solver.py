@@ -0,0 +1,145 @@
+import numpy as np
+
+from src.components.schedule_engine import ceil_100, normalize_method
+
+# 계산기 화면의 최대 상환 횟수
+MAX_PAYMENTS = 1200
+# 최대 원금은 100 kyat 단위로 계산
+PRINCIPAL_STEP = 100
+
+
+def _rate(method: str, cycle_days, annual_interest_rate):
+    # 만기일시상환은 월 이자율, 나머지는 상환 주기(일) 기준 이자율
+    if method == 'bullet':
+        return annual_interest_rate / 12
+    return annual_interest_rate / 365 * cycle_days
+
+
+def installment(principal, num_payments, cycle_days, annual_interest_rate, method: str = 'equal') -> np.ndarray:
+    # 회차별 정기 상환액 (배열 입력 가능)
+    # - 원리금 균등: 매 회차 상환액 (스케줄의 Total 첫 회차와 동일)
+    # - 원금 균등: 첫 회차 상환액 (이후 회차는 줄어들기만 하므로 최대 상환액)
+    # - 만기일시: 매 회차 이자 (만기 원금 일시 상환분 제외)
+    method = normalize_method(method)
+    principal = np.asarray(principal, dtype=np.float64)
+    num_payments = np.asarray(num_payments, dtype=np.int64)
+    rate = _rate(method, np.asarray(cycle_days, dtype=np.int64), np.asarray(annual_interest_rate, dtype=np.float64))
+
+    if method == 'equal':
+        # 무이자이면 schedule_engine.equal_payment_amount 와 같이 원금을 균등 분할
+        growth = (1 + rate) ** num_payments
+        with np.errstate(divide='ignore', invalid='ignore'):
+            amount = np.where(rate == 0, principal / num_payments, principal * rate * growth / (growth - 1))
+        return ceil_100(amount)
+    if method == 'equal_principal':
+        return ceil_100(principal / num_payments) + ceil_100(principal * rate)
+    if method == 'bullet':
+        return ceil_100(principal * rate) + 0 * num_payments
+    raise ValueError(f"Unknown repayment method: {method}")
+
+
+def _bisect_max(feasible, low, high) -> np.ndarray:
+    # feasible(x) 가 참인 최대 정수 x (low <= x <= high, feasible 은 x 에 대해 단조 감소)
+    # 만족하는 값이 없으면 low - 1
+    low = np.asarray(low, dtype=np.int64) - 1
+    high = np.asarray(high, dtype=np.int64)
+    low, high = np.broadcast_arrays(low, high)
+    low, high = low.copy(), high.copy()
+    while True:
+        active = low < high
+        if not active.any():
+            return low
+        middle = low + (high - low + 1) // 2
+        ok = feasible(middle)
+        low = np.where(active & ok, middle, low)
+        high = np.where(active & ~ok, middle - 1, high)
+
+
+def _bisect_min(feasible, low, high) -> np.ndarray:
+    # feasible(x) 가 참인 최소 정수 x (low <= x <= high, feasible 은 x 에 대해 단조 증가)
+    # 만족하는 값이 없으면 high + 1
+    low = np.asarray(low, dtype=np.int64)
+    high = np.asarray(high, dtype=np.int64) + 1
+    low, high = np.broadcast_arrays(low, high)
+    low, high = low.copy(), high.copy()
+    while True:
+        active = low < high
+        if not active.any():
+            return high
+        middle = low + (high - low) // 2
+        ok = feasible(middle)
+        high = np.where(active & ok, middle, high)
+        low = np.where(active & ~ok, middle + 1, low)
+
+
+def max_principal(target_installment, num_payments, cycle_days, annual_interest_rate, method: str = 'equal',
+                  step: int = PRINCIPAL_STEP) -> np.ndarray:
+    # 정기 상환액이 target_installment 이하가 되는 최대 원금 (step 단위, 불가능하면 0)
+    # 닫힌 식으로 상한을 구한 뒤 100 단위 올림 때문에 생기는 차이만 이분 탐색으로 보정
+    # 무이자 만기일시상환은 정기 상환액이 항상 0 이므로 최대 원금이 없음 (ValueError)
+    method = normalize_method(method)
+    target, num_payments, cycle_days, annual_interest_rate = np.broadcast_arrays(
+        np.asarray(target_installment, dtype=np.int64), np.asarray(num_payments, dtype=np.int64),
+        np.asarray(cycle_days, dtype=np.int64), np.asarray(annual_interest_rate, dtype=np.float64),
+    )
+    rate = _rate(method, cycle_days, annual_interest_rate)
+    if method == 'bullet' and (rate == 0).any():
+        raise ValueError("Maximum principal is unbounded for an interest-free bullet loan.")
+    # 올림 전 상환액이 target 을 100 단위로 내림한 값 이하이면 충분
+    affordable = np.floor(target / 100) * 100
+
+    if method == 'equal':
+        growth = (1 + rate) ** num_payments
+        with np.errstate(divide='ignore', invalid='ignore'):
+            estimate = np.where(rate == 0, affordable * num_payments, affordable * (growth - 1) / (rate * growth))
+    elif method == 'equal_principal':
+        estimate = affordable / (1 / num_payments + rate)
+    else:
+        estimate = affordable / rate
+    # 원금 균등은 올림이 두 번 일어나므로 최대 200 kyat 차이를 고려해 탐색 범위를 넓게 잡음
+    high = np.floor(estimate / step).astype(np.int64) + 1
+    low = np.maximum(np.floor((affordable - 200) / np.maximum(affordable, 1) * estimate / step).astype(np.int64) - 1, 0)
+
+    def feasible(units):
+        return installment(units * step, num_payments, cycle_days, annual_interest_rate, method) <= target
+
+    return np.maximum(_bisect_max(feasible, low, high), 0) * step
+
+
+def min_num_payments(target_installment, principal, cycle_days, annual_interest_rate, method: str = 'equal',
+                     max_payments: int = MAX_PAYMENTS) -> np.ndarray:
+    # 정기 상환액이 target_installment 이하가 되는 최소 상환 횟수 (max_payments 안에서 불가능하면 0)
+    # 만기일시상환은 상환 횟수와 상환액(이자)이 무관하므로 가능하면 1
+    method = normalize_method(method)
+    target, principal, cycle_days, annual_interest_rate = np.broadcast_arrays(
+        np.asarray(target_installment, dtype=np.int64), np.asarray(principal, dtype=np.float64),
+        np.asarray(cycle_days, dtype=np.int64), np.asarray(annual_interest_rate, dtype=np.float64),
+    )
+    rate = _rate(method, cycle_days, annual_interest_rate)
+
+    low = np.ones(target.shape, dtype=np.int64)
+    high = np.full(target.shape, max_payments, dtype=np.int64)
+    if method == 'equal':
+        # 연금 공식의 역함수 n = -ln(1 - P r / A) / ln(1 + r) 로 탐색 범위를 좁힘 (무이자이면 n = P / A)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            estimate = np.where(
+                rate == 0,
+                principal / np.maximum(target, 1),
+                -np.log(1 - principal * rate / np.maximum(target, 1)) / np.log1p(rate),
+            )
+        reachable = np.isfinite(estimate)
+        estimate = np.clip(np.where(reachable, np.ceil(estimate), max_payments), 1, max_payments).astype(np.int64)
+        low = np.maximum(estimate - 2, 1)
+        high = np.minimum(estimate + 2, max_payments)
+        low = np.where(reachable, low, max_payments)
+
+    def feasible(num_payments):
+        return installment(principal, num_payments, cycle_days, annual_interest_rate, method) <= target
+
+    result = _bisect_min(feasible, low, high)
+    # 좁힌 범위 밖에 답이 있는 경우(부동소수점 오차)는 전체 범위로 다시 탐색
+    retry = (result > high) | ((result == low) & (low > 1) & feasible(np.maximum(low - 1, 1)))
+    if retry.any():
+        full = _bisect_min(feasible, np.ones(target.shape, dtype=np.int64), np.full(target.shape, max_payments, dtype=np.int64))
+        result = np.where(retry, full, result)
+    return np.where(result > max_payments, 0, result)
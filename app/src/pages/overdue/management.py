@@ -6,6 +6,7 @@ from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor, QIcon
 from PyQt5.QtCore import Qt, QDate
 
 from src.components import DB
+from src.components.reference_cache import get_reference, get_references
 from src.components.select_loan import SelectLoanWindow
 
 class OverdueManagementApp(QMainWindow):
@@ -40,7 +41,7 @@ class OverdueManagementApp(QMainWindow):
     def load_loan_data(self, selected_data):
         loan_data = DB.collection('Overdue').document(selected_data['loan_id']).get().to_dict()
         self.current_loan_data = loan_data
-        customer_data = DB.collection('Customer').document(loan_data['uid']).get().to_dict()
+        customer_data = get_reference('Customer', loan_data['uid'])
         self.loanNumber.setText(loan_data['loan_number'])
         self.customerName.setText(customer_data['name'])
         self.load_loan_schedule(loan_data['loan_schedule'], loan_data.get('received_schedule', []))
@@ -50,12 +51,14 @@ class OverdueManagementApp(QMainWindow):
             model = QStandardItemModel(len(guarantor_uids), 3)
             model.setHorizontalHeaderLabels(["Name", "Date of Birth", "Contact"])
 
+            # 보증인 문서를 한 번에 읽어 둠
+            guarantors = get_references('Guarantor', guarantor_uids)
+
             # Loop through each guarantor UID and fetch the details from the Guarantor collection
             for row_idx, guarantor_uid in enumerate(guarantor_uids):
                 try:
-                    guarantor_doc = DB.collection('Guarantor').document(guarantor_uid).get()
-                    if guarantor_doc.exists:
-                        guarantor_data = guarantor_doc.to_dict()
+                    guarantor_data = guarantors.get(guarantor_uid)
+                    if guarantor_data is not None:
 
                         model.setItem(row_idx, 0, QStandardItem(guarantor_data.get("name", "Unknown")))
                         model.setItem(row_idx, 1, QStandardItem(guarantor_data.get("date_of_birth", "Unknown")))
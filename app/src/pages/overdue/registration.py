@@ -1,12 +1,18 @@
 import sys
 import os
 from datetime import datetime
+
+import numpy as np
 from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
 from PyQt5.QtCore import Qt, QDate
 from PyQt5 import uic
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIntValidator, QIcon, QColor
 
 from src.components import DB
+from src.components.reference_cache import get_reference, get_references
+from src.components.schedule_storage import load_loan
+from src.components.overdue_accrual import overdue_interest
+from src.components.schedule_table import ScheduleTable
 from src.components.select_loan import SelectLoanWindow
 
 class OverdueRegistrationApp(QMainWindow):
@@ -42,7 +48,7 @@ class OverdueRegistrationApp(QMainWindow):
         loan_ref = DB.collection('Loan')
         loan_id = selected_data['loan_id']
         loan_doc = loan_ref.document(loan_id).get()
-        loan_data = loan_doc.to_dict()
+        loan_data = load_loan(loan_doc.to_dict())
         self.loan_data = loan_data
     
         self.customerLoanNumber.setText(loan_data['loan_number'])
@@ -53,7 +59,7 @@ class OverdueRegistrationApp(QMainWindow):
         self.contractDate.setText(loan_data['contract_date'])
         self.loanStatus.setText(loan_data['loan_status'])
         self.loanType.setText(loan_data['loan_type'])
-        officer_data = DB.collection('Officer').document(loan_data['loan_officer']).get().to_dict()
+        officer_data = get_reference('Officer', loan_data['loan_officer'])
         self.loan_data['officer_name'] = officer_data['name']
         self.loanOfficer.setText(officer_data['name'])
         self.cpNumber.setText(loan_data['cp_number'])
@@ -65,28 +71,27 @@ class OverdueRegistrationApp(QMainWindow):
         self.repaymentMethod.setText(loan_data['repayment_method'])
 
         if 'loan_schedule' in loan_data:
-            schedule_data = loan_data['loan_schedule']
-            columns = ["Payment Date", "Principal", "Interest", "Total", "Status"]
+            schedule = ScheduleTable.from_records(loan_data['loan_schedule'])
 
             # Separate scheduled and received payments
-            repayment_data = [item for item in schedule_data if item.get('status') in [0, 2]]  # Scheduled and Overdue payments
-            received_data = [item for item in schedule_data if item.get('status') == 1]  # Only Paid payments
+            repayment_data = schedule.select(np.isin(schedule['status'], [0, 2]))  # Scheduled and Overdue payments
+            received_data = schedule.select(schedule['status'] == 1)  # Only Paid payments
 
             # Load the tables and pass the appropriate flag for totals
-            self.load_table(self.repaymentScheduleTable, repayment_data, columns, is_scheduled=True)
-            self.load_table(self.receivedTable, received_data, columns, is_scheduled=False)
+            self.load_table(self.repaymentScheduleTable, repayment_data, is_scheduled=True)
+            self.load_table(self.receivedTable, received_data, is_scheduled=False)
 
         if 'guarantors' in loan_data:
             guarantor_uids = loan_data['guarantors']  # List of UID values
             model = QStandardItemModel(len(guarantor_uids), 3)
             model.setHorizontalHeaderLabels(["Name", "Date of Birth", "Contact"])
+            guarantors = get_references('Guarantor', guarantor_uids)
 
             # Loop through each guarantor UID and fetch the details from the Guarantor collection
             for row_idx, guarantor_uid in enumerate(guarantor_uids):
                 try:
-                    guarantor_doc = DB.collection('Guarantor').document(guarantor_uid).get()
-                    if guarantor_doc.exists:
-                        guarantor_data = guarantor_doc.to_dict()
+                    guarantor_data = guarantors.get(guarantor_uid)
+                    if guarantor_data is not None:
 
                         model.setItem(row_idx, 0, QStandardItem(guarantor_data.get("name", "Unknown")))
                         model.setItem(row_idx, 1, QStandardItem(guarantor_data.get("date_of_birth", "Unknown")))
@@ -117,33 +122,30 @@ class OverdueRegistrationApp(QMainWindow):
                 self.collateralTable.setModel(model)
                 self.collateralTable.resizeColumnsToContents()
 
-    def load_table(self, table_view, data, columns, is_scheduled=True):
-        model = QStandardItemModel(len(data), len(columns))
+    def load_table(self, table_view, schedule: ScheduleTable, is_scheduled=True):
+        columns = ["Payment Date", "Principal", "Interest", "Total", "Status"]
+        model = QStandardItemModel(len(schedule), len(columns))
         model.setHorizontalHeaderLabels(columns)
 
         status_mapping = {0: 'Scheduled', 1: 'Paid', 2: 'Overdue'}
-        total_sum = 0  
-        principal_sum = 0  
-        interest_sum = 0  
-        overdue_interest_sum = 0  
-
-        for row_idx, item in enumerate(data):
-            status = item.get("status", 0)
-            is_overdue = status == 2
 
-            for col_idx, column_name in enumerate(columns):
-                item_value = item.get(column_name, "")
+        payment_dates = schedule.payment_dates()
+        statuses = schedule['status'].tolist()
+        principals = schedule['Principal'].tolist()
+        interests = schedule['Interest'].tolist()
+        totals = schedule['Total'].tolist()
 
-                if column_name in ["Principal", "Interest", "Total"] and item_value != "":
-                    item_value = "{:,}".format(int(float(item_value)))  
-                    if column_name == "Total":  
-                        total_sum += int(item.get(column_name, 0))
-                    elif column_name == "Principal":  
-                        principal_sum += int(item.get(column_name, 0))
-                    elif column_name == "Interest":  
-                        interest_sum += int(item.get(column_name, 0))
+        for row_idx, status in enumerate(statuses):
+            is_overdue = status == 2
 
-                item_value_obj = self.create_read_only_item(item_value)
+            row_values = [
+                payment_dates[row_idx],
+                "{:,}".format(principals[row_idx]),
+                "{:,}".format(interests[row_idx]),
+                "{:,}".format(totals[row_idx]),
+            ]
+            for col_idx, value in enumerate(row_values):
+                item_value_obj = self.create_read_only_item(value)
 
                 if is_overdue:
                     item_value_obj.setForeground(QColor(Qt.red))
@@ -156,25 +158,24 @@ class OverdueRegistrationApp(QMainWindow):
             if is_overdue:
                 status_item.setForeground(QColor(Qt.red))
 
-                payment_date_str = item.get("Payment Date", "")
-                if payment_date_str:
-                    payment_date = datetime.strptime(payment_date_str, "%Y-%m-%d")
-                    current_date = datetime.now()
-
-                    overdue_days = (current_date - payment_date).days 
-                    if overdue_days > 0:
-                        principal_amount = int(item.get("Principal", 0))
-                        interest_amount = int(item.get("Interest", 0))
-                        total_amount = principal_amount + interest_amount
-                        overdue_interest_rate = float(self.loan_data.get("interest_rate", 0))
-                        overdue_interest = self.overdue_interest(total_amount, overdue_days, overdue_interest_rate)
-                        overdue_interest_sum += overdue_interest  
-
             model.setItem(row_idx, 4, status_item)
 
         table_view.setModel(model)
         table_view.resizeColumnsToContents()
 
+        # 연체 회차의 연체 이자를 한 번에 계산
+        overdue = schedule['status'] == 2
+        overdue_interest_sum = int(overdue_interest(
+            schedule['Principal'][overdue] + schedule['Interest'][overdue],
+            schedule['Payment Date'][overdue],
+            float(self.loan_data.get("interest_rate", 0)),
+            np.datetime64(datetime.now(), 'D'),
+        ).sum())
+
+        total_sum = schedule.total('Total')
+        principal_sum = schedule.total('Principal')
+        interest_sum = schedule.total('Interest')
+
         total_sum_formatted = "{:,.0f}".format(total_sum)
         principal_sum_formatted = "{:,.0f}".format(principal_sum)
         interest_sum_formatted = "{:,.0f}".format(interest_sum)
@@ -195,10 +196,6 @@ class OverdueRegistrationApp(QMainWindow):
         item.setFlags(item.flags() & ~Qt.ItemIsEditable)
         return item
     
-    def overdue_interest(self, amount: int, overdue_days: int, overdue_interest_rate: float) -> int:
-        overdue_interest = amount * (overdue_interest_rate / 100 / 365 * overdue_days)
-        return round(overdue_interest)
-    
     def on_mark_as_overdue_button_clicked(self):
         if self.loan_data is not None:
             self.post_registration_window = OverduePostRegistrationApp(self.loan_data, self)  # self를 넘겨줌
@@ -5,6 +5,7 @@ from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIcon
 import os
 import traceback
 from src.components import DB  # Firestore 연결을 위한 모듈
+from src.components.reference_cache import get_reference
 
 class OverdueSearchApp(QMainWindow):
     def __init__(self):
@@ -85,11 +86,9 @@ class OverdueSearchApp(QMainWindow):
         Customer DB에서 customer_id를 사용하여 customer_name과 nrc_no를 가져오는 함수
         """
         try:
-            customer_ref = DB.collection('Customer').document(customer_id)
-            customer_doc = customer_ref.get()
+            customer_data = get_reference('Customer', customer_id)
 
-            if customer_doc.exists:
-                customer_data = customer_doc.to_dict()
+            if customer_data is not None:
                 return customer_data.get("name", ""), customer_data.get("nrc_no", "")
             else:
                 return "", ""
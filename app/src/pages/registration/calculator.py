@@ -2,13 +2,13 @@ import sys
 import os
 from datetime import datetime
 
-import pandas as pd
 from PyQt5 import uic
 from PyQt5.QtWidgets import QApplication, QMainWindow
 from PyQt5.QtGui import QIntValidator, QDoubleValidator, QStandardItemModel, QStandardItem, QIcon
 from PyQt5.QtCore import Qt
 
 from src.components.loan_calculator import LoanCalculator
+from src.components.schedule_table import ScheduleTable
 
 class CalculatorApp(QMainWindow):
     def __init__(self):
@@ -25,6 +25,9 @@ class CalculatorApp(QMainWindow):
         self.show()
 
         self.calculateButton.clicked.connect(self.calculate)
+        # 세 가지 상환 방식을 한 번에 계산해 두고 상환 방식 변경 시 다시 계산하지 않음
+        self.quotes = None
+        self.paymentType.currentIndexChanged.connect(self.display_selected_quote)
 
         self.principal.setValidator(QDoubleValidator(0.0, 99999999.99, 2, self))
         self.interestRate.setValidator(QDoubleValidator(0.0, 100.0, 2, self))
@@ -37,45 +40,55 @@ class CalculatorApp(QMainWindow):
             interest_rate = float(self.interestRate.text()) / 100  # Convert percentage to decimal
             num_payments = int(self.numberOfRepayment.text())
             cycle_days = int(self.repaymentCycle.text())
-            payment_type = self.paymentType.currentText().lower().replace(' ', '')
 
             loan_calculator = LoanCalculator(datetime.now(), principal, num_payments, cycle_days, interest_rate)
-            
-            if payment_type == 'equal':
-                result_df = loan_calculator.equal_payment()
-            elif payment_type == 'equalprincipal':
-                result_df = loan_calculator.equal_principal_payment()
-            elif payment_type == 'bullet':
-                result_df = loan_calculator.bullet_payment()
-
-            self.display_result(result_df)
+            self.quotes = loan_calculator.compare_methods()
+            self.display_selected_quote()
+            self.display_comparison()
 
         except ValueError:
             print("Invalid input. Please enter numeric values.")
+        except ArithmeticError:
+            # 상환 횟수 0 등 스케줄을 만들 수 없는 조건
+            print("Invalid input. Number of repayments must be at least 1.")
+
+    def display_selected_quote(self):
+        if self.quotes is None:
+            return
+        payment_type = self.paymentType.currentText().lower().replace(' ', '')
+        methods = {'equal': 'equal', 'equalprincipal': 'equal_principal', 'bullet': 'bullet'}
+        self.display_result(self.quotes[methods[payment_type]]['schedule'])
+
+    def display_comparison(self):
+        labels = {'equal': 'Equal', 'equal_principal': 'Equal Principal', 'bullet': 'Bullet'}
+        summaries = [
+            f"{labels[method]}: interest {quote['total_interest']:,} / first {quote['first_installment']:,}"
+            f" / last {quote['last_installment']:,} / max {quote['max_installment']:,}"
+            for method, quote in self.quotes.items()
+        ]
+        self.statusBar().showMessage('   |   '.join(summaries))
+
+    def display_result(self, table: ScheduleTable):
+        vertical_header = [str(i) for i in table['Period'].tolist()]
+        columns = ['Payment Date', 'Principal', 'Interest', 'Total', 'Remaining Balance']
 
-    def display_result(self, df: pd.DataFrame):
-        vertical_header = [str(i) for i in df['Period'].values]
-        df = df.drop(columns=['Period'])
-        
         def format_number(value):
-            try:
-                return "{:,}".format(int(value))
-            except ValueError:
-                return value
-        
-        for column in df.columns:
-            df[column] = df[column].apply(format_number)
-        
-        model = QStandardItemModel(df.shape[0], df.shape[1])
-        model.setHorizontalHeaderLabels(df.columns.tolist())
+            return "{:,}".format(int(value))
+
+        column_values = [table.payment_dates()] + [
+            [format_number(value) for value in table[column].tolist()] for column in columns[1:]
+        ]
+
+        model = QStandardItemModel(len(table), len(columns))
+        model.setHorizontalHeaderLabels(columns)
         model.setVerticalHeaderLabels(vertical_header)
-        
-        for row in range(df.shape[0]):
-            for col in range(df.shape[1]):
-                item = QStandardItem(df.iat[row, col])
+
+        for col, values in enumerate(column_values):
+            for row, value in enumerate(values):
+                item = QStandardItem(value)
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make the item non-editable
                 model.setItem(row, col, item)
-        
+
         self.resultTable.setModel(model)
         self.resultTable.resizeColumnsToContents()
 
@@ -8,6 +8,7 @@ from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import Qt
 
 from src.components import DB, storageBucket
+from src.components.reference_cache import invalidate_reference
 
 class RegistrationCustomerApp(QMainWindow):
     def __init__(self):
@@ -288,6 +289,7 @@ class RegistrationCustomerApp(QMainWindow):
                 DB.collection('Customer').document(customer_uid).update({"image_url": image_url})
 
             DB.collection('Customer').document(customer_uid).update(customer_data)
+            invalidate_reference('Customer', customer_uid)
 
             QMessageBox.information(self, "Success", "Customer data saved successfully.")
             self.clear_fields()
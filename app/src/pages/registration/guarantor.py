@@ -5,6 +5,7 @@ from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QFileDialog,
 from PyQt5 import uic, QtCore
 from PyQt5.QtGui import QPixmap, QIcon, QIntValidator
 from src.components import DB, storageBucket
+from src.components.reference_cache import invalidate_reference
 
 class RegistrationGuarantorApp(QMainWindow):
     def __init__(self):
@@ -284,6 +285,7 @@ class RegistrationGuarantorApp(QMainWindow):
                 DB.collection('Guarantor').document(guarantor_uid).update({"image_url": image_url})
 
             DB.collection('Guarantor').document(guarantor_uid).update(guarantor_data)
+            invalidate_reference('Guarantor', guarantor_uid)
 
             QMessageBox.information(self, "Success", "Guarantor data saved successfully.")
             self.clear_fields()
@@ -9,6 +9,9 @@ from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIcon
 
 from src.components import DB
 from src.components.loan_calculator import LoanCalculator
+from src.components.due_index import mark_due_index_stale, write_due_index
+from src.components.schedule_storage import load_loan, new_schedule_fields, reregistered_schedule, reregistration_update, schedule_params
+from src.components.schedule_table import ScheduleTable
 from src.components.select_customer import SelectCustomerWindow
 from src.components.select_loan_officer import SelectLoanOfficerWindow
 from src.components.select_guarantors import SelectGuarantorWindow
@@ -265,16 +268,16 @@ class RegistrationLoanApp(QMainWindow):
             )
 
             if repayment_method == "equal":
-                self.schedule_df = calculator.equal_payment()
+                self.schedule_table = calculator.equal_payment()
             elif repayment_method == "equal principal":
-                self.schedule_df = calculator.equal_principal_payment()
+                self.schedule_table = calculator.equal_principal_payment()
             elif repayment_method == "bullet":
-                self.schedule_df = calculator.bullet_payment()
+                self.schedule_table = calculator.bullet_payment()
             else:
                 QMessageBox.critical(self, "Error", "Invalid loan type selected.")
                 return False
 
-            self.display_schedule(self.schedule_df)
+            self.display_schedule(self.schedule_table)
             self.loanNewButton.setEnabled(True)
             return True
 
@@ -286,49 +289,30 @@ class RegistrationLoanApp(QMainWindow):
             QMessageBox.critical(self, "Error", f"An unexpected error occurred: {e}")
             return False
     
-    def display_schedule(self, df: pd.DataFrame):
-        df = df.copy()
-
-        if 'Remaining Balance' in df.columns:
-            df = df.drop(columns=['Remaining Balance'])
-
-        if 'Total' in df['Payment Date'].values:
-            df = df[df['Payment Date'] != 'Total']
-
+    def display_schedule(self, table: ScheduleTable):
         # 'Payment Date'에 요일 추가
-        df['Payment Date'] = pd.to_datetime(df['Payment Date']).dt.strftime('%Y-%m-%d (%A)')
-
-        vertical_header = [str(i) for i in df['Period'].values]
-        df_loan_table = df.drop(columns=['Period'])
-        df = df.drop(columns=['Period'])
+        payment_dates = table.payment_dates('%Y-%m-%d (%A)')
+        vertical_header = [str(i) for i in table['Period'].tolist()]
+        columns = ['Payment Date', 'Principal', 'Interest', 'Total']
 
         def format_number(value):
-            try:
-                return "{:,}".format(int(value))
-            except ValueError:
-                return value
+            return "{:,}".format(int(value))
 
-        total_principal = df['Principal'].sum()
-        total_interest = df['Interest'].sum()
-        total_remaining_balance = df['Total'].sum()
+        self.totalPrincipal.setText(f"{format_number(table.total('Principal'))}")
+        self.totalInterest.setText(f"{format_number(table.total('Interest'))}")
+        self.totalRemainingBalance.setText(f"{format_number(table.total('Total'))}")
 
-        self.totalPrincipal.setText(f"{format_number(total_principal)}")
-        self.totalInterest.setText(f"{format_number(total_interest)}")
-        self.totalRemainingBalance.setText(f"{format_number(total_remaining_balance)}")
+        column_values = [payment_dates] + [
+            [format_number(value) for value in table[column].tolist()] for column in columns[1:]
+        ]
 
-        for column in df_loan_table.columns:
-            df_loan_table[column] = df_loan_table[column].apply(format_number)
-
-        for column in df.columns:
-            df[column] = df[column].apply(format_number)
-
-        model_loan_table = QStandardItemModel(df_loan_table.shape[0], df_loan_table.shape[1])
-        model_loan_table.setHorizontalHeaderLabels(df_loan_table.columns.tolist())
+        model_loan_table = QStandardItemModel(len(table), len(columns))
+        model_loan_table.setHorizontalHeaderLabels(columns)
         model_loan_table.setVerticalHeaderLabels(vertical_header)
 
-        for row in range(df_loan_table.shape[0]):
-            for col in range(df_loan_table.shape[1]):
-                item = QStandardItem(df_loan_table.iat[row, col])
+        for col, values in enumerate(column_values):
+            for row, value in enumerate(values):
+                item = QStandardItem(value)
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)
                 model_loan_table.setItem(row, col, item)
 
@@ -357,11 +341,17 @@ class RegistrationLoanApp(QMainWindow):
         }
 
         # Handle loan schedule data if present
-        if hasattr(self, 'schedule_df'):
-            loan_schedule = self.schedule_df.to_dict(orient="records")
-            for schedule_item in loan_schedule:
-                schedule_item['status'] = 0
-            loan_info["loan_schedule"] = loan_schedule
+        loan_schedule = None
+        if hasattr(self, 'schedule_table'):
+            loan_schedule = self.schedule_table.to_firestore(status=0)
+            params = schedule_params(
+                self.contractDate.date().toPyDate(),
+                int(self.loanAmount.text()),
+                int(self.numberOfRepayment.text()),
+                int(self.repaymentCycle.text()),
+                float(self.interestRate.text()) / 100,
+                self.repaymentMethod.currentText(),
+            )
 
         try:
             if self.existing_loan_id:
@@ -379,12 +369,28 @@ class RegistrationLoanApp(QMainWindow):
                     if "guarantors" in existing_data:
                         loan_info["guarantors"] = existing_data["guarantors"]
 
+                previous_schedule = load_loan(dict(existing_data)).get('loan_schedule', []) if existing_data else []
+                indexed_schedule = previous_schedule
+                if loan_schedule is not None:
+                    if existing_data:
+                        # 기존 스케줄과 비교하여 바뀐 회차만 저장 (상환 완료 / 연체 상태 유지)
+                        loan_info.update(reregistration_update(existing_data, params, loan_schedule))
+                        indexed_schedule = reregistered_schedule(existing_data, params, loan_schedule)
+                    else:
+                        loan_info.update(new_schedule_fields(params, loan_schedule))
+                        indexed_schedule = loan_schedule
+
                 # Update the document with the new information
                 loan_info["loan_id"] = self.existing_loan_id  # Save the loan_id field
                 loan_ref.update(loan_info)
 
+                # 상환 예정 색인도 함께 갱신 (고객, 대출 번호, 스케줄 변경 반영)
+                index_saved = self.save_due_index(self.existing_loan_id, loan_info, indexed_schedule, len(previous_schedule))
+
             else:
                 # If this is a new loan, create a new document
+                if loan_schedule is not None:
+                    loan_info.update(new_schedule_fields(params, loan_schedule))
                 doc_ref = DB.collection("Loan").add(loan_info)
                 self.existing_loan_id = doc_ref[1].id  # Store the generated document ID
 
@@ -392,11 +398,36 @@ class RegistrationLoanApp(QMainWindow):
                 loan_info["loan_id"] = self.existing_loan_id
                 DB.collection("Loan").document(self.existing_loan_id).update({"loan_id": self.existing_loan_id})
 
-            QMessageBox.information(self, "Success", "Loan information saved successfully.")
+                # 상환 예정 색인 생성
+                index_saved = self.save_due_index(self.existing_loan_id, loan_info, loan_schedule or [])
 
+            if index_saved:
+                QMessageBox.information(self, "Success", "Loan information saved successfully.")
+
+        except ValueError as e:
+            # 상환 완료 회차보다 짧은 스케줄로 재등록 등 (저장하지 않음)
+            QMessageBox.warning(self, "Warning", f"The loan was not saved: {e}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred while saving the loan: {e}")
 
+    def save_due_index(self, loan_id, loan_data, loan_schedule, previous_length=0) -> bool:
+        # 대출은 이미 저장되었으므로 색인 기록이 실패해도 저장 실패로 표시하지 않고 경고만 표시
+        # (색인을 사용하지 않도록 표시해 두고, 다음 backfill 까지 batch 화면은 Loan 전체를 읽음)
+        try:
+            write_due_index(DB, loan_id, loan_data, loan_schedule, previous_length)
+            return True
+        except Exception as e:
+            try:
+                mark_due_index_stale(DB)
+            except Exception:
+                pass
+            QMessageBox.warning(
+                self, "Warning",
+                f"Loan information was saved, but the repayment index could not be updated: {e}\n"
+                "Run the due index backfill to rebuild it."
+            )
+            return False
+
     def update_other_tabs(self):
         self.guarantorLoanNumber.setText(self.loanNumber.text())
         self.collateralLoanNumber.setText(self.loanNumber.text())
@@ -5,6 +5,11 @@ from PyQt5.QtCore import Qt, QDate
 from PyQt5 import uic, QtCore
 
 from src.components import DB  # Firestore DB를 사용한다고 가정
+from src.components.reference_cache import get_reference, get_references
+from src.components.due_index import due_index_ready, query_due, schedule_row
+from src.components.field_projection import BATCH_REPAYMENT_FIELDS, stream_fields
+from src.components.installment_status import OVERDUE, PAID, SCHEDULED, set_installment_status
+from src.components.schedule_storage import load_loan
 from src.pages.repayment.details import RepaymentDetailsWindow
 
 class RepaymentBatchApp(QMainWindow):
@@ -56,53 +61,60 @@ class RepaymentBatchApp(QMainWindow):
         schedules_to_add = []  # 스케줄 데이터를 담을 리스트
 
         try:
-            loans_ref = DB.collection('Loan')
-            loans = loans_ref.stream()
-
             self.repaymentScheduleTable.model().removeRows(0, self.repaymentScheduleTable.model().rowCount())
 
-            for loan_doc in loans:
-                loan_data = loan_doc.to_dict()
-                loan_schedule = loan_data.get("loan_schedule", [])
-                customer_uid = loan_data.get('uid')  # Get customer UID from the loan
-                loan_number = loan_data.get('loan_number', 'Unknown')  # Get loan number
+            if due_index_ready(DB):
+                # 상환 예정 색인에서 기간 내 회차만 조회
+                due_schedules = [
+                    (schedule_row(entry), entry.get('uid'), entry.get('loan_number', 'Unknown'), entry['loan_id'], entry['period'])
+                    for entry in query_due(DB, start_date, end_date)
+                ]
+            else:
+                due_schedules = self.scan_due_schedules(start_date, end_date)
+
+            # 대출마다 고객을 따로 읽지 않고 필요한 고객을 모아서 한 번에 읽음
+            customers = get_references('Customer', [customer_uid for _, customer_uid, _, _, _ in due_schedules])
 
+            for schedule, customer_uid, loan_number, loan_id, period in due_schedules:
                 # Get the customer name from the Customer collection using the UID
-                customer_doc = DB.collection('Customer').document(customer_uid).get()
-                customer_name = customer_doc.to_dict().get('name', '') if customer_doc.exists else 'Unknown'
-
-                for schedule in loan_schedule:
-                    payment_date = schedule.get("Payment Date", "")
-                    if start_date <= payment_date <= end_date:
-                        schedules_to_add.append((schedule, customer_uid, customer_name, loan_number))  # Add schedule with loan number
+                customer_data = customers.get(customer_uid)
+                customer_name = customer_data.get('name', '') if customer_data is not None else 'Unknown'
+                schedules_to_add.append((schedule, customer_uid, customer_name, loan_number, (loan_id, period)))  # Add schedule with loan number
 
             # Payment Date 기준으로 스케줄 정렬
             schedules_to_add.sort(key=lambda x: x[0].get("Payment Date", ""))
 
             # 정렬된 스케줄 데이터를 테이블에 추가
-            for schedule, customer_uid, customer_name, loan_number in schedules_to_add:
-                self.add_schedule_to_table(schedule, customer_uid, customer_name, loan_number)
+            for schedule, customer_uid, customer_name, loan_number, installment in schedules_to_add:
+                self.add_schedule_to_table(schedule, customer_uid, customer_name, loan_number, installment)
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load repayment schedules: {e}")
 
+    def scan_due_schedules(self, start_date, end_date):
+        # 색인을 사용하지 않을 때: Loan 전체에서 기간 내 회차를 걸러냄 (스케줄 표시에 필요한 필드만 읽음)
+        due_schedules = []
+        for loan_doc in stream_fields(DB.collection('Loan'), BATCH_REPAYMENT_FIELDS):
+            loan_data = load_loan(loan_doc.to_dict())
+            customer_uid = loan_data.get('uid')  # Get customer UID from the loan
+            loan_number = loan_data.get('loan_number', 'Unknown')  # Get loan number
+
+            for i, schedule in enumerate(loan_data.get("loan_schedule", [])):
+                payment_date = schedule.get("Payment Date", "")
+                if start_date <= payment_date <= end_date:
+                    due_schedules.append((schedule, customer_uid, loan_number, loan_doc.id, i + 1))
+        return due_schedules
+
     # loan_number 매개변수를 추가하여 Loan Number를 테이블에 추가
-    def add_schedule_to_table(self, schedule, customer_uid, customer_name, loan_number):
+    # installment 는 (Loan 문서 ID, 회차), 상태값 변경 시 사용하도록 Loan Number 항목에 저장
+    def add_schedule_to_table(self, schedule, customer_uid, customer_name, loan_number, installment):
         model = self.repaymentScheduleTable.model()
 
         principal = "{:,}".format(schedule.get("Principal", 0))
         interest = "{:,}".format(schedule.get("Interest", 0))
         total = "{:,}".format(schedule.get("Total", 0))
 
-        status_code = schedule.get("status", "")
-        if status_code == 0:
-            status_text = "Scheduled"
-        elif status_code == 1:
-            status_text = "Paid"
-        elif status_code == 2:
-            status_text = "Overdue"
-        else:
-            status_text = ""
+        status_text = self.status_text(schedule.get("status", ""))
 
         # Add items to the row (including hidden uid)
         items = [
@@ -115,6 +127,7 @@ class RepaymentBatchApp(QMainWindow):
             QStandardItem(total),
             QStandardItem(status_text),
         ]
+        items[2].setData(installment, Qt.UserRole)
 
         if status_text == "Overdue":
             for item in items:
@@ -128,6 +141,28 @@ class RepaymentBatchApp(QMainWindow):
         # Hide the UID column (which is the first column)
         self.repaymentScheduleTable.setColumnHidden(0, True)
 
+    def status_text(self, status_code):
+        if status_code == SCHEDULED:
+            return "Scheduled"
+        elif status_code == PAID:
+            return "Paid"
+        elif status_code == OVERDUE:
+            return "Overdue"
+        return ""
+
+    def post_installment_status(self, selected_row, status_code):
+        # 선택한 회차의 상태값만 변경하고 화면 전체를 다시 읽지 않고 해당 행만 갱신
+        model = self.repaymentScheduleTable.model()
+        loan_id, period = model.index(selected_row, 2).data(Qt.UserRole)
+        set_installment_status(DB, loan_id, [period], status_code)
+
+        status_text = self.status_text(status_code)
+        color = Qt.red if status_text == "Overdue" else Qt.black
+        model.item(selected_row, 7).setText(status_text)
+        for column in range(model.columnCount()):
+            model.item(selected_row, column).setForeground(QBrush(color))
+        self.on_table_clicked(model.index(selected_row, 7))
+
     def on_table_clicked(self, index):
         if index.isValid():
             selected_row = index.row()
@@ -161,25 +196,11 @@ class RepaymentBatchApp(QMainWindow):
         selected_row = selected_indexes[0].row()
         model = self.repaymentScheduleTable.model()
 
-        loan_number = model.index(selected_row, 2).data()  # Loan Number는 2번째 열
         payment_date = model.index(selected_row, 1).data()
 
         try:
-            loans_ref = DB.collection('Loan').where('loan_number', '==', loan_number).get()
-
-            if loans_ref:
-                loan_doc = loans_ref[0]
-                loan_data = loan_doc.to_dict()
-                loan_schedule = loan_data.get("loan_schedule", [])
-
-                for schedule in loan_schedule:
-                    if schedule.get("Payment Date") == payment_date:
-                        schedule['status'] = 1  # 상태를 Paid로 변경
-
-                DB.collection('Loan').document(loan_doc.id).update({"loan_schedule": loan_schedule})
-
-                QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as paid.")
-                self.on_search_clicked()
+            self.post_installment_status(selected_row, PAID)
+            QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as paid.")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update payment status: {e}")
@@ -193,25 +214,11 @@ class RepaymentBatchApp(QMainWindow):
         selected_row = selected_indexes[0].row()
         model = self.repaymentScheduleTable.model()
 
-        loan_number = model.index(selected_row, 2).data()  # Loan Number는 2번째 열
         payment_date = model.index(selected_row, 1).data()
 
         try:
-            loans_ref = DB.collection('Loan').where('loan_number', '==', loan_number).get()
-
-            if loans_ref:
-                loan_doc = loans_ref[0]
-                loan_data = loan_doc.to_dict()
-                loan_schedule = loan_data.get("loan_schedule", [])
-
-                for schedule in loan_schedule:
-                    if schedule.get("Payment Date") == payment_date:
-                        schedule['status'] = 2  # 상태를 Overdue로 변경
-
-                DB.collection('Loan').document(loan_doc.id).update({"loan_schedule": loan_schedule})
-
-                QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as overdue.")
-                self.on_search_clicked()
+            self.post_installment_status(selected_row, OVERDUE)
+            QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as overdue.")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update payment status: {e}")
@@ -226,25 +233,11 @@ class RepaymentBatchApp(QMainWindow):
         selected_row = selected_indexes[0].row()
         model = self.repaymentScheduleTable.model()
 
-        loan_number = model.index(selected_row, 2).data()  # Loan Number는 2번째 열
         payment_date = model.index(selected_row, 1).data()
 
         try:
-            loans_ref = DB.collection('Loan').where('loan_number', '==', loan_number).get()
-
-            if loans_ref:
-                loan_doc = loans_ref[0]
-                loan_data = loan_doc.to_dict()
-                loan_schedule = loan_data.get("loan_schedule", [])
-
-                for schedule in loan_schedule:
-                    if schedule.get("Payment Date") == payment_date:
-                        schedule['status'] = 0  # 상태를 0으로 변경
-
-                DB.collection('Loan').document(loan_doc.id).update({"loan_schedule": loan_schedule})
-
-                QMessageBox.information(self, "Success", f"Payment for {payment_date} has been canceled.")
-                self.on_search_clicked()
+            self.post_installment_status(selected_row, SCHEDULED)
+            QMessageBox.information(self, "Success", f"Payment for {payment_date} has been canceled.")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update payment status: {e}")
@@ -267,11 +260,10 @@ class RepaymentBatchApp(QMainWindow):
 
             if loans_ref:
                 loan_doc = loans_ref[0]
-                loan_data = loan_doc.to_dict()
+                loan_data = load_loan(loan_doc.to_dict())
 
                 # Fetch customer details using the UID from the Customer collection
-                customer_doc = DB.collection('Customer').document(customer_uid).get()
-                customer_data = customer_doc.to_dict() if customer_doc.exists else {}
+                customer_data = get_reference('Customer', customer_uid) or {}
 
                 self.details_window = RepaymentDetailsWindow(loan_data, customer_data)
                 self.details_window.show()
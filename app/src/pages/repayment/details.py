@@ -5,6 +5,9 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor, QIcon
 
 from src.components import DB
+from src.components.reference_cache import get_reference, get_references
+from src.components.installment_status import OVERDUE, PAID, SCHEDULED, set_installment_status
+from src.components.schedule_storage import installment_periods
 
 class RepaymentDetailsWindow(QMainWindow):
     def __init__(self, loan_data, customer_data):
@@ -97,13 +100,10 @@ class RepaymentDetailsWindow(QMainWindow):
         payment_date = selected_schedule.get("Payment Date")
 
         try:
-            loan_schedule = self.loan_data.get("loan_schedule", [])
-            for schedule in loan_schedule:
-                if schedule.get("Payment Date") == payment_date:
-                    schedule["status"] = 1
-
+            # 해당 회차의 상태값만 트랜잭션으로 변경하고 최신 스케줄로 갱신
             loan_id = self.loan_data.get("loan_id")
-            DB.collection("Loan").document(loan_id).update({"loan_schedule": loan_schedule})
+            periods = installment_periods(self.loan_data.get("loan_schedule", []), payment_date)
+            self.loan_data.update(set_installment_status(DB, loan_id, periods, PAID))
 
             QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as paid.")
             self.load_loan_schedule(self.loan_data)
@@ -120,13 +120,10 @@ class RepaymentDetailsWindow(QMainWindow):
         payment_date = self.selected_schedule_data["Payment Date"]
 
         try:
-            loan_schedule = self.loan_data.get("loan_schedule", [])
-            for schedule in self.loan_data['loan_schedule']:
-                if schedule.get("Payment Date") == payment_date:
-                    schedule['status'] = 0
-
-            loan_id = self.loan_data['loan_id']
-            DB.collection("Loan").document(loan_id).update({"loan_schedule": loan_schedule})
+            # 해당 회차의 상태값만 트랜잭션으로 변경하고 최신 스케줄로 갱신
+            loan_id = self.loan_data.get("loan_id")
+            periods = installment_periods(self.loan_data.get("loan_schedule", []), payment_date)
+            self.loan_data.update(set_installment_status(DB, loan_id, periods, SCHEDULED))
 
             QMessageBox.information(self, "Success", "Payment for {payment_date} marked as Scheduled.")
             self.load_loan_schedule(self.loan_data)
@@ -145,13 +142,10 @@ class RepaymentDetailsWindow(QMainWindow):
         payment_date = selected_schedule.get("Payment Date")
 
         try:
-            loan_schedule = self.loan_data.get("loan_schedule", [])
-            for schedule in loan_schedule:
-                if schedule.get("Payment Date") == payment_date:
-                    schedule["status"] = 2  # Mark as 'Overdue'
-
+            # 해당 회차의 상태값만 트랜잭션으로 변경하고 최신 스케줄로 갱신
             loan_id = self.loan_data.get("loan_id")
-            DB.collection("Loan").document(loan_id).update({"loan_schedule": loan_schedule})
+            periods = installment_periods(self.loan_data.get("loan_schedule", []), payment_date)
+            self.loan_data.update(set_installment_status(DB, loan_id, periods, OVERDUE))
 
             QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as overdue.")
 
@@ -167,14 +161,14 @@ class RepaymentDetailsWindow(QMainWindow):
             guarantor_uids = loan_data['guarantors']  # List of UID values
             model = QStandardItemModel(len(guarantor_uids), 3)
             model.setHorizontalHeaderLabels(["Name", "Date of Birth", "Contact"])
+            guarantors = get_references('Guarantor', guarantor_uids)
 
             # Loop through each guarantor UID and fetch the details from the Guarantor collection
             for row_idx, guarantor_uid in enumerate(guarantor_uids):
                 try:
                     # Fetch guarantor details using the UID from the 'Guarantor' collection
-                    guarantor_doc = DB.collection('Guarantor').document(guarantor_uid).get()
-                    if guarantor_doc.exists:
-                        guarantor_data = guarantor_doc.to_dict()
+                    guarantor_data = guarantors.get(guarantor_uid)
+                    if guarantor_data is not None:
 
                         # Populate the table with the fetched guarantor information
                         model.setItem(row_idx, 0, QStandardItem(guarantor_data.get("name", "Unknown")))
@@ -290,7 +284,7 @@ class RepaymentDetailsWindow(QMainWindow):
         self.contractDate.setText(loan_data['contract_date'])
         self.loanStatus.setText(loan_data['loan_status'])
         self.loanType.setText(loan_data['loan_type'])
-        officer = DB.collection('Officer').document(loan_data['loan_officer']).get().to_dict()
+        officer = get_reference('Officer', loan_data['loan_officer'])
         self.loanOfficer.setText(officer['name'])
         self.cpNumber.setText(loan_data['cp_number'])
         self.loanAmount.setText(loan_data['principal'])
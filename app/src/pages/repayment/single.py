@@ -7,6 +7,9 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor, QIcon
 
 from src.components import DB  # Firestore 연결을 위한 모듈
+from src.components.reference_cache import get_reference, get_references
+from src.components.installment_status import OVERDUE, PAID, SCHEDULED, set_installment_status
+from src.components.schedule_storage import installment_periods, load_loan
 from src.components.select_loan import SelectLoanWindow
 
 
@@ -126,13 +129,10 @@ class RepaymentSingleApp(QMainWindow):
         payment_date = selected_schedule.get("Payment Date")
 
         try:
-            loan_schedule = self.loan_data.get("loan_schedule", [])
-            for schedule in loan_schedule:
-                if schedule.get("Payment Date") == payment_date:
-                    schedule["status"] = 1  # Mark as 'Paid'
-
+            # 해당 회차의 상태값만 트랜잭션으로 변경하고 최신 스케줄로 갱신
             loan_id = self.loan_data.get("loan_id")
-            DB.collection("Loan").document(loan_id).update({"loan_schedule": loan_schedule})
+            periods = installment_periods(self.loan_data.get("loan_schedule", []), payment_date)
+            self.loan_data.update(set_installment_status(DB, loan_id, periods, PAID))
 
             QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as paid.")
 
@@ -187,13 +187,10 @@ class RepaymentSingleApp(QMainWindow):
         payment_date = self.selected_schedule_data["Payment Date"]
 
         try:
-            loan_schedule = self.loan_data.get("loan_schedule", [])
-            for schedule in loan_schedule:
-                if schedule.get("Payment Date") == payment_date:
-                    schedule['status'] = 0  # Revert to 'Scheduled'
-
-            loan_id = self.loan_data['loan_id']
-            DB.collection("Loan").document(loan_id).update({"loan_schedule": loan_schedule})
+            # 해당 회차의 상태값만 트랜잭션으로 변경하고 최신 스케줄로 갱신
+            loan_id = self.loan_data.get("loan_id")
+            periods = installment_periods(self.loan_data.get("loan_schedule", []), payment_date)
+            self.loan_data.update(set_installment_status(DB, loan_id, periods, SCHEDULED))
 
             QMessageBox.information(self, "Success", f"Payment for {payment_date} reverted to Scheduled.")
 
@@ -247,13 +244,10 @@ class RepaymentSingleApp(QMainWindow):
         payment_date = selected_schedule.get("Payment Date")
 
         try:
-            loan_schedule = self.loan_data.get("loan_schedule", [])
-            for schedule in loan_schedule:
-                if schedule.get("Payment Date") == payment_date:
-                    schedule["status"] = 2  # Mark as 'Overdue'
-
+            # 해당 회차의 상태값만 트랜잭션으로 변경하고 최신 스케줄로 갱신
             loan_id = self.loan_data.get("loan_id")
-            DB.collection("Loan").document(loan_id).update({"loan_schedule": loan_schedule})
+            periods = installment_periods(self.loan_data.get("loan_schedule", []), payment_date)
+            self.loan_data.update(set_installment_status(DB, loan_id, periods, OVERDUE))
 
             QMessageBox.information(self, "Success", f"Payment for {payment_date} marked as overdue.")
 
@@ -295,7 +289,7 @@ class RepaymentSingleApp(QMainWindow):
         loan_ref = DB.collection('Loan')
         loan_id = selected_data['loan_id']
         loan_doc = loan_ref.document(loan_id).get()
-        loan_data = loan_doc.to_dict()
+        loan_data = load_loan(loan_doc.to_dict())
         self.loan_data = loan_data
         # Get customer name from the loan data and search for customer in the Customer DB
         customer_name = selected_data['customer_name']
@@ -322,7 +316,7 @@ class RepaymentSingleApp(QMainWindow):
         self.contractDate.setText(loan_data['contract_date'])
         self.loanStatus.setText(loan_data['loan_status'])
         self.loanType.setText(loan_data['loan_type'])
-        officer_data = DB.collection('Officer').document(loan_data['loan_officer']).get().to_dict()
+        officer_data = get_reference('Officer', loan_data['loan_officer'])
         self.loan_data['officer_name'] = officer_data['name']
         self.loanOfficer.setText(officer_data['name'])
         self.cpNumber.setText(loan_data['cp_number'])
@@ -434,12 +428,12 @@ class RepaymentSingleApp(QMainWindow):
             guarantor_uids = loan_data['guarantors']
             model = QStandardItemModel(len(guarantor_uids), 3)
             model.setHorizontalHeaderLabels(["Name", "Date of Birth", "Contact"])
+            guarantors = get_references('Guarantor', guarantor_uids)
 
             for row_idx, guarantor_uid in enumerate(guarantor_uids):
                 try:
-                    guarantor_doc = DB.collection('Guarantor').document(guarantor_uid).get()
-                    if guarantor_doc.exists:
-                        guarantor_data = guarantor_doc.to_dict()
+                    guarantor_data = guarantors.get(guarantor_uid)
+                    if guarantor_data is not None:
                         model.setItem(row_idx, 0, QStandardItem(guarantor_data.get("name", "Unknown")))
                         model.setItem(row_idx, 1, QStandardItem(guarantor_data.get("date_of_birth", "Unknown")))
                         model.setItem(row_idx, 2, QStandardItem('-'.join(
@@ -9,6 +9,8 @@ import pandas as pd
 from openpyxl import Workbook
 
 from src.components import DB  # Firestore DB 임포트
+from src.components.field_projection import PERIODIC_BALANCE_LOAN_FIELDS, PERIODIC_BALANCE_OVERDUE_FIELDS, stream_fields
+from src.components.schedule_storage import load_loan
 
 class ReportPeriodicBalanceApp(QMainWindow):
     def __init__(self):
@@ -97,16 +99,16 @@ class ReportPeriodicBalanceApp(QMainWindow):
 
     def retrieve_loan_and_overdue_schedules(self):
         try:
-            # Loan collection 데이터 가져오기
-            loans_ref = DB.collection('Loan').where(
+            # Loan collection 데이터 가져오기 (스케줄과 계약일 필드만)
+            loans_ref = stream_fields(DB.collection('Loan').where(
                 filter=FieldFilter('loan_status', '==', 'In Process')
-            ).stream()
+            ), PERIODIC_BALANCE_LOAN_FIELDS)
             loan_schedules = []
             overdue_schedules = []
             overdue_received_schedules = []
 
             for loan_doc in loans_ref:
-                loan_data = loan_doc.to_dict()
+                loan_data = load_loan(loan_doc.to_dict())
 
                 loan_schedule = loan_data.get('loan_schedule', [])
                 contract_date = loan_data.get('contract_date', "")
@@ -122,7 +124,7 @@ class ReportPeriodicBalanceApp(QMainWindow):
                     })
 
             # Overdue collection 데이터 가져오기
-            overdue_ref = DB.collection('Overdue').stream()
+            overdue_ref = stream_fields(DB.collection('Overdue'), PERIODIC_BALANCE_OVERDUE_FIELDS)
 
             for overdue_doc in overdue_ref:
                 overdue_data = overdue_doc.to_dict()
@@ -9,6 +9,7 @@ from PyQt5.QtCore import Qt
 import pandas as pd
 
 from src.components import DB, storageBucket
+from src.components.reference_cache import invalidate_reference
 from src.components.select_customer import SelectCustomerWindow
 
 class SearchCustomerApp(QMainWindow):
@@ -405,6 +406,7 @@ class SearchCustomerApp(QMainWindow):
                 DB.collection('Customer').document(customer_uid).update({"image_url": image_url})
 
             DB.collection('Customer').document(customer_uid).update(customer_data)
+            invalidate_reference('Customer', customer_uid)
 
             QMessageBox.information(self, "Success", "Customer data saved successfully.")
             self.clear_fields()
@@ -6,6 +6,7 @@ from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIcon
 import traceback
 
 from src.components import DB  # Firestore 연결을 위한 모듈
+from src.components.reference_cache import get_references
 
 
 class SearchGuarantorApp(QMainWindow):
@@ -61,8 +62,12 @@ class SearchGuarantorApp(QMainWindow):
 
         # 검색 결과 테이블에 표시
         try:
-            for loan_doc in loan_docs:
-                loan_data = loan_doc.to_dict()
+            loans = [loan_doc.to_dict() for loan_doc in loan_docs]
+
+            # 보증인을 하나씩 읽지 않고 모든 대출의 보증인을 모아서 한 번에 읽음
+            guarantors = get_references('Guarantor', [guarantor_id for loan_data in loans for guarantor_id in loan_data.get("guarantors", [])])
+
+            for loan_data in loans:
                 guarantor_ids = loan_data.get("guarantors", [])
 
                 # 보증인 정보가 없으면 다음 대출 데이터로 넘어감
@@ -71,10 +76,9 @@ class SearchGuarantorApp(QMainWindow):
 
                 # Guarantor DB에서 보증인 정보를 검색하여 테이블에 표시
                 for guarantor_id in guarantor_ids:
-                    guarantor_ref = DB.collection('Guarantor').document(guarantor_id).get()
+                    guarantor_data = guarantors.get(guarantor_id)
 
-                    if guarantor_ref.exists:
-                        guarantor_data = guarantor_ref.to_dict()
+                    if guarantor_data is not None:
                         guarantor_info = {
                             'name': guarantor_data.get('name', ''),
                             'nrc_no': guarantor_data.get('nrc_no', ''),
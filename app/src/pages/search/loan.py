@@ -6,6 +6,8 @@ import os
 import traceback
 
 from src.components import DB
+from src.components.reference_cache import get_reference
+from src.components.schedule_storage import load_loan
 from src.pages.search.loan_details import LoanDetailsApp
 from google.cloud.firestore_v1.base_query import FieldFilter
 
@@ -100,11 +102,9 @@ class SearchLoanApp(QMainWindow):
         Customer DB에서 customer_id를 사용하여 customer_name과 nrc_no를 가져오는 함수
         """
         try:
-            customer_ref = DB.collection('Customer').document(customer_id)
-            customer_doc = customer_ref.get()
+            customer_data = get_reference('Customer', customer_id)
 
-            if customer_doc.exists:
-                customer_data = customer_doc.to_dict()
+            if customer_data is not None:
                 return customer_data.get("name", ""), customer_data.get("nrc_no", "")
             else:
                 return "", ""
@@ -168,7 +168,7 @@ class SearchLoanApp(QMainWindow):
                 return
 
             loan_doc = loan_ref[0]  # 첫 번째 결과 사용
-            loan_data = loan_doc.to_dict()
+            loan_data = load_loan(loan_doc.to_dict())
 
             # 하위 필드로부터 배열이나 딕셔너리 정보를 가져오는 방식
             collaterals = loan_data.get('collaterals', [])
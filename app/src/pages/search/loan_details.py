@@ -3,7 +3,7 @@ import os
 from PyQt5 import uic
 from PyQt5.QtWidgets import QMainWindow, QApplication, QDialog, QTabWidget, QTableWidgetItem, QAbstractItemView
 from PyQt5.QtGui import QIcon, QStandardItemModel, QStandardItem, QColor
-from src.components import DB  # Firestore 연결을 위한 모듈
+from src.components.reference_cache import get_reference, get_references
 
 class LoanDetailsApp(QMainWindow):
     def __init__(self, loan_data, collaterals_data, counselings_data, guarantors_data, loan_schedule_data):
@@ -46,7 +46,7 @@ class LoanDetailsApp(QMainWindow):
         self.contractDate.setText(self.loan_data.get('contract_date', ''))
         self.loanStatus.setText(self.loan_data.get('loan_status', ''))
         self.loanType.setText(self.loan_data.get('loan_type', ''))
-        officer_data = DB.collection('Officer').document(self.loan_data.get('loan_officer', '')).get().to_dict()
+        officer_data = get_reference('Officer', self.loan_data.get('loan_officer', ''))
         self.loanOfficer.setText(officer_data['name'])
         self.cpNumber.setText(self.loan_data.get('cp_number', ''))
         self.loanAmount.setText(str(self.loan_data.get('principal', '')))
@@ -134,11 +134,11 @@ class LoanDetailsApp(QMainWindow):
 
         guarantor_details = []
         try:
-            # Guarantor 데이터를 DB에서 가져오기
+            # Guarantor 데이터를 DB에서 한 번에 가져오기
+            guarantors = get_references('Guarantor', self.guarantors_data)
             for guarantor_id in self.guarantors_data:
-                guarantor_ref = DB.collection('Guarantor').document(guarantor_id).get()
-                if guarantor_ref.exists:
-                    guarantor_data = guarantor_ref.to_dict()
+                guarantor_data = guarantors.get(guarantor_id)
+                if guarantor_data is not None:
                     # 필요한 데이터만 추출
                     guarantor_info = {
                         'name': guarantor_data.get('name', ''),
@@ -6,6 +6,7 @@ from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIcon, QRegExpValidat
 from PyQt5.QtCore import QRegExp
 
 from src.components import DB  # Firestore DB 임포트
+from src.components.reference_cache import invalidate_reference
 
 class SettingsOfficerApp(QMainWindow):
     def __init__(self):
@@ -118,6 +119,7 @@ class SettingsOfficerApp(QMainWindow):
                     "oid": self.current_officer_id  # 기존 ID를 'oid'로 저장
                 }
                 DB.collection('Officer').document(self.current_officer_id).update(officer_data)
+                invalidate_reference('Officer', self.current_officer_id)
                 QMessageBox.information(self, "Success", "Officer information updated successfully.")
             else:
                 # 새로운 오피서 정보 추가
@@ -148,6 +150,7 @@ class SettingsOfficerApp(QMainWindow):
 
         try:
             DB.collection('Officer').document(self.current_officer_id).delete()
+            invalidate_reference('Officer', self.current_officer_id)
             QMessageBox.information(self, "Success", "Officer deleted successfully.")
             self.clear_fields()
             self.load_officers()
@@ -5,6 +5,7 @@ from PyQt5 import uic
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QIcon
 
 from src.components import DB  # Firestore DB 임포트
+from src.components.reference_cache import invalidate_reference
 
 class SettingsUserApp(QMainWindow):
     def __init__(self):
@@ -111,6 +112,7 @@ class SettingsUserApp(QMainWindow):
             if self.current_user_id:
                 # 기존 사용자 정보 수정
                 DB.collection('User').document(self.current_user_id).update(user_data)
+                invalidate_reference('User', self.current_user_id)
                 QMessageBox.information(self, "Success", "User information updated successfully.")
             else:
                 # 새로운 사용자 정보 추가
@@ -134,6 +136,7 @@ class SettingsUserApp(QMainWindow):
 
         try:
             DB.collection('User').document(self.current_user_id).delete()
+            invalidate_reference('User', self.current_user_id)
             QMessageBox.information(self, "Success", "User deleted successfully.")
             self.clear_fields()
             self.load_users()
@@ -0,0 +1,33 @@
+import json
+
+from benchmarks import loan_calculator as benchmark
+
+RESULTS = {
+    'single': {'equal/52/14': {'rows_per_sec': 1000, 'p50_ms': 0.5, 'p95_ms': 1.0, 'p99_ms': 2.0, 'peak_memory_bytes': 100}},
+    'batch': {},
+    'legacy': {},
+}
+
+
+def test_baseline_is_next_to_module(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert benchmark.DEFAULT_BASELINE.endswith('benchmarks/loan_calculator_baseline.json')
+
+
+def test_missing_baseline_fails_without_writing(tmp_path, monkeypatch):
+    monkeypatch.setattr(benchmark, 'run', lambda max_batch: RESULTS)
+    baseline = tmp_path / 'baseline.json'
+    assert benchmark.main(['--baseline', str(baseline)]) != 0
+    assert not baseline.exists()
+
+    assert benchmark.main(['--baseline', str(baseline), '--update-baseline']) == 0
+    assert json.loads(baseline.read_text()) == RESULTS
+    assert benchmark.main(['--baseline', str(baseline)]) == 0
+
+
+def test_latency_and_memory_regressions_are_reported():
+    slower = {'single': {'equal/52/14': {'rows_per_sec': 1000, 'p95_ms': 1.5, 'p99_ms': 2.0, 'peak_memory_bytes': 200}}}
+    regressions = benchmark.find_regressions(slower, RESULTS, 0.25)
+    assert len(regressions) == 2
+    assert any('p95_ms' in regression for regression in regressions)
+    assert any('peak_memory_bytes' in regression for regression in regressions)
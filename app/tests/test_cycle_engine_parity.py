@@ -0,0 +1,68 @@
+import json
+import os
+import random
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from src.components.cycle_engine import CYCLE_COUNTS, cycle_schedule_columns
+
+# algorithm/loan.ipynb 의 calculate_* 함수와 cycle_schedule_columns 의 결과 비교
+NOTEBOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'algorithm', 'loan.ipynb')
+NOTEBOOK_FUNCTIONS = {
+    'equal': 'calculate_equal_payment',
+    'equal_principal': 'calculate_equal_principal_payment',
+    'bullet': 'calculate_bullet_payment',
+}
+# 노트북은 'week' 주기에서 int('') 오류로 실행되지 않으므로 비교에서 제외
+NOTEBOOK_CYCLES = [cycle for cycle in CYCLE_COUNTS if cycle != 'week']
+
+
+def load_notebook_functions(path: str = NOTEBOOK_PATH) -> dict:
+    # 노트북에서 calculate_* 함수가 정의된 코드 셀만 실행하여 함수를 가져옴 (pandas, dateutil 필요)
+    with open(path, encoding='utf-8') as f:
+        notebook = json.load(f)
+
+    namespace = {}
+    for cell in notebook['cells']:
+        source = ''.join(cell['source'])
+        if cell['cell_type'] == 'code' and any(f'def {name}(' in source for name in NOTEBOOK_FUNCTIONS.values()):
+            exec(source, namespace)
+    return {method: namespace[name] for method, name in NOTEBOOK_FUNCTIONS.items()}
+
+
+def random_cases(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(list(NOTEBOOK_FUNCTIONS)),
+            rng.choice(NOTEBOOK_CYCLES),
+            date.fromordinal(date(2023, 1, 1).toordinal() + rng.randrange(0, 730)),
+            rng.randrange(1, 1000) * 10_000,
+            rng.choice([3, 6, 12, 18, 24]),
+            rng.choice([0.18, 0.24, 0.28, 0.3]),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture(scope='module')
+def notebook_functions():
+    pytest.importorskip('pandas')
+    pytest.importorskip('dateutil')
+    if not os.path.exists(NOTEBOOK_PATH):
+        pytest.skip('algorithm/loan.ipynb not found')
+    return load_notebook_functions()
+
+
+@pytest.mark.parametrize('method, cycle, start, principal, months, rate', random_cases(60))
+def test_matches_notebook(notebook_functions, method, cycle, start, principal, months, rate):
+    expected = notebook_functions[method](datetime.combine(start, datetime.min.time()), principal, months, rate, cycle=cycle)
+    expected_rows = expected.iloc[:-1]
+    columns = cycle_schedule_columns(method, start, principal, months, rate, cycle)
+
+    assert [value.strftime('%Y-%m-%d (%A)') for value in columns['Payment Date'].tolist()] == \
+        expected_rows['Payment Date'].tolist()
+    for name in ['Principal', 'Interest', 'Total', 'Remaining Balance']:
+        np.testing.assert_array_equal(columns[name], expected_rows[name].to_numpy(dtype=np.int64))
@@ -0,0 +1,109 @@
+from datetime import date, datetime
+
+import pytest
+
+from src.components.field_projection import (
+    BATCH_REPAYMENT_FIELDS, PERIODIC_BALANCE_LOAN_FIELDS, PERIODIC_BALANCE_OVERDUE_FIELDS, stream_fields,
+)
+from src.components.schedule_storage import compact_schedule_fields, load_loan, regenerate_schedule, schedule_params
+
+
+def value_size(value) -> int:
+    # Firestore 저장 크기 규칙에 따른 값의 크기 (byte)
+    # https://firebase.google.com/docs/firestore/storage-size
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float, datetime, date)):
+        return 8
+    if isinstance(value, str):
+        return len(value.encode('utf-8')) + 1
+    if isinstance(value, dict):
+        return sum(value_size(key) + value_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(value_size(item) for item in value)
+    return 16
+
+
+def payload_size(snapshots) -> int:
+    # 문서 ID + 필드 + 32 byte
+    return sum(value_size(snapshot.id) + value_size(snapshot.to_dict()) + 32 for snapshot in snapshots)
+
+
+class Snapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeQuery:
+    # select() 에 넘긴 필드를 기록하고 해당 필드만 돌려주는 Firestore 쿼리 대역
+    def __init__(self, documents: dict, fields=None):
+        self.documents = documents
+        self.fields = fields
+        self.selected = []
+
+    def select(self, fields):
+        self.selected.append(list(fields))
+        return FakeQuery(self.documents, fields)
+
+    def stream(self):
+        for doc_id, data in self.documents.items():
+            if self.fields is not None:
+                data = {name: value for name, value in data.items() if name in self.fields}
+            yield Snapshot(doc_id, data)
+
+
+def loan_documents(count: int = 20) -> dict:
+    documents = {}
+    for i in range(count):
+        params = schedule_params('2024-01-01', 1_000_000 + i * 100_000, 26, 14, 0.28, 'equal')
+        loan_schedule = regenerate_schedule(params)
+        loan_schedule[0]['status'] = 1
+        data = {
+            'uid': f'customer-{i}', 'loan_number': f'L-{i:04d}', 'contract_date': '2024-01-01',
+            'loan_status': 'In Process', 'loan_officer': 'officer', 'principal': str(params['principal']),
+            'collaterals': [{'type': 'Land', 'name': 'Plot', 'details': 'x' * 400}] * 3,
+            'counselings': [{'date': '2024-02-01', 'details': 'y' * 600}] * 5,
+            'guarantors': [f'guarantor-{i}-{j}' for j in range(3)],
+        }
+        # 절반은 생성 조건 저장 방식, 나머지는 loan_schedule 전체 저장
+        data.update(compact_schedule_fields(params, loan_schedule) if i % 2 else {'loan_schedule': loan_schedule})
+        documents[f'loan-{i}'] = data
+    return documents
+
+
+def overdue_documents(count: int = 10) -> dict:
+    rows = [{'repayment_date': '2024-03-01', 'principal': '1000', 'interest': '100', 'overdue_interest': '10'}]
+    return {
+        f'overdue-{i}': {
+            'uid': f'customer-{i}', 'loan_number': f'L-{i:04d}', 'loan_schedule': rows * 4,
+            'received_schedule': rows * 2, 'collaterals': [{'details': 'x' * 400}] * 3, 'guarantors': ['g'] * 3,
+        }
+        for i in range(count)
+    }
+
+
+@pytest.mark.parametrize('documents, fields', [
+    (loan_documents(), BATCH_REPAYMENT_FIELDS),
+    (loan_documents(), PERIODIC_BALANCE_LOAN_FIELDS),
+    (overdue_documents(), PERIODIC_BALANCE_OVERDUE_FIELDS),
+])
+def test_projection_selects_fields_and_shrinks_payload(documents, fields):
+    query = FakeQuery(documents)
+    projected = list(stream_fields(query, fields))
+    assert query.selected == [list(fields)]
+
+    full = list(query.stream())
+    assert [snapshot.id for snapshot in projected] == [snapshot.id for snapshot in full]
+    assert payload_size(projected) < payload_size(full) / 2
+
+
+@pytest.mark.parametrize('fields', [BATCH_REPAYMENT_FIELDS, PERIODIC_BALANCE_LOAN_FIELDS])
+def test_projected_loans_still_expand_schedules(fields):
+    documents = loan_documents()
+    for snapshot in stream_fields(FakeQuery(documents), fields):
+        expected = load_loan(dict(documents[snapshot.id]))['loan_schedule']
+        assert load_loan(snapshot.to_dict())['loan_schedule'] == expected
@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.components.group_schedule import group_schedule, member_schedules
+from src.components.schedule_engine import schedule_columns
+from src.components.schedule_table import ScheduleTable
+
+TERMS = {
+    'principal': '1200000', 'number_of_repayment': '4', 'repayment_cycle': '30',
+    'interest_rate': '28', 'contract_date': '2024-01-01', 'repayment_method': 'Equal',
+}
+
+
+def computed_rows():
+    columns = schedule_columns('equal', '2024-01-01', 1_200_000, 4, 30, 0.28)
+    return ScheduleTable(columns).to_firestore(status=0)
+
+
+def test_stored_rows_are_used_as_is():
+    stored = computed_rows()
+    stored[0]['status'] = 1
+    # 재계산된 회차 (상환 조건으로 다시 계산하면 나오지 않는 금액)
+    stored[2].update({'Principal': 100_000, 'Interest': 1_000, 'Total': 101_000})
+    members = [('a', {**TERMS, 'loan_schedule': stored}), ('b', dict(TERMS))]
+
+    schedules = member_schedules(members)
+    first = schedules.select(schedules['Loan Index'] == 0)
+    second = schedules.select(schedules['Loan Index'] == 1)
+    assert first['Total'].tolist() == [row['Total'] for row in stored]
+    assert first['status'].tolist() == [1, 0, 0, 0]
+    # 스케줄이 저장되지 않은 구성원은 상환 조건으로 계산
+    assert second['Total'].tolist() == [row['Total'] for row in computed_rows()]
+
+
+def test_due_list_sums_members_by_date():
+    stored = computed_rows()
+    stored[0]['status'] = 1
+    result = group_schedule([('a', {**TERMS, 'loan_schedule': stored}), ('b', dict(TERMS))])
+    due_list = result['due_list']
+    assert due_list['Members'].tolist() == [2, 2, 2, 2]
+    np.testing.assert_array_equal(due_list['Total'], [2 * row['Total'] for row in stored])
+    assert due_list['Unpaid Total'][0] == stored[0]['Total']
+
+
+def test_empty_group():
+    assert len(member_schedules([])) == 0
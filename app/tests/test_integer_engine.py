@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.components.integer_engine import FLOAT_TOLERANCE, float_tolerance, integer_amount_columns
+from src.components.schedule_engine import QUOTE_METHODS, cached_amount_columns
+
+
+def max_difference(method, principal, num_payments, cycle_days, annual_interest_rate) -> int:
+    exact = integer_amount_columns(method, principal, num_payments, cycle_days, annual_interest_rate)
+    approx = cached_amount_columns.__wrapped__(method, principal, num_payments, cycle_days, annual_interest_rate)
+    return max(int(np.abs(values - approx[column]).max()) for column, values in exact.items())
+
+
+def test_integer_engine_within_float_tolerance():
+    # float 엔진과 정수 엔진을 100 단위가 아닌 원금, 1200 회, 365 일 주기까지 포함하여 비교
+    rng = random.Random(0)
+    for _ in range(1500):
+        principal = rng.randint(1, 1_000_000) * 100 + rng.choice([0, 0, rng.randint(1, 99)])
+        num_payments = rng.choice([1, 4, 13, 26, 45, 52, 120, 1200])
+        cycle_days = rng.choice([7, 14, 28, 30, 365])
+        annual_interest_rate = rng.randint(0, 60) / 100
+
+        for method in QUOTE_METHODS:
+            try:
+                difference = max_difference(method, principal, num_payments, cycle_days, annual_interest_rate)
+            except ValueError:
+                # int64 범위를 넘는 조건은 정수 엔진이 거부 (test_out_of_range_equal_payment_is_rejected)
+                assert method == 'equal'
+                continue
+            assert difference <= float_tolerance(method, num_payments, cycle_days, annual_interest_rate), \
+                (method, principal, num_payments, cycle_days, annual_interest_rate, difference)
+
+
+@pytest.mark.parametrize('principal, num_payments, cycle_days, annual_interest_rate, difference', [
+    (51_110_300, 1200, 14, 0.24, 15_600),
+    (601_500, 45, 365, 0.10, 200),
+])
+def test_equal_payment_drift_exceeds_one_step(principal, num_payments, cycle_days, annual_interest_rate, difference):
+    # 원리금 균등은 올림 오차가 이자를 통해 커지므로 한 칸(100) 을 넘을 수 있음
+    assert max_difference('equal', principal, num_payments, cycle_days, annual_interest_rate) == difference
+    assert difference > FLOAT_TOLERANCE
+    assert difference <= float_tolerance('equal', num_payments, cycle_days, annual_interest_rate)
+
+
+def test_closed_form_methods_within_one_step():
+    assert float_tolerance('equal_principal', 1200, 365, 0.6) == FLOAT_TOLERANCE
+    assert float_tolerance('bullet', 1200, 365, 0.6) == FLOAT_TOLERANCE
+
+
+def test_out_of_range_equal_payment_is_rejected():
+    with pytest.raises(ValueError):
+        integer_amount_columns('equal', 97_455_000, 1200, 30, 0.46)
@@ -0,0 +1,71 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from src.components.loan_calculator import LoanCalculator
+from src.components.overdue_accrual import overdue_interest
+from src.components.payment_calendar import PaymentCalendar
+from src.components.payoff import payoff_quotes
+
+
+def test_overdue_interest_matches_accrual():
+    calculator = LoanCalculator(datetime(2024, 1, 1), 1_000_000, 10, 30, 0.28)
+    payment_date = np.datetime64('2024-01-01')
+    for amount, days in [(110_000, 0), (110_000, 17), (333_333, 45)]:
+        expected = overdue_interest(amount, payment_date, 28.0, payment_date + days)
+        assert calculator.overdue_interest(amount, days, 0.28) == int(expected)
+    assert calculator.overdue_interest(365_000, 10, 0.1) == 1_000
+
+
+def holiday_calculator():
+    # 2024-01-31 이 휴일이면 첫 상환일은 다음 영업일 2024-02-01
+    calendar = PaymentCalendar(holidays=['2024-01-31'])
+    return LoanCalculator(datetime(2024, 1, 1), 1_200_000, 12, 30, 0.28, calendar)
+
+
+@pytest.mark.parametrize('method', ['equal', 'equal_principal', 'bullet'])
+def test_schedules_use_calendar(method):
+    calculator = holiday_calculator()
+    expected = calculator.schedule(method)['Payment Date'].tolist()
+    assert expected[0] == date(2024, 2, 1)
+    assert [date.fromordinal(row.due_date) for row in calculator.iter_schedule(method)] == expected
+    assert calculator.exact_schedule(method)['Payment Date'].tolist() == expected
+
+
+def test_payoff_quote_uses_adjusted_due_dates():
+    calculator = holiday_calculator()
+    on_holiday = calculator.payoff_quote(datetime(2024, 1, 31))
+    assert on_holiday['periods_paid'] == 0
+    assert on_holiday['remaining_principal'] == 1_200_000
+
+    after_due = calculator.payoff_quote(datetime(2024, 2, 3))
+    assert after_due['periods_paid'] == 1
+    assert after_due['remaining_principal'] == calculator.balance_at(1)
+    assert after_due['accrued_interest'] > 0
+
+
+def test_payoff_quote_without_closed_days_matches_plain_dates():
+    every_day = PaymentCalendar(weekmask='1111111')
+    start = np.datetime64('2024-01-01')
+    as_of = start + np.arange(-5, 400, 7)
+    plain = payoff_quotes(1_000_000, 12, 30, 0.28, start, 'equal', as_of)
+    adjusted = payoff_quotes(1_000_000, 12, 30, 0.28, start, 'equal', as_of, every_day)
+    for name in plain:
+        np.testing.assert_array_equal(plain[name], adjusted[name])
+
+
+def test_compare_methods_at_zero_interest():
+    quotes = LoanCalculator(datetime(2024, 1, 1), 1_000_000, 12, 30, 0.0).compare_methods()
+    for quote in quotes.values():
+        assert quote['total_interest'] == 0
+        assert quote['total_payment'] >= 1_000_000
+
+
+@pytest.mark.parametrize('method', ['equal', 'equal_principal', 'bullet'])
+@pytest.mark.parametrize('rate', [0.0, 0.18, 0.28])
+def test_iter_schedule_matches_schedule(method, rate):
+    for principal, num_payments, cycle_days in [(1_000_000, 10, 30), (1_234_500, 26, 14), (3_000_000, 52, 7)]:
+        calculator = LoanCalculator(datetime(2024, 1, 31), principal, num_payments, cycle_days, rate)
+        assert [row.to_record() for row in calculator.iter_schedule(method)] == \
+            calculator.schedule(method).to_records()
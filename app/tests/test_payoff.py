@@ -0,0 +1,44 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.components.loan_calculator import LoanCalculator
+
+
+@pytest.mark.parametrize('method', ['equal_principal', 'bullet'])
+@pytest.mark.parametrize('principal, num_payments', [(1_000, 7), (2_500, 26), (1_000_000, 13), (3_450_000, 52)])
+def test_balance_at_matches_schedule_remaining_balance(method, principal, num_payments):
+    calculator = LoanCalculator(date(2024, 1, 1), principal, num_payments, 14, 0.28)
+    remaining = calculator.schedule(method)['Remaining Balance']
+    balances = [calculator.balance_at(period, method) for period in range(1, num_payments + 1)]
+    np.testing.assert_array_equal(balances, remaining)
+
+
+def test_payoff_quote_never_negative_for_small_equal_principal_loan():
+    calculator = LoanCalculator(date(2024, 1, 1), 1_000, 7, 14, 0.28)
+    assert calculator.schedule('equal_principal')['Remaining Balance'].min() < 0
+    for days in range(0, 7 * 14 + 1, 7):
+        quote = calculator.payoff_quote(np.datetime64('2024-01-01') + days, 'equal_principal')
+        assert quote['remaining_principal'] >= 0
+        assert quote['settlement_amount'] >= 0
+
+
+@pytest.mark.parametrize('principal, num_payments', [(1_000_000, 13), (1_234_567, 26), (3_450_000, 52)])
+def test_equal_payment_balance_is_remaining_principal(principal, num_payments):
+    # 원리금 균등의 Remaining Balance 는 남은 총 상환액이므로 누적 상환 원금과 비교
+    calculator = LoanCalculator(date(2024, 1, 1), principal, num_payments, 14, 0.28)
+    schedule = calculator.schedule('equal')
+    expected = np.ceil((principal - np.cumsum(schedule['Principal'])) / 100) * 100
+    expected[-1] = 0
+    balances = [calculator.balance_at(period, 'equal') for period in range(1, num_payments + 1)]
+    np.testing.assert_array_equal(balances, expected)
+    assert balances[4] != schedule['Remaining Balance'][4]
+
+    # 5 회차 상환일 3 일 뒤의 중도 상환 금액
+    quote = calculator.payoff_quote(np.datetime64('2024-01-01') + 5 * 14 + 3, 'equal')
+    assert quote['periods_paid'] == 5
+    assert quote['remaining_principal'] == balances[4]
+    interest = np.ceil(balances[4] * (0.28 / 365 * 14) * 3 / 14 / 100) * 100
+    assert quote['accrued_interest'] == interest
+    assert quote['settlement_amount'] == balances[4] + interest
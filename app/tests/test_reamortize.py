@@ -0,0 +1,62 @@
+import pytest
+
+from src.components import schedule_storage
+from src.components.reamortize import reamortization_update
+from src.components.schedule_storage import compact_schedule_fields, expand_schedule, regenerate_schedule, schedule_params
+
+DELETED = object()
+
+
+def apply_update(loan_data: dict, update: dict) -> dict:
+    # Firestore update 의 필드 경로(`3` 등)를 dict 에 적용
+    loan_data = {name: dict(value) if isinstance(value, dict) else value for name, value in loan_data.items()}
+    for path, value in update.items():
+        name, _, key = path.partition('.')
+        target, field = (loan_data.setdefault(name, {}), key.strip('`')) if key else (loan_data, name)
+        if value is DELETED:
+            target.pop(field, None)
+        else:
+            target[field] = value
+    return loan_data
+
+
+@pytest.fixture(autouse=True)
+def delete_sentinel(monkeypatch):
+    monkeypatch.setattr(schedule_storage, '_delete_field', lambda: DELETED)
+
+
+def compact_loan(method='equal'):
+    params = schedule_params('2024-01-01', 1_200_000, 12, 30, 0.18, method)
+    loan_schedule = regenerate_schedule(params)
+    for row in loan_schedule[:3]:
+        row['status'] = 1
+    return {
+        'repayment_method': method, 'repayment_cycle': 30, 'interest_rate': 18,
+        **compact_schedule_fields(params, loan_schedule),
+        'loan_schedule': loan_schedule,
+    }
+
+
+@pytest.mark.parametrize('method', ['equal', 'equal_principal', 'bullet'])
+def test_compact_update_writes_only_tail(method):
+    loan_data = compact_loan(method)
+    loan_schedule, update = reamortization_update(loan_data, 5, 500_000)
+
+    assert loan_schedule[:4] == loan_data['loan_schedule'][:4]
+    assert 'loan_schedule' not in update
+    assert all(int(path.split('.')[1].strip('`')) >= 5 for path in update)
+
+    stored = apply_update({k: v for k, v in loan_data.items() if k != 'loan_schedule'}, update)
+    assert expand_schedule(stored) == loan_schedule
+
+
+def test_legacy_update_writes_full_schedule():
+    loan_data = compact_loan()
+    legacy = {name: loan_data[name] for name in ['repayment_method', 'repayment_cycle', 'interest_rate', 'loan_schedule']}
+    loan_schedule, update = reamortization_update(legacy, 5, 500_000)
+    assert update == {'loan_schedule': loan_schedule}
+
+
+def test_paid_tail_is_rejected():
+    with pytest.raises(ValueError):
+        reamortization_update(compact_loan(), 3, 500_000)
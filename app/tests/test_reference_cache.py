@@ -0,0 +1,59 @@
+from src.components.reference_cache import ReferenceCache
+
+
+class Snapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDB:
+    # get_all 호출마다 요청한 문서 ID 를 기록하는 Firestore 대역
+    def __init__(self, documents: dict):
+        self.documents = documents
+        self.requests = []
+
+    def collection(self, name):
+        return self
+
+    def document(self, doc_id):
+        return doc_id
+
+    def get_all(self, refs):
+        refs = list(refs)
+        self.requests.append(refs)
+        return [Snapshot(doc_id, self.documents.get(doc_id)) for doc_id in refs]
+
+
+def test_misses_are_read_once_per_call():
+    db = FakeDB({'a': {'name': 'A'}, 'b': {'name': 'B'}})
+    cache = ReferenceCache(db)
+
+    result = cache.get_many('Customer', ['b', 'a', 'b', '', 'c', 'a'])
+    assert result == {'a': {'name': 'A'}, 'b': {'name': 'B'}, 'c': None}
+    assert db.requests == [['a', 'b', 'c']]
+
+    assert cache.get('Customer', 'a') == {'name': 'A'}
+    assert len(db.requests) == 1
+
+    cache.invalidate('Customer', 'a')
+    cache.get_many('Customer', ['a', 'b'])
+    assert db.requests[-1] == ['a']
+
+
+def test_returned_documents_are_copies():
+    cache = ReferenceCache(FakeDB({'a': {'name': 'A'}}))
+    cache.get('Officer', 'a')['name'] = 'changed'
+    assert cache.get('Officer', 'a') == {'name': 'A'}
+
+
+def test_nested_values_are_copied():
+    cache = ReferenceCache(FakeDB({'a': {'name': 'A', 'address': {'city': 'Yangon'}, 'loans': ['L-1']}}))
+    data = cache.get('Customer', 'a')
+    data['address']['city'] = 'changed'
+    data['loans'].append('L-2')
+    assert cache.get('Customer', 'a') == {'name': 'A', 'address': {'city': 'Yangon'}, 'loans': ['L-1']}
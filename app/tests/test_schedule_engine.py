@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.components.effective_rate import effective_rates
+from src.components.rate_card import rate_card
+from src.components.schedule_engine import QUOTE_METHODS, batch_schedule_columns, schedule_columns
+
+AMOUNT_COLUMNS = ['Principal', 'Interest', 'Total', 'Remaining Balance']
+
+
+@pytest.mark.parametrize('method', QUOTE_METHODS)
+def test_batch_matches_single_loan_engine(method):
+    rng = np.random.default_rng(0)
+    principal = rng.integers(10, 5000, 40) * 1000
+    num_payments = rng.integers(1, 60, 40)
+    cycle_days = rng.choice([7, 14, 30], 40)
+    rate = rng.choice([0.0, 0.18, 0.28], 40)
+
+    batch = batch_schedule_columns(principal, num_payments, cycle_days, rate, '2024-01-31', method)
+    starts = np.cumsum(num_payments) - num_payments
+    for i in range(40):
+        single = schedule_columns(method, '2024-01-31', int(principal[i]), int(num_payments[i]), int(cycle_days[i]), float(rate[i]))
+        rows = slice(starts[i], starts[i] + num_payments[i])
+        for name in AMOUNT_COLUMNS + ['Payment Date']:
+            np.testing.assert_array_equal(batch[name][rows], single[name])
+
+
+def test_interest_free_equal_payment_splits_principal():
+    columns = schedule_columns('equal', '2024-01-01', 1_000_000, 10, 30, 0.0)
+    assert columns['Total'].tolist() == [100_000] * 10
+    assert columns['Interest'].sum() == 0
+    assert columns['Remaining Balance'][-1] == 0
+
+    batch = batch_schedule_columns([1_000_000, 1_050_000], [10, 7], 30, 0.0, '2024-01-01', 'equal')
+    for name in AMOUNT_COLUMNS:
+        assert batch[name].min() >= 0
+    np.testing.assert_array_equal(batch['Total'][:10], columns['Total'])
+
+
+def test_rate_card_and_effective_rate_at_zero_interest():
+    card = rate_card([1_000_000], [12], [30], [0.0, 0.28])
+    assert card['total_payment'].min() >= 1_000_000
+    assert card['total_interest'][card['annual_interest_rate'] == 0].tolist() == [0, 0, 0]
+
+    rates = effective_rates([1_000_000], [10], [30], [0.0], 'equal')
+    assert np.isfinite(rates['effective_annual_rate']).all()
+    assert abs(rates['effective_annual_rate'][0]) < 1e-9
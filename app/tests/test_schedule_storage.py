@@ -0,0 +1,126 @@
+import pytest
+
+from src.components.schedule_storage import (
+    compact_schedule_fields, expand_schedule, load_loan, regenerate_schedule, reregistered_schedule,
+    reregistration_update, schedule_fingerprint, schedule_params,
+)
+
+# 엔진 버전 1 의 고정 결과 (생성 조건만 저장된 대출은 이 값으로 다시 만들어지므로 바뀌면 안 됨)
+# (상환일, 원금, 이자, 합계, 잔액)
+GOLDEN_V1 = {
+    ('equal', 0.28): [
+        ('2024-03-01', 157300, 23100, 180400, 902000),
+        ('2024-03-31', 161000, 19400, 180400, 721600),
+        ('2024-04-30', 164700, 15700, 180400, 541200),
+        ('2024-05-30', 168500, 11900, 180400, 360800),
+        ('2024-06-29', 172300, 8100, 180400, 180400),
+        ('2024-07-29', 176300, 4100, 180400, 0),
+    ],
+    ('equal_principal', 0.28): [
+        ('2024-03-01', 166700, 23100, 189800, 833300),
+        ('2024-03-31', 166700, 19200, 185900, 666600),
+        ('2024-04-30', 166700, 15400, 182100, 499900),
+        ('2024-05-30', 166700, 11600, 178300, 333200),
+        ('2024-06-29', 166700, 7700, 174400, 166500),
+        ('2024-07-29', 166500, 3900, 170400, 0),
+    ],
+    ('bullet', 0.28): [
+        ('2024-03-01', 0, 23400, 23400, 1000000),
+        ('2024-03-31', 0, 23400, 23400, 1000000),
+        ('2024-04-30', 0, 23400, 23400, 1000000),
+        ('2024-05-30', 0, 23400, 23400, 1000000),
+        ('2024-06-29', 0, 23400, 23400, 1000000),
+        ('2024-07-29', 1000000, 23400, 1023400, 0),
+    ],
+    ('equal', 0.0): [
+        ('2024-03-01', 166700, 0, 166700, 833500),
+        ('2024-03-31', 166700, 0, 166700, 666800),
+        ('2024-04-30', 166700, 0, 166700, 500100),
+        ('2024-05-30', 166700, 0, 166700, 333400),
+        ('2024-06-29', 166700, 0, 166700, 166700),
+        ('2024-07-29', 166700, 0, 166700, 0),
+    ],
+}
+
+
+@pytest.mark.parametrize('method, rate', list(GOLDEN_V1))
+def test_v1_regenerates_golden_schedule(method, rate):
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, rate, method)
+    rows = regenerate_schedule(params, 1)
+    assert [
+        (row['Payment Date'], row['Principal'], row['Interest'], row['Total'], row['Remaining Balance']) for row in rows
+    ] == GOLDEN_V1[method, rate]
+    assert [row['Period'] for row in rows] == list(range(1, 7))
+    assert all(row['status'] == 0 for row in rows)
+
+
+def test_fingerprint_is_stable():
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, 0.28, 'Equal')
+    assert schedule_fingerprint(params, 1) == '5c8e8b38ab2c7e5c4ed776f8039d2296f2cdd743f193e5880a086af6259a4d08'
+
+
+def stored(params, loan_schedule):
+    # Firestore 에 저장되는 필드만 남긴 문서
+    return dict(compact_schedule_fields(params, loan_schedule))
+
+
+def test_unchanged_schedule_round_trips_without_overrides():
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, 0.28, 'equal')
+    loan_schedule = regenerate_schedule(params)
+    fields = stored(params, loan_schedule)
+    assert fields['schedule_status'] == {} and fields['schedule_overrides'] == {}
+    assert expand_schedule(fields) == loan_schedule
+
+
+def test_statuses_overrides_and_length_round_trip():
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, 0.28, 'equal_principal')
+    loan_schedule = regenerate_schedule(params)
+    loan_schedule[0]['status'] = 1
+    loan_schedule[1]['status'] = 2
+    loan_schedule[3].update({'Interest': 12000, 'Total': 178700})
+    loan_schedule.append({
+        'Period': 7, 'Payment Date': '2024-08-28', 'Principal': 100, 'Interest': 0,
+        'Total': 100, 'Remaining Balance': 0, 'status': 0,
+    })
+
+    fields = stored(params, loan_schedule)
+    assert fields['schedule_status'] == {'1': 1, '2': 2}
+    assert fields['schedule_overrides']['4'] == {'Interest': 12000, 'Total': 178700}
+    assert fields['schedule_length'] == 7
+    assert expand_schedule(fields) == loan_schedule
+
+    shortened = stored(params, loan_schedule[:4])
+    assert expand_schedule(shortened) == loan_schedule[:4]
+
+
+def test_load_loan_keeps_legacy_documents():
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, 0.28, 'bullet')
+    legacy = {'loan_schedule': regenerate_schedule(params)}
+    assert load_loan(dict(legacy)) == legacy
+    assert load_loan(stored(params, legacy['loan_schedule']))['loan_schedule'] == legacy['loan_schedule']
+
+
+def test_reregistration_refuses_to_drop_paid_installments():
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, 0.28, 'equal')
+    loan_schedule = regenerate_schedule(params)
+    for row in loan_schedule[:5]:
+        row['status'] = 1
+    existing = stored(params, loan_schedule)
+
+    shorter = schedule_params('2024-01-31', 1_000_000, 4, 30, 0.28, 'equal')
+    with pytest.raises(ValueError):
+        reregistration_update(existing, shorter, regenerate_schedule(shorter))
+    with pytest.raises(ValueError):
+        reregistered_schedule(existing, shorter, regenerate_schedule(shorter))
+
+
+def test_reregistration_keeps_paid_rows_and_drops_unpaid_tail():
+    params = schedule_params('2024-01-31', 1_000_000, 6, 30, 0.28, 'equal')
+    loan_schedule = regenerate_schedule(params)
+    loan_schedule[0]['status'] = 1
+    existing = stored(params, loan_schedule)
+
+    shorter = schedule_params('2024-01-31', 1_000_000, 4, 30, 0.28, 'equal')
+    merged = reregistered_schedule(existing, shorter, regenerate_schedule(shorter))
+    assert len(merged) == 4
+    assert merged[0] == loan_schedule[0]
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from src.components.schedule_engine import QUOTE_METHODS, schedule_columns
+from src.components.solver import PRINCIPAL_STEP, installment, max_principal, min_num_payments
+
+RATES = [0.0, 0.18, 0.28]
+
+
+@pytest.mark.parametrize('method', QUOTE_METHODS)
+@pytest.mark.parametrize('rate', RATES)
+def test_installment_matches_first_scheduled_payment(method, rate):
+    for principal, num_payments, cycle_days in [(1_000_000, 10, 30), (1_234_500, 26, 14), (50_000_000, 1200, 7)]:
+        columns = schedule_columns(method, '2024-01-01', principal, num_payments, cycle_days, rate)
+        expected = columns['Interest'][0] if method == 'bullet' else columns['Total'][0]
+        assert installment(principal, num_payments, cycle_days, rate, method) == expected
+
+
+@pytest.mark.parametrize('method', ['equal', 'equal_principal'])
+@pytest.mark.parametrize('rate', RATES)
+def test_max_principal_is_largest_affordable(method, rate):
+    target = np.array([100_000, 250_000, 1_000_000])
+    principal = max_principal(target, 12, 30, rate, method)
+    assert (principal > 0).all()
+    assert (installment(principal, 12, 30, rate, method) <= target).all()
+    assert (installment(principal + PRINCIPAL_STEP, 12, 30, rate, method) > target).all()
+
+
+@pytest.mark.parametrize('method', ['equal', 'equal_principal'])
+@pytest.mark.parametrize('rate', RATES)
+def test_min_num_payments_is_smallest_affordable(method, rate):
+    principal = np.array([1_000_000, 3_333_300, 4_000_000])
+    num_payments = min_num_payments(100_000, principal, 30, rate, method)
+    assert (num_payments > 0).all()
+    assert (installment(principal, num_payments, 30, rate, method) <= 100_000).all()
+    smaller = np.maximum(num_payments - 1, 1)
+    assert ((num_payments == 1) | (installment(principal, smaller, 30, rate, method) > 100_000)).all()
+
+
+def test_interest_free_solutions():
+    assert installment(1_000_000, 10, 30, 0.0) == 100_000
+    assert max_principal(100_000, 10, 30, 0.0) == 1_000_000
+    assert min_num_payments(100_000, 1_000_000, 30, 0.0) == 10
+    assert min_num_payments(100_000, 1_000_000, 30, 0.0, 'bullet') == 1
+
+
+def test_interest_free_bullet_has_no_maximum_principal():
+    with pytest.raises(ValueError):
+        max_principal(100_000, 10, 30, 0.0, 'bullet')